@@ -0,0 +1,233 @@
+"""
+소스별 추가 전용(append-only) NDJSON 기사 로그
+기사 한 개가 한 줄이며, 옆에 두는 작은 색인 파일(날짜 -> 바이트 위치)을 mmap으로 읽어
+최신 N개나 기간 조회 시 필요한 줄만 바로 읽는다
+"""
+
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from article_store import article_digest
+from file_io import atomic_write
+import serializer
+from scrapers.dates import epoch_day
+
+# 색인 헤더: 매직, 커밋된 로그 길이
+HEADER = struct.Struct('<4sQ')
+MAGIC = b'NDX1'
+
+# 색인 레코드: -epoch_day, url 해시, 내용 해시, 로그 내 위치, 길이
+# 첫 필드 오름차순 = 최신순 (날짜 없는 기사는 맨 뒤)
+RECORD = struct.Struct('<qQQQI')
+DAY = struct.Struct('<q')
+
+NO_DAY = -(2 ** 62)
+
+
+def _url_hash(url: str) -> int:
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def _article_day(article: Dict) -> int:
+    day = article.get('epoch_day')
+    if not isinstance(day, int):
+        day = epoch_day(article.get('date') or '')
+    return NO_DAY if day is None else day
+
+
+class ArticleLog:
+    """
+    한 소스의 기사 로그
+
+    `<name>.ndjson`에는 기사를 덧붙이기만 하고, `<name>.idx`에는 URL마다 최신
+    버전의 위치를 최신순으로 정렬해 둔다. 추가는 로그 fsync 후 색인을 임시
+    파일로 써서 교체하는 순서라, 중간에 멈추면 색인에 커밋되지 않은 로그
+    꼬리는 다음에 열 때 잘라낸다.
+    """
+
+    def __init__(self, directory, name: str):
+        self.directory = Path(directory)
+        self.log_file = self.directory / f"{name}.ndjson"
+        self.index_file = self.directory / f"{name}.idx"
+
+    def exists(self) -> bool:
+        return self.index_file.exists()
+
+    # 색인
+
+    @contextmanager
+    def _index(self) -> Iterator[Optional[mmap.mmap]]:
+        """색인 파일의 mmap (없으면 None)"""
+        if not self.index_file.exists():
+            yield None
+            return
+        with open(self.index_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index:
+            magic, _ = HEADER.unpack_from(index)
+            if magic != MAGIC:
+                raise ValueError(f"{self.index_file} is not an article log index")
+            yield index
+
+    def _load_records(self) -> Tuple[Dict[int, tuple], int]:
+        """
+        쓰기용 색인 로드: url 해시 -> 레코드, 커밋된 로그 길이
+
+        색인에 반영되지 않은 로그 꼬리(중단된 추가)는 잘라내고, 색인이
+        없으면 로그를 훑어 다시 만든다.
+        """
+        if not self.index_file.exists():
+            return self._rebuild()
+
+        with self._index() as index:
+            _, committed = HEADER.unpack_from(index)
+            records = {record[1]: record for record in RECORD.iter_unpack(index[HEADER.size:])}
+        if self.log_file.exists() and self.log_file.stat().st_size > committed:
+            with open(self.log_file, 'r+b') as f:
+                f.truncate(committed)
+        return records, committed
+
+    def _rebuild(self) -> Tuple[Dict[int, tuple], int]:
+        """로그 전체를 읽어 색인 레코드 복원 (마지막 온전한 줄까지)"""
+        records = {}
+        committed = 0
+        if not self.log_file.exists():
+            return records, committed
+
+        with open(self.log_file, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    article = serializer.loads(line)
+                except ValueError:
+                    break
+                key = _url_hash(article.get('url', ''))
+                digest = int(article_digest(article)[:16], 16)
+                records[key] = (-_article_day(article), key, digest, committed, len(line))
+                committed += len(line)
+
+        with open(self.log_file, 'r+b') as f:
+            f.truncate(committed)
+        return records, committed
+
+    def _write_index(self, records: Iterable[tuple], committed: int):
+        """색인을 임시 파일에 쓰고 원자적으로 교체"""
+        atomic_write(
+            self.index_file,
+            HEADER.pack(MAGIC, committed) + b''.join(RECORD.pack(*record) for record in records)
+        )
+
+    # 쓰기
+
+    def append(self, articles: Iterable[Dict]) -> bool:
+        """
+        새 기사와 내용이 바뀐 기사를 로그에 추가
+
+        처음 수집된 시각(collected_at)은 유지한다.
+
+        Returns:
+            추가된 기사가 있으면 True
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        rebuilt = not self.index_file.exists()
+        records, committed = self._load_records()
+
+        lines = []
+        offset = committed
+        with open(self.log_file, 'ab+') as log:
+            for article in articles:
+                url = article.get('url')
+                if not url:
+                    continue
+                key = _url_hash(url)
+                digest = int(article_digest(article)[:16], 16)
+                previous = records.get(key)
+                if previous is not None:
+                    if previous[2] == digest:
+                        continue
+                    log.seek(previous[3])
+                    collected_at = serializer.loads(log.read(previous[4])).get('collected_at')
+                    if collected_at:
+                        article = {**article, 'collected_at': collected_at}
+
+                line = serializer.dumps(article, pretty=False) + b'\n'
+                records[key] = (-_article_day(article), key, digest, offset, len(line))
+                lines.append(line)
+                offset += len(line)
+
+            if not lines:
+                if rebuilt and records:
+                    self._write_index(sorted(records.values(), key=lambda r: (r[0], r[3])), committed)
+                return False
+            # 로그를 먼저 디스크에 남기고, 그다음 색인을 커밋
+            log.write(b''.join(lines))
+            log.flush()
+            os.fsync(log.fileno())
+
+        self._write_index(sorted(records.values(), key=lambda r: (r[0], r[3])), offset)
+        return True
+
+    # 읽기
+
+    def _read(self, index: Optional[mmap.mmap], start: int, stop: Optional[int]) -> List[Dict]:
+        """색인의 [start, stop) 레코드에 해당하는 기사 (최신순)"""
+        if index is None:
+            return []
+        count = (len(index) - HEADER.size) // RECORD.size
+        stop = count if stop is None else min(stop, count)
+        if start >= stop:
+            return []
+
+        articles = []
+        with open(self.log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+            for i in range(start, stop):
+                _, _, _, offset, length = RECORD.unpack_from(index, HEADER.size + i * RECORD.size)
+                articles.append(serializer.loads(log[offset:offset + length]))
+        return articles
+
+    def latest(self, limit: Optional[int] = None) -> List[Dict]:
+        """최신 기사 N개 (limit이 없으면 전체)"""
+        with self._index() as index:
+            return self._read(index, 0, limit)
+
+    def between(self, start_date: str, end_date: str) -> List[Dict]:
+        """start_date ~ end_date(포함) 사이 날짜의 기사 (최신순)"""
+        first, last = epoch_day(start_date), epoch_day(end_date)
+        if first is None or last is None:
+            return []
+        with self._index() as index:
+            if index is None:
+                return []
+            days = _DayKeys(index)
+            # 레코드는 -day 오름차순
+            return self._read(index, bisect.bisect_left(days, -last), bisect.bisect_right(days, -first))
+
+    def summary(self, preview_count: int) -> Dict:
+        """기사 수, 날짜가 있는 기사 수, 최신 기사 미리보기 (로그는 미리보기만 읽음)"""
+        with self._index() as index:
+            days = _DayKeys(index)
+            preview = self._read(index, 0, preview_count)
+            return {
+                'count': len(days),
+                'with_dates': bisect.bisect_left(days, -NO_DAY),
+                'latest_date': preview[0].get('date', 'N/A') if preview else 'N/A',
+                'preview': preview,
+            }
+
+
+class _DayKeys:
+    """색인 레코드의 첫 필드(-day)를 시퀀스처럼 보여 주는 뷰 (bisect용)"""
+
+    def __init__(self, index: Optional[mmap.mmap]):
+        self.index = index
+
+    def __len__(self) -> int:
+        return 0 if self.index is None else (len(self.index) - HEADER.size) // RECORD.size
+
+    def __getitem__(self, i: int) -> int:
+        return DAY.unpack_from(self.index, HEADER.size + i * RECORD.size)[0]
@@ -0,0 +1,160 @@
+"""
+SQLite 기사 저장소
+실행마다 새로 수집된 기사만 추가/갱신하고, 소스별 JSON과 index.json은 이 저장소에서 내보낸다
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import serializer
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    date TEXT NOT NULL DEFAULT '',
+    collected_at TEXT NOT NULL DEFAULT '',
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS articles_url ON articles (url);
+CREATE INDEX IF NOT EXISTS articles_source_date ON articles (source, date);
+"""
+
+# 최신순: 날짜, 같은 날짜는 수집 시각, 그다음 저장 순서 (날짜 없는 기사는 맨 뒤)
+ORDER = "ORDER BY date IN ('', 'N/A'), date DESC, collected_at DESC, id"
+
+# 수집 시각은 실행마다 바뀌므로 변경 여부 판단에서 제외
+VOLATILE_FIELDS = ('collected_at',)
+
+# SQLite 변수 개수 제한 안쪽으로 IN (...) 조회를 나눈다
+BATCH = 500
+
+
+def article_digest(article: Dict) -> str:
+    """기사 내용 해시 (수집 시각 제외, 저장된 값과 비교하므로 표준 json으로 고정)"""
+    content = {k: v for k, v in article.items() if k not in VOLATILE_FIELDS}
+    encoded = json.dumps(content, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class ArticleStore:
+    """URL을 키로 하는 기사 저장소"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def is_empty(self) -> bool:
+        return self.conn.execute("SELECT 1 FROM articles LIMIT 1").fetchone() is None
+
+    def upsert(self, articles: Iterable[Dict]) -> Set[str]:
+        """
+        새 기사와 내용이 바뀐 기사만 저장
+
+        처음 수집된 시각(collected_at)은 유지한다.
+
+        Returns:
+            변경된 기사가 있는 소스 이름 (기사가 다른 소스로 옮겨간 경우 이전 소스 포함)
+        """
+        incoming = {}
+        for article in articles:
+            url = article.get('url')
+            if url:
+                incoming[url] = article
+
+        existing = {}
+        urls = list(incoming)
+        for start in range(0, len(urls), BATCH):
+            batch = urls[start:start + BATCH]
+            rows = self.conn.execute(
+                f"SELECT url, source, digest, collected_at FROM articles "
+                f"WHERE url IN ({','.join('?' * len(batch))})",
+                batch
+            )
+            for url, source, digest, collected_at in rows:
+                existing[url] = (source, digest, collected_at)
+
+        rows = []
+        changed = set()
+        for url, article in incoming.items():
+            digest = article_digest(article)
+            source = article.get('source', 'Unknown')
+            previous = existing.get(url)
+            if previous is not None:
+                previous_source, previous_digest, collected_at = previous
+                if previous_digest == digest:
+                    continue
+                changed.add(previous_source)
+                if collected_at:
+                    article = {**article, 'collected_at': collected_at}
+            changed.add(source)
+            rows.append((
+                url, source, article.get('date') or '', article.get('collected_at') or '',
+                digest, serializer.dumps(article, pretty=False).decode('utf-8')
+            ))
+
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO articles (url, source, date, collected_at, digest, data)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    source = excluded.source,
+                    date = excluded.date,
+                    collected_at = excluded.collected_at,
+                    digest = excluded.digest,
+                    data = excluded.data
+                """,
+                rows
+            )
+        return changed
+
+    def source_articles(self, source: str, limit: Optional[int] = None) -> List[Dict]:
+        """소스의 기사 (최신순)"""
+        query = f"SELECT data FROM articles WHERE source = ? {ORDER}"
+        params = [source]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [serializer.loads(data) for (data,) in self.conn.execute(query, params)]
+
+    def has_source(self, source: str) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM articles WHERE source = ? LIMIT 1", (source,)
+        ).fetchone() is not None
+
+    def source_summaries(self, preview_count: int) -> Dict[str, Dict]:
+        """
+        소스별 요약: 기사 수, 날짜가 있는 기사 수, 최신 날짜, 최신 기사 미리보기
+
+        index.json / stats.json 생성용으로 소스 전체 기사를 읽지 않는다.
+        """
+        summaries = {}
+        rows = self.conn.execute(
+            "SELECT source, COUNT(*), SUM(date != '' AND date != 'N/A') FROM articles GROUP BY source"
+        )
+        for source, count, with_dates in rows:
+            preview = self.source_articles(source, preview_count)
+            summaries[source] = {
+                'count': count,
+                'with_dates': with_dates or 0,
+                'latest_date': preview[0].get('date', 'N/A') if preview else 'N/A',
+                'preview': preview,
+            }
+        return summaries
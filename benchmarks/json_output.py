@@ -0,0 +1,99 @@
+"""
+JSON output benchmark
+Writes a legacy news.json-style document of 100k+ articles (built from the
+articles in data/sources with unique URLs) the way save_to_json used to
+(json.dump with indent=2) and through the serializer's streaming writer with
+each backend, compact and pretty, and checks that the outputs parse back to
+the same data. Peak memory is traced in a separate pass.
+
+Usage:
+    python benchmarks/json_output.py
+    python benchmarks/json_output.py --sources DIR --articles 200000 --repeat 5
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import serializer  # noqa: E402
+from file_io import atomic_write  # noqa: E402
+
+
+def load_articles(sources_dir: Path, count: int):
+    """`count` articles cycled from every published source file, with unique URLs"""
+    seed = []
+    for path in sorted(sources_dir.glob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            seed.extend(json.load(f).get('articles', []))
+    return [
+        {**seed[i % len(seed)], 'url': f"{seed[i % len(seed)]['url']}#{i}"}
+        for i in range(count)
+    ]
+
+
+def legacy_write(path: Path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def stream_write(path: Path, data):
+    atomic_write(path, serializer.iter_document(data))
+
+
+def measure(write, path: Path, data, repeat: int):
+    """Median seconds per write and peak traced MB of one more write"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        write(path, data)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    write(path, data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sources', type=Path, default=Path('data/sources'))
+    parser.add_argument('--articles', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    articles = load_articles(args.sources, args.articles)
+    data = {'updated_at': time.strftime('%Y-%m-%d %H:%M:%S'), 'total_articles': len(articles), 'articles': articles}
+
+    variants = [('legacy json.dump indent=2', None, legacy_write)]
+    backends = ['json'] + (['orjson'] if serializer.ORJSON_AVAILABLE else [])
+    for backend in backends:
+        for pretty in (True, False):
+            settings = {'json_backend': backend, 'pretty_json': pretty}
+            name = f"stream {backend} {'pretty' if pretty else 'compact'}"
+            variants.append((name, settings, stream_write))
+
+    print(f"{len(articles)} articles from {args.sources}")
+    print(f"{'writer':<28}{'MB':>7}{'seconds':>9}{'speedup':>9}{'peak MB':>9}  same")
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = None
+        for name, settings, write in variants:
+            if settings is not None:
+                serializer.configure_serializer(settings)
+            path = Path(tmp) / 'news.json'
+            seconds, peak = measure(write, path, data, args.repeat)
+            baseline = baseline or seconds
+            size = path.stat().st_size / 2 ** 20
+            with open(path, 'rb') as f:
+                same = json.load(f) == data
+            print(f"{name:<28}{size:>7.1f}{seconds:>9.2f}{baseline / seconds:>8.1f}x{peak:>9.1f}  {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Synthetic benchmark fixtures
+Writes benchmarks/fixtures/<scraper>.html: minimal listing pages in the
+markup each HTML scraper's parse() reads, filled with the articles
+published in data/sources. They are not recordings of the live sites and
+carry none of their scripts, styles or navigation, so parser_backends.py
+on them checks that every backend extracts the same articles offline, but
+its timings say little about the live pages (use --live for those).
+Rerun after changing a scraper's markup.
+
+Usage:
+    python benchmarks/make_fixtures.py
+"""
+import html
+import json
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlparse
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+
+
+def load(source_file: str):
+    with open(ROOT / 'data' / 'sources' / source_file, 'r', encoding='utf-8') as f:
+        return json.load(f)['articles']
+
+
+def path_of(url: str) -> str:
+    return urlparse(url).path
+
+
+def day(article, style: str) -> str:
+    parsed = date.fromisoformat(article['date'])
+    if style == 'day-month':
+        return f"{parsed.day} {parsed.strftime('%B %Y')}"
+    return f"{parsed.strftime('%b')} {parsed.day}, {parsed.year}"
+
+
+def page(title: str, body: str) -> str:
+    """A bare listing page around `body`, marked as generated"""
+    return (
+        f'<!DOCTYPE html>\n<!-- Synthetic fixture generated by benchmarks/make_fixtures.py -->\n'
+        f'<html lang="en"><head><meta charset="utf-8"><title>{html.escape(title)}</title></head>\n'
+        f'<body><main>\n{body}\n</main></body></html>\n'
+    )
+
+
+def anthropic():
+    cards = []
+    for a in load('anthropic.json'):
+        category = a['categories'][0] if a['categories'] else 'Announcements'
+        cards.append(
+            f'<a href="{path_of(a["url"])}" class="card">'
+            f'<span class="category">{html.escape(category)}</span>'
+            f'<h3 class="title">{html.escape(a["title"])}</h3>'
+            f'<div class="meta"><time>{day(a, "month-day")}</time></div></a>'
+        )
+    return page('Newsroom', '<section class="grid">' + '\n'.join(cards) + '</section>')
+
+
+def meta():
+    cards = []
+    for a in load('meta-ai.json'):
+        cards.append(
+            f'<div class="blog-card"><div class="image"><img src="/img.jpg" alt=""></div>'
+            f'<div class="text"><a href="{path_of(a["url"])}">{html.escape(a["title"])}</a></div>'
+            f'<div class="date"><span>{day(a, "month-day")}</span></div></div>'
+        )
+    return page('AI at Meta Blog', '<div class="blog-grid">' + '\n'.join(cards) + '</div>')
+
+
+def deepmind():
+    rows = []
+    for a in load('google-deepmind.json'):
+        rows.append(
+            f'<li class="list-item"><a href="{path_of(a["url"])}">'
+            f'<span class="date">{day(a, "day-month")}</span>'
+            f'<span class="title">{html.escape(a["title"])}</span></a></li>'
+        )
+    return page('Publications', '<ul class="publications">' + '\n'.join(rows) + '</ul>')
+
+
+def deepseek():
+    rows = []
+    for a in load('deepseek.json'):
+        rows.append(
+            f'<li class="menu__list-item"><a class="menu__link" href="{path_of(a["url"])}">'
+            f'{html.escape(a["title"])}</a></li>'
+        )
+    return page('DeepSeek API Docs', '<nav class="menu"><ul>' + '\n'.join(rows) + '</ul></nav>')
+
+
+BUILDERS = {
+    'anthropic': anthropic,
+    'meta': meta,
+    'deepmind': deepmind,
+    'deepseek': deepseek,
+}
+
+
+def main():
+    FIXTURES.mkdir(exist_ok=True)
+    for name, build in BUILDERS.items():
+        path = FIXTURES / f'{name}.html'
+        path.write_text(build(), encoding='utf-8')
+        print(f"{path.relative_to(ROOT)}: {path.stat().st_size // 1024} KB")
+
+
+if __name__ == '__main__':
+    main()
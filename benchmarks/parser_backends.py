@@ -0,0 +1,106 @@
+"""
+Parser backend benchmark
+Times `parse()` for every HTML scraper in config.yaml with the previous
+behavior (full html.parser tree) against each installed backend, with and
+without the scraper's PARSE_ONLY strainer, and checks that the extracted
+articles are unchanged.
+
+By default the pages are the synthetic fixtures in benchmarks/fixtures (see
+make_fixtures.py): they hold only the article markup, so an offline run
+checks that the extracted articles agree but its timings, strainer ones in
+particular, are not representative. --live downloads the current listing
+pages for real numbers.
+
+Usage:
+    python benchmarks/parser_backends.py                # synthetic fixtures
+    python benchmarks/parser_backends.py --pages DIR    # use DIR/<scraper>.html
+    python benchmarks/parser_backends.py --live         # download listing pages
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import NewsAggregator  # noqa: E402
+from scrapers.html_scraper import HTMLScraper  # noqa: E402
+
+BACKENDS = ['html.parser', 'lxml', 'html5lib']
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+
+
+def load_pages(aggregator: NewsAggregator, pages_dir: Path = None):
+    """Yield (scraper, page bytes) for each HTML scraper that parses a DOM"""
+    for source in aggregator.sources:
+        scraper = aggregator._build_scraper(source)
+        if not isinstance(scraper, HTMLScraper) or 'scraper' not in source:
+            continue
+        # Parse whole listings, not just the URLs missing from .cache/seen_urls
+        scraper.seen = None
+        if type(scraper).parse_content is not HTMLScraper.parse_content:
+            continue  # not an HTML listing (e.g. the DeepSeek sitemap)
+
+        if pages_dir:
+            path = pages_dir / f"{source['scraper']}.html"
+            if not path.exists():
+                continue
+            content = path.read_bytes()
+        else:
+            try:
+                content = scraper.fetch_content()
+            except Exception as e:
+                print(f"skip {source['name']}: {e}")
+                continue
+        yield scraper, content
+
+
+def time_parse(scraper: HTMLScraper, content: bytes, backend: str, strain: bool, repeat: int):
+    """Median milliseconds to build the tree and extract articles"""
+    parse_only = scraper.PARSE_ONLY if strain else None
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        articles = scraper.parse(BeautifulSoup(content, backend, parse_only=parse_only))
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), articles
+
+
+def strip_volatile(articles):
+    return [{k: v for k, v in a.items() if k != 'collected_at'} for a in articles]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--config', default='config.yaml')
+    parser.add_argument('--pages', type=Path, default=FIXTURES, help='directory of saved listing pages')
+    parser.add_argument('--live', action='store_true', help='download the listing pages instead')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    aggregator = NewsAggregator(args.config)
+    backends = [b for b in BACKENDS if builder_registry.lookup(b)]
+
+    print(f"{'source':<22}{'KB':>6}  {'backend':<12}{'strainer':<10}{'ms':>9}{'speedup':>9}  same")
+    for scraper, content in load_pages(aggregator, None if args.live else args.pages):
+        baseline_ms, baseline = time_parse(scraper, content, 'html.parser', False, args.repeat)
+        baseline = strip_volatile(baseline)
+
+        for backend in backends:
+            for strain in (False, True):
+                if strain and (scraper.PARSE_ONLY is None or backend == 'html5lib'):
+                    continue
+                ms, articles = time_parse(scraper, content, backend, strain, args.repeat)
+                same = strip_volatile(articles) == baseline
+                print(
+                    f"{scraper.source_name:<22}{len(content) // 1024:>6}  {backend:<12}"
+                    f"{'yes' if strain else 'no':<10}{ms:>9.2f}{baseline_ms / ms:>8.1f}x  {same}"
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Text cleaning benchmark
+Times the previous strip_html (seven re.sub passes, then truncation)
+against the compiled TextCleaner on the summaries in data/sources, as
+stored and wrapped the way feeds deliver them (markup, entities and a
+WordPress footer), and checks that both produce the same text.
+
+Usage:
+    python benchmarks/text_cleaning.py
+    python benchmarks/text_cleaning.py --sources DIR --repeat 50
+"""
+import argparse
+import html
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.text import DEFAULT_CLEANER  # noqa: E402
+
+
+def legacy_clean(text: str) -> str:
+    """strip_html and the 500 character cut as normalize_article did them"""
+    if not text:
+        return ''
+    text = re.sub(r'<[^>]+>', ' ', text)
+    text = html.unescape(text)
+    text = re.sub(r'\s*Read Article\s*$', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s*Read More\s*$', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s*Continue Reading\s*$', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'The post .* appeared first on .*\.?$', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s+', ' ', text).strip()
+    if len(text) > 500:
+        text = text[:497] + '...'
+    return text
+
+
+def load_corpus(sources_dir: Path):
+    """(summary, title) pairs from every published source file"""
+    corpus = []
+    for path in sorted(sources_dir.glob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            for article in json.load(f).get('articles', []):
+                corpus.append((article.get('summary', ''), article.get('title', '')))
+    return corpus
+
+
+def as_feed_html(summary: str, title: str) -> str:
+    """A summary the way WordPress feeds send it"""
+    body = html.escape(summary).replace('. ', '.</p>\n<p>')
+    return (
+        f'<p>{body}</p>\n<p>The post <a href="https://example.com/post">{html.escape(title)}</a> '
+        f'appeared first on <a href="https://example.com">Example&nbsp;Blog</a>.</p>'
+    )
+
+
+def time_clean(clean, texts, repeat: int):
+    """Median milliseconds to clean every text once"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            clean(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sources', type=Path, default=Path('data/sources'))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.sources)
+    variants = {
+        'stored': [summary for summary, _ in corpus],
+        'feed html': [as_feed_html(summary, title) for summary, title in corpus],
+    }
+
+    print(f"{len(corpus)} summaries from {args.sources}")
+    print(f"{'corpus':<12}{'KB':>6}{'legacy ms':>11}{'cleaner ms':>12}{'speedup':>9}  same")
+    for name, texts in variants.items():
+        size = sum(len(text) for text in texts) // 1024
+        legacy_ms = time_clean(legacy_clean, texts, args.repeat)
+        cleaner_ms = time_clean(DEFAULT_CLEANER.clean, texts, args.repeat)
+        same = all(legacy_clean(text) == DEFAULT_CLEANER.clean(text) for text in texts)
+        print(
+            f"{name:<12}{size:>6}{legacy_ms:>11.2f}{cleaner_ms:>12.2f}"
+            f"{legacy_ms / cleaner_ms:>8.1f}x  {same}"
+        )
+
+
+if __name__ == '__main__':
+    main()
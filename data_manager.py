@@ -3,25 +3,156 @@
 소스별 파일 분할 및 index.json 생성
 """
 
-import json
+import hashlib
 import os
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Iterable, List, Optional, Set
 from pathlib import Path
 
+from article_log import ArticleLog
+from article_store import ArticleStore
+from file_io import atomic_write
+import serializer
+
+# 저장 방식: "json" (실행마다 소스별 파일 재작성), "sqlite" (저장소에 누적 후 내보내기),
+# "ndjson" (소스별 추가 전용 로그에 누적 후 내보내기)
+STORAGES = ('json', 'sqlite', 'ndjson')
+
+_storage = 'json'
+
+# 실행마다 바뀌는 값: 파일 내용이 바뀌었는지 판단할 때 제외
+VOLATILE_KEYS = frozenset({'updated_at', 'collected_at'})
+
+
+def _stable(value):
+    """VOLATILE_KEYS를 (중첩된 곳까지) 뺀 사본"""
+    if isinstance(value, dict):
+        return {k: _stable(v) for k, v in value.items() if k not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_stable(v) for v in value]
+    return value
+
+
+def payload_digest(data) -> str:
+    """저장할 데이터의 내용 해시 (실행 시각 등 VOLATILE_KEYS 제외, 출력 형식 포함)"""
+    digest = hashlib.blake2b(serializer.output_format().encode('ascii'), digest_size=16)
+    digest.update(serializer.dumps(_stable(data), pretty=False, sort_keys=True))
+    return digest.hexdigest()
+
+
+def configure_storage(settings: Dict):
+    """config.yaml의 저장 방식 설정 적용"""
+    global _storage
+    storage = settings.get('storage', 'json')
+    if storage not in STORAGES:
+        raise ValueError(f"Unknown storage {storage!r} (expected one of {', '.join(STORAGES)})")
+    _storage = storage
+
+
+def _newest_first(article: Dict):
+    """reverse=True 정렬 키: 날짜 내림차순, 날짜 없는 기사('', 'N/A')는 맨 뒤"""
+    date = article.get('date') or ''
+    return (date not in ('', 'N/A'), date)
+
 
 class DataManager:
     """데이터 저장 및 인덱스 관리"""
 
-    def __init__(self, base_dir: str = "data"):
+    def __init__(self, base_dir: str = "data", storage: Optional[str] = None):
         self.base_dir = Path(base_dir)
         self.sources_dir = self.base_dir / "sources"
         self.index_file = self.base_dir / "index.json"
         self.stats_file = self.base_dir / "stats.json"
+        self.store_file = self.base_dir / "articles.db"
+        self.log_dir = self.base_dir / "log"
+        # 마지막으로 쓴 파일들의 내용 해시 (바뀌지 않은 파일은 다시 쓰지 않음)
+        self.digests_file = self.base_dir / ".digests.json"
+        self._digests: Optional[Dict[str, Dict]] = None
+        self.storage = storage or _storage
 
         # 디렉토리 생성
         self.sources_dir.mkdir(parents=True, exist_ok=True)
 
+    def _open_store(self) -> ArticleStore:
+        """기사 저장소 열기 (비어 있으면 기존 소스 파일로 채움)"""
+        store = ArticleStore(self.store_file)
+        if store.is_empty():
+            previous = []
+            for filepath in sorted(self.sources_dir.glob('*.json')):
+                with open(filepath, 'rb') as f:
+                    previous.extend(serializer.loads(f.read()).get('articles', []))
+            if previous:
+                store.upsert(previous)
+                print(f"  [STORE] Imported {len(previous)} articles from {self.sources_dir}")
+        return store
+
+    def _load_digests(self) -> Dict[str, Dict]:
+        if self._digests is None:
+            try:
+                with open(self.digests_file, 'rb') as f:
+                    self._digests = serializer.loads(f.read())
+            except (OSError, ValueError):
+                self._digests = {}
+        return self._digests
+
+    def write_json(self, filepath, data: Dict) -> bool:
+        """
+        JSON 파일을 내용이 바뀐 경우에만 원자적으로 쓰기
+
+        내용 해시(VOLATILE_KEYS 제외)가 마지막으로 쓴 것과 같고 파일 크기도
+        그대로면 건너뛴다 (mtime은 git checkout마다 바뀌므로 보지 않음).
+        쓸 때는 임시 파일에 쓰고 fsync 후 교체하며, articles 리스트는 기사
+        하나씩 직렬화해 흘려 쓴다.
+
+        Returns:
+            파일을 썼으면 True
+        """
+        filepath = Path(filepath)
+        key = os.path.relpath(filepath, self.base_dir)
+        digest = payload_digest(data)
+        digests = self._load_digests()
+
+        previous = digests.get(key)
+        if previous and previous['digest'] == digest and filepath.exists():
+            if filepath.stat().st_size == previous['size']:
+                return False
+
+        size = atomic_write(filepath, serializer.iter_document(data))
+        digests[key] = {'digest': digest, 'size': size, 'format': serializer.output_format()}
+        return True
+
+    def _format_changed(self, source: str) -> bool:
+        """소스 파일이 현재 출력 형식(json_backend, pretty_json)으로 쓰인 적이 없는지"""
+        key = os.path.relpath(self.sources_dir / (self._source_filename(source) + '.json'), self.base_dir)
+        previous = self._load_digests().get(key)
+        return previous is None or previous.get('format') != serializer.output_format()
+
+    def save_digests(self):
+        """write_json이 기록한 내용 해시 저장"""
+        if self._digests is not None:
+            atomic_write(self.digests_file, serializer.dumps(self._digests, sort_keys=True))
+
+    def _source_filename(self, source: str) -> str:
+        """소스 파일 이름 (확장자 제외): 소문자, 공백과 '/'는 하이픈"""
+        return source.lower().replace(' ', '-').replace('/', '-')
+
+    def _log(self, source: str) -> ArticleLog:
+        return ArticleLog(self.log_dir, self._source_filename(source))
+
+    def _open_logs(self):
+        """로그가 하나도 없으면 기존 소스 파일로 채움"""
+        if any(self.log_dir.glob('*.idx')):
+            return
+        imported = 0
+        for filepath in sorted(self.sources_dir.glob('*.json')):
+            with open(filepath, 'rb') as f:
+                data = serializer.loads(f.read())
+            source_articles = data.get('articles', [])
+            if source_articles and self._log(data.get('source', filepath.stem)).append(source_articles):
+                imported += len(source_articles)
+        if imported:
+            print(f"  [LOG] Imported {imported} articles from {self.sources_dir}")
+
     def save_articles(self, articles: List[Dict]):
         """
         기사를 소스별로 분할 저장하고 index.json 생성
@@ -29,6 +160,16 @@ class DataManager:
         Args:
             articles: 전체 기사 리스트
         """
+        if self.storage == 'sqlite':
+            self._save_to_store(articles)
+        elif self.storage == 'ndjson':
+            self._save_to_log(articles)
+        else:
+            self._save_to_files(articles)
+        self.save_digests()
+
+    def _save_to_files(self, articles: List[Dict]):
+        """이번 실행의 기사로 소스별 파일 저장"""
         # 소스별로 그룹화
         articles_by_source = self._group_by_source(articles)
 
@@ -36,14 +177,66 @@ class DataManager:
         for source, source_articles in articles_by_source.items():
             self._save_source_file(source, source_articles)
 
+        summaries = self._summarize(articles_by_source)
+
         # index.json 생성 (최신 글 미리보기)
-        self._create_index(articles_by_source)
+        self._create_index(summaries)
 
         # stats.json 생성 (통계)
-        self._create_stats(articles_by_source)
+        self._create_stats(summaries)
 
         print(f"[OK] Saved articles from {len(articles_by_source)} sources.")
 
+    def _save_to_store(self, articles: List[Dict]):
+        """
+        저장소에 새 기사/변경된 기사만 반영하고, 바뀐 소스의 파일만 다시 내보냄
+
+        이전 실행의 기사도 저장소에 남으므로 소스 파일에는 전체 이력이 담긴다.
+        """
+        with self._open_store() as store:
+            changed = store.upsert(articles)
+            summaries = store.source_summaries(preview_count=10)
+
+            # 소스별 파일 내보내기 (변경된 소스와 출력 형식이 바뀐 소스만)
+            for source in sorted(summaries):
+                if source in changed or self._format_changed(source):
+                    self._save_source_file(source, store.source_articles(source))
+
+        self._create_index(summaries)
+        self._create_stats(summaries)
+
+        print(f"[OK] Stored articles: {len(changed)} of {len(summaries)} sources changed.")
+
+    def _save_to_log(self, articles: List[Dict]):
+        """
+        소스별 로그에 새 기사/변경된 기사만 덧붙이고, 바뀐 소스의 파일만 다시 내보냄
+
+        index.json과 stats.json은 각 로그의 색인과 최신 기사만 읽어 만든다.
+        """
+        self._open_logs()
+
+        changed = []
+        for source, source_articles in self._group_by_source(articles).items():
+            if self._log(source).append(source_articles):
+                changed.append(source)
+
+        summaries = {}
+        for index_file in sorted(self.log_dir.glob('*.idx')):
+            log = ArticleLog(self.log_dir, index_file.stem)
+            summary = log.summary(preview_count=10)
+            if not summary['preview']:
+                continue
+            source = summary['preview'][0].get('source', index_file.stem)
+            summaries[source] = summary
+            # 소스별 파일 내보내기 (변경된 소스와 출력 형식이 바뀐 소스만)
+            if source in changed or self._format_changed(source):
+                self._save_source_file(source, log.latest())
+
+        self._create_index(summaries)
+        self._create_stats(summaries)
+
+        print(f"[OK] Logged articles: {len(changed)} of {len(summaries)} sources changed.")
+
     def _group_by_source(self, articles: List[Dict]) -> Dict[str, List[Dict]]:
         """기사를 소스별로 그룹화"""
         groups = {}
@@ -56,7 +249,7 @@ class DataManager:
         # 각 소스 내에서 날짜순 정렬 (최신순)
         for source in groups:
             groups[source].sort(
-                key=lambda x: x.get('date', '1900-01-01'),
+                key=_newest_first,
                 reverse=True
             )
 
@@ -65,7 +258,7 @@ class DataManager:
     def _save_source_file(self, source: str, articles: List[Dict]):
         """소스별 파일 저장"""
         # 파일명: 소스명을 소문자로 변환하고 공백을 하이픈으로
-        filename = source.lower().replace(' ', '-').replace('/', '-') + '.json'
+        filename = self._source_filename(source) + '.json'
         filepath = self.sources_dir / filename
 
         data = {
@@ -75,109 +268,146 @@ class DataManager:
             'articles': articles
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if self.write_json(filepath, data):
+            print(f"  [FILE] {filename}: {len(articles)} articles")
+
+    def _summarize(self, articles_by_source: Dict[str, List[Dict]], preview_count: int = 10) -> Dict[str, Dict]:
+        """
+        소스별 요약 (index.json, stats.json 생성용)
 
-        print(f"  [FILE] {filename}: {len(articles)} articles")
+        Args:
+            articles_by_source: 소스별 그룹화된 기사 (최신순)
+            preview_count: 각 소스당 미리보기에 포함할 최신 기사 수
+        """
+        return {
+            source: {
+                'count': len(articles),
+                'with_dates': sum(1 for a in articles if a.get('date') and a['date'] != 'N/A'),
+                'latest_date': articles[0].get('date', 'N/A') if articles else 'N/A',
+                'preview': articles[:preview_count],
+            }
+            for source, articles in articles_by_source.items()
+        }
 
-    def _create_index(self, articles_by_source: Dict[str, List[Dict]], preview_count: int = 10):
+    def _create_index(self, summaries: Dict[str, Dict]):
         """
         index.json 생성 (각 소스의 최신 N개만 포함)
 
         Args:
-            articles_by_source: 소스별 그룹화된 기사
-            preview_count: 각 소스당 포함할 최신 기사 수
+            summaries: 소스별 요약 (_summarize 참고)
         """
         # 각 소스의 최신 N개만 추출
         preview_articles = []
         source_info = []
 
-        for source, articles in articles_by_source.items():
+        for source, summary in summaries.items():
             # 최신 N개만
-            latest_articles = articles[:preview_count]
+            latest_articles = summary['preview']
             preview_articles.extend(latest_articles)
 
             # 소스 정보
-            filename = source.lower().replace(' ', '-').replace('/', '-') + '.json'
+            filename = self._source_filename(source) + '.json'
             source_info.append({
                 'name': source,
                 'file': f'sources/{filename}',
-                'total_articles': len(articles),
-                'latest_date': articles[0].get('date', 'N/A') if articles else 'N/A',
+                'total_articles': summary['count'],
+                'latest_date': summary['latest_date'],
                 'preview_count': len(latest_articles)
             })
 
         # 전체를 날짜순으로 정렬
-        preview_articles.sort(
-            key=lambda x: x.get('date', '1900-01-01'),
-            reverse=True
-        )
+        preview_articles.sort(key=_newest_first, reverse=True)
 
         # 소스 정보도 이름순 정렬
         source_info.sort(key=lambda x: x['name'])
 
         index_data = {
             'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'total_sources': len(articles_by_source),
-            'total_articles': sum(len(arts) for arts in articles_by_source.values()),
+            'total_sources': len(summaries),
+            'total_articles': sum(summary['count'] for summary in summaries.values()),
             'preview_articles': preview_articles,
             'sources': source_info
         }
 
-        with open(self.index_file, 'w', encoding='utf-8') as f:
-            json.dump(index_data, f, ensure_ascii=False, indent=2)
-
-        print(f"  [INDEX] index.json: {len(preview_articles)} preview articles")
+        if self.write_json(self.index_file, index_data):
+            print(f"  [INDEX] index.json: {len(preview_articles)} preview articles")
+        else:
+            print(f"  [INDEX] index.json: unchanged")
 
-    def _create_stats(self, articles_by_source: Dict[str, List[Dict]]):
+    def _create_stats(self, summaries: Dict[str, Dict]):
         """통계 파일 생성"""
-        total_articles = sum(len(arts) for arts in articles_by_source.values())
-        articles_with_dates = sum(
-            1 for arts in articles_by_source.values()
-            for art in arts
-            if art.get('date') and art['date'] != 'N/A'
-        )
+        total_articles = sum(summary['count'] for summary in summaries.values())
+        articles_with_dates = sum(summary['with_dates'] for summary in summaries.values())
 
         stats = {
             'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'total_sources': len(articles_by_source),
+            'total_sources': len(summaries),
             'total_articles': total_articles,
             'articles_with_dates': articles_with_dates,
             'date_extraction_rate': f"{(articles_with_dates / total_articles * 100):.1f}%" if total_articles > 0 else "0%",
             'by_source': {
                 source: {
-                    'count': len(articles),
-                    'with_dates': sum(1 for a in articles if a.get('date') and a['date'] != 'N/A'),
-                    'latest_date': articles[0].get('date', 'N/A') if articles else 'N/A'
+                    'count': summary['count'],
+                    'with_dates': summary['with_dates'],
+                    'latest_date': summary['latest_date']
                 }
-                for source, articles in sorted(articles_by_source.items())
+                for source, summary in sorted(summaries.items())
             }
         }
 
-        with open(self.stats_file, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, ensure_ascii=False, indent=2)
-
-        print(f"  [STATS] stats.json: statistics file created")
-
-    def load_source_articles(self, source: str) -> List[Dict]:
-        """특정 소스의 전체 기사 로드"""
-        filename = source.lower().replace(' ', '-').replace('/', '-') + '.json'
+        if self.write_json(self.stats_file, stats):
+            print(f"  [STATS] stats.json: statistics file created")
+        else:
+            print(f"  [STATS] stats.json: unchanged")
+
+    def load_source_articles(self, source: str, limit: Optional[int] = None) -> List[Dict]:
+        """특정 소스의 전체 기사 로드 (limit: 최신 N개만)"""
+        if self.storage == 'sqlite' and self.store_file.exists():
+            with ArticleStore(self.store_file) as store:
+                if store.has_source(source):
+                    return store.source_articles(source, limit)
+        if self.storage == 'ndjson' and self._log(source).exists():
+            # 색인으로 최신 N개 위치만 찾아 읽음
+            return self._log(source).latest(limit)
+
+        filename = self._source_filename(source) + '.json'
         filepath = self.sources_dir / filename
 
         if not filepath.exists():
             return []
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('articles', [])
+        with open(filepath, 'rb') as f:
+            data = serializer.loads(f.read())
+            return data.get('articles', [])[:limit]
+
+    def has_source_articles(self, source: str) -> bool:
+        """특정 소스의 기사 파일 존재 여부"""
+        return source in self.sources_with_articles([source])
+
+    def sources_with_articles(self, sources: Iterable[str]) -> Set[str]:
+        """기사가 저장되어 있는 소스 이름 (저장소는 한 번만 연다)"""
+        store = ArticleStore(self.store_file) if self.storage == 'sqlite' and self.store_file.exists() else None
+        found = set()
+        try:
+            for source in sources:
+                if store is not None and store.has_source(source):
+                    found.add(source)
+                elif self.storage == 'ndjson' and self._log(source).exists():
+                    found.add(source)
+                elif (self.sources_dir / (self._source_filename(source) + '.json')).exists():
+                    found.add(source)
+        finally:
+            if store is not None:
+                store.close()
+        return found
 
     def load_index(self) -> Dict:
         """index.json 로드"""
         if not self.index_file.exists():
             return {}
 
-        with open(self.index_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(self.index_file, 'rb') as f:
+            return serializer.loads(f.read())
 
     def get_all_sources(self) -> List[str]:
         """모든 소스 목록 반환"""
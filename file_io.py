@@ -0,0 +1,168 @@
+"""
+파일 쓰기 유틸리티
+임시 파일에 쓰고 fsync 후 이름을 바꿔, 읽는 쪽이 반쯤 쓰인 파일이나 디렉토리를 보지 않게 한다
+"""
+
+import ctypes
+import errno
+import filecmp
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Union
+
+
+def fsync_dir(path):
+    """rename 결과를 디스크에 남기기 위해 디렉토리도 fsync"""
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _file_mode(path: Path) -> int:
+    """교체할 파일의 권한 (없으면 open()으로 새로 만들 때와 같은 0o666 & ~umask)"""
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write(path, data: Union[bytes, Iterable[bytes]]) -> int:
+    """
+    같은 디렉토리의 임시 파일에 쓴 뒤 원자적으로 교체
+
+    data는 바이트 또는 바이트 조각의 iterable (조각은 차례로 씀)
+
+    Returns:
+        쓴 바이트 수
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    chunks = [data] if isinstance(data, (bytes, bytearray)) else data
+    size = 0
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=256 * 1024) as f:
+            for chunk in chunks:
+                f.write(chunk)
+                size += len(chunk)
+            f.flush()
+            # mkstemp는 0600으로 만들므로 웹 서버 등 다른 사용자도 읽을 수 있게 맞춘다
+            os.fchmod(f.fileno(), _file_mode(path))
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    fsync_dir(path.parent)
+    return size
+
+
+def same_file(a, b) -> bool:
+    """두 파일 내용이 같은지 (같은 inode, 크기, 바이트 순으로 확인)"""
+    try:
+        stat_a, stat_b = os.stat(a), os.stat(b)
+    except OSError:
+        return False
+    if (stat_a.st_dev, stat_a.st_ino) == (stat_b.st_dev, stat_b.st_ino):
+        return True
+    if stat_a.st_size != stat_b.st_size:
+        return False
+    return filecmp.cmp(a, b, shallow=False)
+
+
+def _link_or_copy(src: Path, dest: Path):
+    """하드링크, 안 되면(다른 파일 시스템 등) 복사"""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+def _renameat2():
+    """libc의 renameat2 (없으면 None)"""
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+
+def _exchange(a: Path, b: Path) -> bool:
+    """
+    두 경로를 한 번에 맞바꿈 (Linux renameat2 RENAME_EXCHANGE)
+
+    커널/파일 시스템이 지원하지 않으면 False, 그 밖의 실패(EXDEV, EACCES 등)는 OSError.
+    """
+    renameat2 = _renameat2()
+    if renameat2 is None:
+        return False
+    AT_FDCWD, RENAME_EXCHANGE = -100, 2
+    ctypes.set_errno(0)
+    if renameat2(AT_FDCWD, os.fsencode(a), AT_FDCWD, os.fsencode(b), RENAME_EXCHANGE) == 0:
+        return True
+    code = ctypes.get_errno()
+    if code in (errno.ENOSYS, errno.EINVAL):
+        return False
+    raise OSError(code, os.strerror(code), str(a), None, str(b))
+
+
+def publish_tree(files: Dict[str, Path], dest) -> int:
+    """
+    `dest` 디렉토리를 files(상대 경로 -> 원본 파일)와 같게 만들기
+
+    바뀐 파일이 없으면 아무것도 쓰지 않는다. 있으면 옆에 새 트리를 만들고
+    (그대로인 파일은 기존 것을, 바뀐 파일은 원본을 하드링크) 디렉토리를
+    통째로 맞바꾸므로, 읽는 쪽은 항상 이전 트리나 새 트리 중 하나를 본다.
+
+    Returns:
+        추가/변경/삭제된 파일 수
+    """
+    dest = Path(dest)
+    existing = {
+        path.relative_to(dest).as_posix()
+        for path in dest.rglob('*') if path.is_file()
+    } if dest.exists() else set()
+
+    changed = [rel for rel, src in files.items() if not same_file(src, dest / rel)]
+    removed = existing - set(files)
+    if not changed and not removed and dest.exists():
+        return 0
+
+    staging = dest.with_name(f".{dest.name}.staging")
+    if staging.exists():
+        shutil.rmtree(staging)
+    changed_set = set(changed)
+    for rel, src in files.items():
+        _link_or_copy(Path(src) if rel in changed_set else dest / rel, staging / rel)
+
+    if dest.exists() and _exchange(staging, dest):
+        shutil.rmtree(staging)
+    else:
+        # 교환을 지원하지 않는 환경: 이름 바꾸기 두 번 (그 사이 아주 짧게 비어 있음)
+        previous = dest.with_name(f".{dest.name}.previous")
+        if previous.exists():
+            shutil.rmtree(previous)
+        if dest.exists():
+            os.rename(dest, previous)
+        os.rename(staging, dest)
+        if previous.exists():
+            shutil.rmtree(previous)
+    fsync_dir(dest.parent)
+    return len(changed) + len(removed)
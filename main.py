@@ -2,15 +2,33 @@
 BigTech AI News Aggregator
 Main script to collect news from various sources
 """
-import json
+import asyncio
 import yaml
 import logging
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
-
+from typing import List, Dict, Optional, Set
+
+from scrapers.base import BaseScraper
+from scrapers.transport import configure_transport, get_transport
+from scrapers.rate_limit import configure_rate_limiter
+from scrapers.health import CircuitBreaker, track_requests, OPEN, HALF_OPEN
+from scrapers.deadline import DeadlineExceeded, check_deadline, deadline
+from scrapers.dates import epoch_day, timestamp_key
+from scrapers.relevance import classifier_from_rules
+from scrapers.cache import configure_cache, save_caches
+from scrapers.http_cache import configure_http_cache, prune_http_cache
+from scrapers.parse_memo import configure_parse_memo
+from scrapers.parse_pool import configure_parse_pool, shutdown_parse_pool
+from scrapers.seen_index import configure_seen_index, load_seen_index, record_published
+from scrapers.html_scraper import configure_html_parser
+from scrapers.browser_pool import configure_browser_pool, shutdown_browser_pool
 from scrapers.rss_scraper import RSScraper
+from scrapers.sitemap_scraper import SitemapScraper
+from scrapers.plan_scraper import PlanScraper
 from scrapers.anthropic_scraper import AnthropicScraper
 from scrapers.meta_scraper import MetaScraper
 from scrapers.deepmind_scraper import DeepMindScraper
@@ -22,8 +40,9 @@ from scrapers.deepseek_scraper import DeepSeekScraper
 from scrapers.deepseek_blog_scraper import DeepSeekBlogScraper
 from scrapers.amazon_science_scraper import AmazonScienceScraper
 from scrapers.ibm_research_scraper import IBMResearchScraper
-from scrapers.baidu_research_scraper import BaiduResearchScraper
-from data_manager import DataManager
+from data_manager import DataManager, configure_storage
+from file_io import publish_tree, same_file
+from serializer import configure_serializer
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,6 +60,28 @@ class NewsAggregator:
 
         self.settings = self.config['settings']
         self.sources = self.config['sources']
+        self.timed_out_sources: List[str] = []
+        # Sources whose scrapers skip already published URLs (set per collection)
+        self.incremental_sources: Set[str] = set()
+
+        # Shared connection pools, timeouts and size caps for all scrapers
+        configure_transport(self.settings)
+        configure_rate_limiter(self.settings, self.sources)
+        configure_cache(self.settings)
+        configure_http_cache(self.settings)
+        configure_parse_memo(self.settings)
+        configure_parse_pool(self.settings)
+        configure_seen_index(self.settings)
+        configure_html_parser(self.settings)
+        configure_browser_pool(self.settings)
+        configure_storage(self.settings)
+        configure_serializer(self.settings)
+
+        # Persisted per-source health: skip sources that keep failing
+        self.breaker = CircuitBreaker(
+            failure_threshold=self.settings.get('breaker_threshold', 3),
+            cooldown=self.settings.get('breaker_cooldown_hours', 6) * 3600,
+        )
 
         # Map scraper types
         self.scraper_map = {
@@ -55,33 +96,217 @@ class NewsAggregator:
             'deepseek_blog': DeepSeekBlogScraper,
             'amazon_science': AmazonScienceScraper,
             'ibm_research': IBMResearchScraper,
-            'baidu_research': BaiduResearchScraper,
         }
 
     def collect_all(self) -> List[Dict]:
-        """Collect articles from all enabled sources"""
-        all_articles = []
-
+        """
+        Collect articles from all enabled sources
+
+        Collection stops when the run's `time_budget` is spent; sources that
+        did not finish in time are listed in `self.timed_out_sources`.
+        """
+        enabled_sources = self._enabled_sources()
+        self.incremental_sources = self._incremental_sources(enabled_sources)
+        run_deadline = self._run_deadline()
+
+        max_workers = self.settings.get('max_workers', 1)
+        if max_workers > 1:
+            results = self._collect_concurrently(enabled_sources, max_workers, run_deadline)
+        else:
+            results = []
+            for source in enabled_sources:
+                if run_deadline is not None and time.monotonic() >= run_deadline:
+                    results.append(None)
+                    continue
+                results.append(self._collect_safely(source, run_deadline))
+        save_caches()
+
+        return self._merge_results(enabled_sources, results)
+
+    def _enabled_sources(self) -> List[Dict]:
+        enabled_sources = []
         for source in self.sources:
             if not source.get('enabled', True):
                 logger.info(f"Skipping disabled source: {source['name']}")
                 continue
+            enabled_sources.append(source)
+        return enabled_sources
+
+    def _run_deadline(self) -> Optional[float]:
+        """Monotonic time at which the collection budget runs out"""
+        budget = self.settings.get('time_budget')
+        return time.monotonic() + budget if budget else None
+
+    def _source_time_limit(self, source: Dict, run_deadline: Optional[float]) -> Optional[float]:
+        """Seconds a source may take: its own timeout, capped by the run budget"""
+        limit = source.get('timeout', self.settings.get('source_timeout'))
+        if run_deadline is not None:
+            left = run_deadline - time.monotonic()
+            limit = left if limit is None else min(limit, left)
+        return limit
+
+    def _merge_results(self, sources: List[Dict], results: List[Optional[List[Dict]]]) -> List[Dict]:
+        """Flatten per-source results, recording sources that ran out of time"""
+        self.timed_out_sources = []
+        all_articles = []
+
+        for source, articles in zip(sources, results):
+            if articles is None:
+                self.timed_out_sources.append(source['name'])
+                continue
+            all_articles.extend(articles)
+
+        if self.timed_out_sources:
+            logger.warning(f"Sources out of time: {', '.join(self.timed_out_sources)}")
+
+        return all_articles
 
+    def _collect_concurrently(
+        self,
+        sources: List[Dict],
+        max_workers: int,
+        run_deadline: Optional[float] = None
+    ) -> List[Optional[List[Dict]]]:
+        """
+        Collect sources on a bounded thread pool
+
+        Politeness is enforced per host by the shared rate limiter, so
+        sources on different hosts never wait on each other. Waiting stops
+        at the run deadline: queued sources are cancelled and running ones
+        give up at their own deadline in the background.
+
+        Returns:
+            Per-source article lists in the same order as `sources`
+            (None for sources that ran out of time)
+        """
+        workers = min(max_workers, len(sources)) or 1
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='collect')
+        futures = [executor.submit(self._collect_safely, source, run_deadline) for source in sources]
+
+        timeout = None if run_deadline is None else max(0.0, run_deadline - time.monotonic())
+        wait(futures, timeout=timeout)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        return [
+            future.result() if future.done() and not future.cancelled() else None
+            for future in futures
+        ]
+
+    def _collect_safely(self, source: Dict, run_deadline: Optional[float] = None) -> Optional[List[Dict]]:
+        """
+        Collect a single source, logging instead of raising on failure
+
+        Returns None if the source ran out of time.
+        """
+        with deadline(self._source_time_limit(source, run_deadline)):
             try:
-                articles = self._collect_from_source(source)
-                all_articles.extend(articles)
+                if not self._source_available(source):
+                    return []
+
+                with track_requests() as outcomes:
+                    articles = self._collect_from_source(source)
+                check_deadline()
+
+                self._record_health(source, outcomes)
                 logger.info(f"Collected {len(articles)} articles from {source['name']}")
+                return articles
+            except DeadlineExceeded:
+                logger.warning(f"{source['name']} ran out of time")
+                return None
             except Exception as e:
+                self.breaker.record_failure(source['name'])
                 logger.error(f"Error collecting from {source['name']}: {e}")
-                continue
+                return []
 
-        return all_articles
+    async def acollect_all(self) -> List[Dict]:
+        """
+        Collect articles from all enabled sources on the running event loop
+
+        Up to `max_workers` sources are in flight at once and results keep
+        the config.yaml order. Sources are cancelled at their deadline.
+        """
+        enabled_sources = self._enabled_sources()
+        self.incremental_sources = self._incremental_sources(enabled_sources)
+        run_deadline = self._run_deadline()
+        semaphore = asyncio.Semaphore(max(1, self.settings.get('max_workers', 1)))
+
+        async def collect(source):
+            async with semaphore:
+                limit = self._source_time_limit(source, run_deadline)
+                if limit is not None and limit <= 0:
+                    return None
+                try:
+                    return await asyncio.wait_for(self._acollect_safely(source, limit), limit)
+                except asyncio.TimeoutError:
+                    logger.warning(f"{source['name']} ran out of time")
+                    return None
+
+        try:
+            results = await asyncio.gather(*(collect(source) for source in enabled_sources))
+        finally:
+            await get_transport().aclose()
+            save_caches()
+
+        return self._merge_results(enabled_sources, results)
+
+    async def _acollect_safely(self, source: Dict, time_limit: Optional[float] = None) -> Optional[List[Dict]]:
+        """Async counterpart of `_collect_safely`"""
+        with deadline(time_limit):
+            try:
+                if not await asyncio.to_thread(self._source_available, source):
+                    return []
+
+                with track_requests() as outcomes:
+                    scraper = self._build_scraper(source)
+                    articles = scraper.filter_relevant(await scraper.afetch()) if scraper else []
+                check_deadline()
+
+                self._record_health(source, outcomes)
+                logger.info(f"Collected {len(articles)} articles from {source['name']}")
+                return articles
+            except DeadlineExceeded:
+                logger.warning(f"{source['name']} ran out of time")
+                return None
+            except Exception as e:
+                self.breaker.record_failure(source['name'])
+                logger.error(f"Error collecting from {source['name']}: {e}")
+                return []
+
+    def _source_available(self, source: Dict) -> bool:
+        """Check the circuit breaker, probing sources whose cooldown expired"""
+        state = self.breaker.state(source['name'])
+        if state == OPEN:
+            logger.warning(f"Skipping {source['name']}: circuit open after repeated failures")
+            return False
+        if state == HALF_OPEN:
+            if not get_transport().probe(source['url'], {'User-Agent': self.settings['user_agent']}):
+                self.breaker.record_failure(source['name'])
+                logger.warning(f"Skipping {source['name']}: still unreachable")
+                return False
+            logger.info(f"{source['name']} is reachable again, collecting")
+        return True
+
+    def _record_health(self, source: Dict, outcomes):
+        """Update the circuit breaker from the requests a source made"""
+        if outcomes.failed:
+            self.breaker.record_failure(source['name'])
+            logger.warning(f"All requests for {source['name']} failed: {outcomes.last_error}")
+        else:
+            self.breaker.record_success(source['name'])
 
     def _collect_from_source(self, source: Dict) -> List[Dict]:
         """Collect articles from a single source"""
+        scraper = self._build_scraper(source)
+        if not scraper:
+            return []
+        return scraper.filter_relevant(scraper.fetch())
+
+    def _build_scraper(self, source: Dict) -> Optional[BaseScraper]:
+        """Create the scraper configured for a source, or None if unknown"""
         source_type = source['type']
         source_name = source['name']
         url = source['url']
+        options = {}
 
         if source_type == 'rss':
             # Check if a custom RSS scraper is specified
@@ -94,31 +319,68 @@ class NewsAggregator:
             else:
                 scraper_class = RSScraper
 
-            scraper = scraper_class(
-                source_name=source_name,
-                url=url,
-                user_agent=self.settings['user_agent'],
-                delay=self.settings['request_delay']
-            )
-            return scraper.fetch()
+        elif source_type == 'html' and 'extract' in source:
+            # Declarative source: the extraction plan lives in config.yaml
+            scraper_class = self.scraper_map.get(source.get('scraper'), PlanScraper)
+            if not issubclass(scraper_class, PlanScraper):
+                logger.error(
+                    f"{source_name}: scraper {source['scraper']} does not take an extraction plan; "
+                    f"remove `extract` or `scraper` from its config"
+                )
+                return None
+            options = {'extract': source['extract']}
 
         elif source_type == 'html':
             scraper_class = self.scraper_map.get(source.get('scraper'))
             if not scraper_class:
                 logger.warning(f"Unknown scraper type: {source.get('scraper')}")
-                return []
+                return None
 
-            scraper = scraper_class(
-                source_name=source_name,
-                url=url,
-                user_agent=self.settings['user_agent'],
-                delay=self.settings['request_delay']
-            )
-            return scraper.fetch()
+        elif source_type == 'sitemap':
+            # Generic sitemap source, optionally with a custom SitemapScraper
+            scraper_class = self.scraper_map.get(source.get('scraper'), SitemapScraper)
+            options = {key: source[key] for key in ('include', 'exclude', 'categories') if key in source}
 
         else:
             logger.warning(f"Unknown source type: {source_type}")
-            return []
+            return None
+
+        scraper = scraper_class(
+            source_name=source_name,
+            url=url,
+            user_agent=self.settings['user_agent'],
+            delay=self.settings['request_delay'],
+            **options
+        )
+        # Per-source summary cleaning rules on top of the scraper's defaults
+        scraper.cleaner = scraper.cleaner.with_rules(source.get('text'))
+        # Opt-in relevance filtering, on top of the scraper's own keywords if any
+        if source.get('relevance'):
+            base = scraper.relevance
+            rules = source['relevance']
+            scraper.relevance = base.with_rules(rules) if base else classifier_from_rules(rules)
+        # Skip articles published before; they are merged back in run()
+        if source_name in self.incremental_sources:
+            scraper.seen = load_seen_index(source_name)
+        return scraper
+
+    def _incremental_sources(self, sources: List[Dict]) -> Set[str]:
+        """Sources that skip known URLs (needs their published articles to merge back)"""
+        if not self.settings.get('seen_index', True):
+            return set()
+        return DataManager().sources_with_articles(source['name'] for source in sources)
+
+    def _previous_articles(self, source_names: List[str]) -> List[Dict]:
+        """Articles published by the previous run for the given sources"""
+        dm = DataManager()
+        # Only the newest max_articles_per_source can survive the per-source limit
+        limit = self.settings.get('max_articles_per_source')
+        articles = []
+        for name in source_names:
+            previous = dm.load_source_articles(name, limit)
+            logger.info(f"Keeping {len(previous)} previously published articles for {name}")
+            articles.extend(previous)
+        return articles
 
     def remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
         """Remove duplicate articles based on URL"""
@@ -136,14 +398,13 @@ class NewsAggregator:
     def sort_articles(self, articles: List[Dict]) -> List[Dict]:
         """Sort articles by date (newest first)"""
         def get_sort_key(article):
-            date_str = article.get('date', '')
-            if date_str:
-                try:
-                    return datetime.strptime(date_str, '%Y-%m-%d')
-                except:
-                    pass
+            day = article.get('epoch_day')
+            if day is None:
+                day = epoch_day(article.get('date', ''))
+            if day is not None:
+                return (day, 0)
             # If no date, use collected_at timestamp
-            return datetime.strptime(article.get('collected_at', '1970-01-01 00:00:00'), '%Y-%m-%d %H:%M:%S')
+            return timestamp_key(article.get('collected_at') or '')
 
         return sorted(articles, key=get_sort_key, reverse=True)
 
@@ -165,42 +426,65 @@ class NewsAggregator:
                 'articles': articles
             }
 
-            with open(old_output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Also saved legacy format to {old_output_path}")
+            if dm.write_json(old_output_path, data):
+                logger.info(f"Also saved legacy format to {old_output_path}")
+            dm.save_digests()
 
-        # Copy data folder to docs/data/ for GitHub Pages
+        # Publish index.json and the sources folder to docs/data/ for GitHub Pages.
+        # Only changed files are linked or copied, and the new tree replaces the
+        # old one in a single directory swap, so the site never sees it half done
         docs_data_path = Path('docs/data')
-        docs_data_path.mkdir(parents=True, exist_ok=True)
-
-        # Copy index.json
-        shutil.copy2('data/index.json', docs_data_path / 'index.json')
-
-        # Copy sources folder
-        docs_sources_path = docs_data_path / 'sources'
-        if docs_sources_path.exists():
-            shutil.rmtree(docs_sources_path)
-        shutil.copytree('data/sources', docs_sources_path)
+        files = {'index.json': Path('data/index.json')}
+        for file in sorted(Path('data/sources').glob('*.json')):
+            files[f'sources/{file.name}'] = file
 
-        logger.info(f"Copied new data structure to {docs_data_path}")
+        updated = publish_tree(files, docs_data_path)
+        if updated:
+            logger.info(f"Published {updated} changed files to {docs_data_path}")
+        else:
+            logger.info(f"{docs_data_path} is up to date")
 
-        # Copy assets folder to docs/assets/ if it exists
+        # Copy changed assets to docs/assets/ if the folder exists
         assets_src = Path('assets')
         assets_dest = Path('docs/assets')
         if assets_src.exists():
             assets_dest.mkdir(parents=True, exist_ok=True)
+            copied = 0
             for file in assets_src.glob('*.svg'):
-                shutil.copy2(file, assets_dest / file.name)
-            logger.info(f"Copied assets to {assets_dest}")
+                if not same_file(file, assets_dest / file.name):
+                    shutil.copy2(file, assets_dest / file.name)
+                    copied += 1
+            if copied:
+                logger.info(f"Copied {copied} assets to {assets_dest}")
 
-    def run(self):
+    def run(self, use_async: bool = None):
         """Main execution method"""
         logger.info("Starting BigTech AI News Aggregator...")
 
-        # Collect articles
-        articles = self.collect_all()
+        if use_async is None:
+            use_async = self.settings.get('use_async', False)
+
+        # Collect articles; the browser and parse workers never outlive collection
+        try:
+            if use_async:
+                articles = asyncio.run(self.acollect_all())
+            else:
+                articles = self.collect_all()
+        finally:
+            shutdown_browser_pool()
+            shutdown_parse_pool()
         logger.info(f"Total articles collected: {len(articles)}")
 
+        # Publish what finished; keep the last published data for the rest.
+        # Sources that skipped known URLs get their published articles back
+        # (after the new ones, so fresh copies win in remove_duplicates)
+        previous_sources = list(self.timed_out_sources) + [
+            source['name'] for source in self.sources
+            if source['name'] in self.incremental_sources and source['name'] not in self.timed_out_sources
+        ]
+        if previous_sources:
+            articles.extend(self._previous_articles(previous_sources))
+
         # Remove duplicates
         articles = self.remove_duplicates(articles)
         logger.info(f"After removing duplicates: {len(articles)}")
@@ -231,6 +515,9 @@ class NewsAggregator:
 
         # Save to JSON
         self.save_to_json(articles)
+        record_published(articles)
+        prune_http_cache()
+        save_caches()
 
         logger.info("Done!")
 
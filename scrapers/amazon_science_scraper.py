@@ -1,9 +1,9 @@
 """
 Amazon Science RSS Scraper
 """
-import html
 from typing import List, Dict
 from .rss_scraper import RSScraper, logger
+from .text import get_cleaner
 
 
 class AmazonScienceScraper(RSScraper):
@@ -13,23 +13,12 @@ class AmazonScienceScraper(RSScraper):
     Uses the RSS feed at https://www.amazon.science/index.rss
 
     Note: Amazon Science's robots.txt requires a 10-second crawl delay.
-    This is handled by setting a higher delay in config.yaml for this source.
+    The shared per-host rate limiter reads it from robots.txt and honors it.
     """
 
-    def normalize_article(self, article: Dict) -> Dict:
-        """
-        Normalize article data with HTML entity decoding for titles
-
-        Amazon Science RSS feed contains HTML entities in titles that need decoding.
-        """
-        # Use parent class normalization
-        normalized = super().normalize_article(article)
-
-        # Decode HTML entities in title (e.g., &quot; -> ", &#8221; -> ")
-        if normalized.get('title'):
-            normalized['title'] = html.unescape(normalized['title'])
-
-        return normalized
+    # Amazon Science RSS feed contains HTML entities in titles that need
+    # decoding (e.g., &quot; -> ", &#8221; -> ")
+    cleaner = get_cleaner(decode_titles=True)
 
     def fetch(self) -> List[Dict]:
         """
@@ -2,11 +2,15 @@
 Base scraper class with common functionality
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+import asyncio
 import time
 import logging
-import re
-import html
+
+from .dates import normalize_date
+from .relevance import RelevanceClassifier
+from .seen_index import SeenIndex
+from .text import DEFAULT_CLEANER, TextCleaner, get_cleaner
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -14,26 +18,28 @@ logger = logging.getLogger(__name__)
 
 def strip_html(text: str) -> str:
     """Remove HTML tags and clean up text"""
-    if not text:
-        return ''
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', text)
-    # Decode all HTML entities using Python's html library
-    text = html.unescape(text)
-    # Remove common RSS feed artifacts
-    text = re.sub(r'\s*Read Article\s*$', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\s*Read More\s*$', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\s*Continue Reading\s*$', '', text, flags=re.IGNORECASE)
-    # Remove "The post ... appeared first on ..." pattern
-    text = re.sub(r'The post .* appeared first on .*\.?$', '', text, flags=re.IGNORECASE)
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    return get_cleaner(max_length=None).clean(text)
 
 
 class BaseScraper(ABC):
     """Base class for all scrapers"""
 
+    # Bump when extraction logic changes so memoized and cached results are dropped
+    PARSER_VERSION = 5
+
+    # Summary cleaning rules; a source's `text` setting in config.yaml overrides them
+    cleaner: TextCleaner = DEFAULT_CLEANER
+
+    # Keeps only on-topic articles when set; a source's `relevance` setting opts in
+    relevance: Optional[RelevanceClassifier] = None
+
+    # URLs published by earlier runs; set by the aggregator when the source has published data
+    seen: Optional[SeenIndex] = None
+
+    # Consecutive known items after which the rest of a listing is taken to be
+    # old; None for listings that are not newest first
+    KNOWN_STREAK: Optional[int] = 5
+
     def __init__(self, source_name: str, url: str, user_agent: str, delay: float = 1.5):
         self.source_name = source_name
         self.url = url
@@ -45,28 +51,85 @@ class BaseScraper(ABC):
             'Accept-Language': 'en-US,en;q=0.5',
         }
 
+    @property
+    def cache_scope(self) -> str:
+        """Conditional GET cache scope: cached results belong to this parser version and text rules"""
+        scope = f"{type(self).__name__}@{self.PARSER_VERSION}/{self.cleaner.fingerprint}"
+        # Results extracted while skipping known URLs are partial
+        return f"{scope}/seen" if self.seen is not None else scope
+
     @abstractmethod
     def fetch(self) -> List[Dict]:
         """Fetch and parse articles from the source"""
         pass
 
+    async def afetch(self) -> List[Dict]:
+        """
+        Fetch and parse articles without blocking the event loop
+
+        Scrapers with a native async HTTP path override this. The default
+        adapter runs the blocking `fetch()` in a worker thread.
+        """
+        return await asyncio.to_thread(self.fetch)
+
     def wait(self):
-        """Apply rate limiting"""
-        time.sleep(self.delay)
+        """
+        Apply rate limiting
+
+        Kept for compatibility: requests are now spaced per host by the
+        shared transport before they are sent, so there is nothing to wait
+        for after a fetch.
+        """
+
+    async def await_delay(self):
+        """Async counterpart of `wait`"""
+
+    def new_items(self, items: Iterable[Any], url_of: Callable[[Any], str]) -> Iterator[Any]:
+        """
+        Items whose URL is not in the known-URL index
+
+        `url_of` must return the article URL an item becomes. Iteration
+        stops after KNOWN_STREAK known items in a row.
+        """
+        if self.seen is None:
+            yield from items
+            return
+
+        streak = 0
+        for item in items:
+            url = url_of(item)
+            if url and url in self.seen:
+                streak += 1
+                if self.KNOWN_STREAK and streak >= self.KNOWN_STREAK:
+                    logger.info(f"{self.source_name}: reached already collected articles")
+                    return
+                continue
+            streak = 0
+            yield item
+
+    def filter_relevant(self, articles: List[Dict]) -> List[Dict]:
+        """Articles the relevance classifier accepts (all of them without one)"""
+        if self.relevance is None:
+            return articles
+        relevant = self.relevance.filter(articles)
+        logger.info(f"Kept {len(relevant)} relevant articles from {self.source_name} "
+                    f"(filtered from {len(articles)} total)")
+        return relevant
 
     def normalize_article(self, article: Dict) -> Dict:
         """Normalize article data to standard format"""
-        # Clean summary by stripping HTML tags
-        summary = strip_html(article.get('summary', ''))
-        # Limit summary length to 500 characters
-        if len(summary) > 500:
-            summary = summary[:497] + '...'
+        # Strip HTML and feed boilerplate from the summary, cut at the length limit
+        summary = self.cleaner.clean(article.get('summary', ''))
+
+        # ISO date plus an integer day for sorting
+        date_str, day = normalize_date(article.get('date', ''))
 
         return {
             'source': self.source_name,
-            'title': article.get('title', ''),
+            'title': self.cleaner.title(article.get('title', '')),
             'url': article.get('url', ''),
-            'date': article.get('date', ''),
+            'date': date_str,
+            'epoch_day': day,
             'summary': summary,
             'author': article.get('author', ''),
             'categories': article.get('categories', []),
@@ -0,0 +1,178 @@
+"""
+Process-wide Playwright browser pool
+One headless Chromium is launched on first use and shared by every
+PlaywrightScraper. Browser contexts are reused per user agent, heavy
+resources (images, fonts, media) are blocked through request routing,
+and several pages can render at once from the same browser.
+"""
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from .base import logger
+from .deadline import DeadlineExceeded, remaining
+
+# Playwright is optional - only import when needed
+try:
+    from playwright.async_api import async_playwright, Page, BrowserContext, Route
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+    logger.warning("Playwright not installed. Dynamic scraping will be disabled.")
+
+T = TypeVar('T')
+
+# Resource types that never affect the DOM we parse
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+
+
+class BrowserPool:
+    """
+    Shared headless Chromium
+
+    Playwright objects are bound to the thread and event loop that created
+    them, so the pool owns a private event loop thread running the async
+    API. Callers from any thread (or any event loop) submit page jobs and
+    wait for their results; at most `max_pages` pages are open at once.
+    """
+
+    def __init__(self, max_pages: int = 4, viewport: Optional[Dict] = None):
+        self.max_pages = max_pages
+        self.viewport = viewport or {'width': 1920, 'height': 1080}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._playwright = None
+        self._browser = None
+        self._contexts: Dict[str, 'BrowserContext'] = {}
+        self._pages: Optional[asyncio.Semaphore] = None
+
+    def _ensure_started(self):
+        """Start the loop thread and launch Chromium on first use"""
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name='browser-pool', daemon=True)
+            thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(self._launch(), loop).result()
+            except Exception:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                raise
+            self._loop, self._thread = loop, thread
+
+    async def _launch(self):
+        logger.info("Launching shared headless Chromium...")
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True)
+        self._pages = asyncio.Semaphore(self.max_pages)
+
+    async def _context(self, user_agent: str) -> 'BrowserContext':
+        """Reusable context per user agent with heavy resources blocked"""
+        context = self._contexts.get(user_agent)
+        if context is None:
+            context = await self._browser.new_context(user_agent=user_agent, viewport=self.viewport)
+            await context.route('**/*', self._route)
+            self._contexts[user_agent] = context
+        return context
+
+    @staticmethod
+    async def _route(route: 'Route'):
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _with_page(self, user_agent: str, job: Callable[['Page'], Awaitable[T]]) -> T:
+        async with self._pages:
+            context = await self._context(user_agent)
+            page = await context.new_page()
+            try:
+                return await job(page)
+            finally:
+                await page.close()
+
+    def submit(self, user_agent: str, job: Callable[['Page'], Awaitable[T]]):
+        """Schedule `job(page)` on the pool and return a concurrent Future"""
+        self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._with_page(user_agent, job), self._loop)
+
+    def run(self, user_agent: str, job: Callable[['Page'], Awaitable[T]]) -> T:
+        """Run `job(page)` on a pooled page and block until it finishes"""
+        return self.result(self.submit(user_agent, job))
+
+    @staticmethod
+    def result(future: concurrent.futures.Future):
+        """Wait for a submitted job, cancelling it at the current deadline"""
+        try:
+            return future.result(timeout=remaining())
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise DeadlineExceeded("Deadline exceeded while rendering")
+
+    async def arun(self, user_agent: str, job: Callable[['Page'], Awaitable[T]]) -> T:
+        """Run `job(page)` on a pooled page from another event loop"""
+        future = await asyncio.to_thread(self.submit, user_agent, job)
+        return await asyncio.wrap_future(future)
+
+    async def _shutdown(self):
+        for context in self._contexts.values():
+            await context.close()
+        self._contexts.clear()
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    def close(self):
+        """Close the browser and stop the loop thread"""
+        with self._start_lock:
+            if self._loop is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=30)
+            except Exception as e:
+                logger.warning(f"Error closing browser pool: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = None
+            self._browser = self._playwright = None
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+_max_pages = 4
+
+
+def configure_browser_pool(settings: Dict):
+    """Apply browser pool settings from config.yaml"""
+    global _max_pages
+    shutdown_browser_pool()
+    _max_pages = settings.get('browser_pages', 4)
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(max_pages=_max_pages)
+        return _pool
+
+
+def shutdown_browser_pool():
+    """Close the shared browser if it was started"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_browser_pool)
@@ -0,0 +1,99 @@
+"""
+Persistent scraper state
+JSON stores kept in the cache directory and saved once per run
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from .base import logger
+
+_cache_dir = Path('.cache')
+_stores: Dict[str, 'JsonStore'] = {}
+_stores_lock = threading.Lock()
+
+
+def configure_cache(settings: Dict):
+    """Apply cache settings from config.yaml"""
+    global _cache_dir
+    _cache_dir = Path(settings.get('cache_dir', '.cache'))
+    with _stores_lock:
+        _stores.clear()
+
+
+def cache_path(name: str) -> Path:
+    """Path of a file inside the cache directory"""
+    return _cache_dir / name
+
+
+class JsonStore:
+    """Dict persisted as a JSON file, loaded lazily and saved atomically"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.lock = threading.RLock()
+        self._data: Optional[Dict] = None
+        self._dirty = False
+
+    @property
+    def data(self) -> Dict:
+        with self.lock:
+            if self._data is None:
+                self._data = self._load()
+            return self._data
+
+    def _load(self) -> Dict:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache {self.path}: {e}")
+            return {}
+
+    def get(self, key: str, default=None):
+        with self.lock:
+            return self.data.get(key, default)
+
+    def set(self, key: str, value):
+        with self.lock:
+            self.data[key] = value
+            self._dirty = True
+
+    def pop(self, key: str, default=None):
+        with self.lock:
+            self._dirty = True
+            return self.data.pop(key, default)
+
+    def save(self):
+        """Write the store if it changed since it was loaded"""
+        with self.lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+
+def open_store(name: str) -> JsonStore:
+    """Return the shared store for a file in the cache directory"""
+    with _stores_lock:
+        store = _stores.get(name)
+        if store is None:
+            store = JsonStore(cache_path(name))
+            _stores[name] = store
+        return store
+
+
+def save_caches():
+    """Persist every store touched during this run"""
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        store.save()
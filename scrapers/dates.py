@@ -0,0 +1,106 @@
+"""
+Date normalization
+Turns the date strings scrapers find into ISO dates (YYYY-MM-DD) and
+epoch days (days since 1970-01-01) used for sorting. Recognizers are
+compiled once and results are memoized, since the same strings repeat
+across articles, listing pages and runs.
+"""
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Tuple
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# Full or abbreviated English month name
+MONTH = (
+    r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?'
+    r'|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)'
+)
+
+# "Nov 24, 2025", "October 28th，2024", "Oct 28 2024" (not "May 12024")
+_MONTH_DAY_YEAR = rf'\b({MONTH})\.?\s+(\d{{1,2}})(?:st|nd|rd|th)?(?:\s*[,，]\s*|\s+)(\d{{4}})(?!\d)'
+# "30 October 2025", "Tue, 10 Jun 2025 23:30:00 GMT"
+_DAY_MONTH_YEAR = rf'(?<!\d)(\d{{1,2}})(?:st|nd|rd|th)?\s+({MONTH})\.?,?\s+(\d{{4}})(?!\d)'
+
+# Scrapers find and strip dates in link text with these, so month names
+# must be capitalized; parse_date also accepts other cases
+MONTH_DAY_YEAR = re.compile(_MONTH_DAY_YEAR)
+DAY_MONTH_YEAR = re.compile(_DAY_MONTH_YEAR)
+# "2025-06-10", "2025-06-10T23:30:00Z", "2025/6/10", "2025.06.10"
+YEAR_MONTH_DAY = re.compile(r'(?<!\d)(\d{4})([-/.])(\d{1,2})\2(\d{1,2})(?!\d)')
+# "06/10/2025" (US order)
+US_SLASH = re.compile(r'(?<!\d)(\d{1,2})/(\d{1,2})/(\d{4})(?!\d)')
+# "20250610"
+COMPACT = re.compile(r'(\d{4})(\d{2})(\d{2})')
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _month(name: str) -> int:
+    return MONTHS[name[:3].lower()]
+
+
+# (pattern, match -> (year, month, day)) in the order they are tried
+RECOGNIZERS = (
+    (YEAR_MONTH_DAY.search, lambda m: (int(m[1]), int(m[3]), int(m[4]))),
+    (re.compile(_MONTH_DAY_YEAR, re.IGNORECASE).search, lambda m: (int(m[3]), _month(m[1]), int(m[2]))),
+    (re.compile(_DAY_MONTH_YEAR, re.IGNORECASE).search, lambda m: (int(m[3]), _month(m[2]), int(m[1]))),
+    (US_SLASH.search, lambda m: (int(m[3]), int(m[1]), int(m[2]))),
+    (COMPACT.fullmatch, lambda m: (int(m[1]), int(m[2]), int(m[3]))),
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> Optional[date]:
+    """First calendar date found in `text`, or None"""
+    text = text.strip()
+    for find, fields in RECOGNIZERS:
+        match = find(text)
+        if match:
+            try:
+                return date(*fields(match))
+            except ValueError:
+                continue
+    return None
+
+
+def to_iso(text: str) -> str:
+    """`text` as YYYY-MM-DD, or '' if it holds no date"""
+    parsed = parse_date(text) if text else None
+    return parsed.isoformat() if parsed else ''
+
+
+def epoch_day(text: str) -> Optional[int]:
+    """Days since 1970-01-01 for the date in `text`, or None"""
+    parsed = parse_date(text) if text else None
+    return parsed.toordinal() - EPOCH_ORDINAL if parsed else None
+
+
+def normalize_date(text: str) -> Tuple[str, Optional[int]]:
+    """
+    ISO date and epoch day for an article date
+
+    Text without a recognizable date is kept as is (e.g. 'N/A') with no
+    epoch day.
+    """
+    parsed = parse_date(text) if text else None
+    if parsed is None:
+        return text or '', None
+    return parsed.isoformat(), parsed.toordinal() - EPOCH_ORDINAL
+
+
+@lru_cache(maxsize=1024)
+def timestamp_key(text: str) -> Tuple[int, int]:
+    """(epoch day, seconds into the day) of a 'YYYY-MM-DD HH:MM:SS' timestamp"""
+    day = epoch_day(text[:10]) if text else None
+    if day is None:
+        return (0, 0)
+    try:
+        hours, minutes, seconds = (int(part) for part in text[11:19].split(':'))
+    except ValueError:
+        return (day, 0)
+    return (day, hours * 3600 + minutes * 60 + seconds)
@@ -0,0 +1,61 @@
+"""
+Cooperative deadlines
+The aggregator sets a deadline for each source; the transport, rate
+limiter and browser pool cap their timeouts and waits to the time left
+and raise DeadlineExceeded once it is gone, so a hung source cannot
+outlive its budget.
+"""
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+_deadline: contextvars.ContextVar = contextvars.ContextVar('deadline', default=None)
+
+
+class DeadlineExceeded(Exception):
+    """The current source ran out of time"""
+
+
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """Limit the code inside the block to `seconds` (nested deadlines only shrink)"""
+    if seconds is None:
+        yield
+        return
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None without one"""
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check_deadline():
+    """Raise DeadlineExceeded if the current deadline has passed"""
+    if expired():
+        raise DeadlineExceeded("Deadline exceeded")
+
+
+def bounded(timeout: float) -> float:
+    """`timeout` capped to the time left, raising if none is left"""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("Deadline exceeded")
+    return min(timeout, left)
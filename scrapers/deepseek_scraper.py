@@ -6,76 +6,70 @@ Scrapes news from https://api-docs.deepseek.com
 from typing import List, Dict
 import re
 from datetime import datetime
+from bs4 import BeautifulSoup, SoupStrainer
 from .html_scraper import HTMLScraper, logger
 
 
 class DeepSeekScraper(HTMLScraper):
     """Scraper for DeepSeek API Docs news"""
 
-    def fetch(self) -> List[Dict]:
-        """Fetch news from DeepSeek API documentation"""
-        try:
-            logger.info(f"Fetching news from {self.source_name}...")
-
-            soup = self.fetch_page()
-            if not soup:
-                return []
-
-            articles = []
-
-            # Find all news links (format: /news/newsYYMMDD or /news/newsYYYYMMDD)
-            news_links = soup.find_all('a', href=re.compile(r'/news/news\d+'))
-
-            seen_urls = set()
-            for link in news_links[:30]:  # Limit to 30
-                try:
-                    href = link.get('href', '')
-                    if not href or href in seen_urls:
-                        continue
+    # parse() only reads inside these links
+    PARSE_ONLY = SoupStrainer('a', href=re.compile(r'/news/news\d+'))
 
-                    seen_urls.add(href)
+    def parse(self, soup: BeautifulSoup) -> List[Dict]:
+        """Extract news from DeepSeek API documentation"""
+        articles = []
 
-                    # Build full URL
-                    url = f"https://api-docs.deepseek.com{href}"
+        # Find all news links (format: /news/newsYYMMDD or /news/newsYYYYMMDD)
+        news_links = soup.find_all('a', href=re.compile(r'/news/news\d+'))
 
-                    # Extract title
-                    title = link.get_text(strip=True)
-
-                    # Skip generic "News" links
-                    if title == "News" or len(title) < 5:
-                        continue
+        seen_urls = set()
+        for link in self.new_items(news_links[:30], self._link_url):  # Limit to 30
+            try:
+                href = link.get('href', '')
+                if not href or href in seen_urls:
+                    continue
 
-                    # Extract date from URL pattern
-                    # Pattern: /news/newsYYMMDD or /news/newsYYYYMMDD
-                    date_str = ''
-                    date_match = re.search(r'/news/news(\d+)', href)
-                    if date_match:
-                        date_code = date_match.group(1)
-                        date_str = self._parse_date_from_code(date_code)
+                seen_urls.add(href)
 
-                    article = {
-                        'title': title,
-                        'url': url,
-                        'date': date_str,
-                        'summary': '',
-                        'categories': ['News'],
-                        'author': ''
-                    }
+                # Build full URL
+                url = self._link_url(link)
 
-                    articles.append(self.normalize_article(article))
+                # Extract title
+                title = link.get_text(strip=True)
 
-                except Exception as e:
-                    logger.warning(f"Error parsing DeepSeek news item: {e}")
+                # Skip generic "News" links
+                if title == "News" or len(title) < 5:
                     continue
 
-            logger.info(f"Found {len(articles)} articles from {self.source_name}")
-            self.wait()
-
-            return articles
-
-        except Exception as e:
-            logger.error(f"Error fetching from {self.source_name}: {e}")
-            return []
+                # Extract date from URL pattern
+                # Pattern: /news/newsYYMMDD or /news/newsYYYYMMDD
+                date_str = ''
+                date_match = re.search(r'/news/news(\d+)', href)
+                if date_match:
+                    date_code = date_match.group(1)
+                    date_str = self._parse_date_from_code(date_code)
+
+                article = {
+                    'title': title,
+                    'url': url,
+                    'date': date_str,
+                    'summary': '',
+                    'categories': ['News'],
+                    'author': ''
+                }
+
+                articles.append(self.normalize_article(article))
+
+            except Exception as e:
+                logger.warning(f"Error parsing DeepSeek news item: {e}")
+                continue
+
+        return articles
+
+    def _link_url(self, link) -> str:
+        """Absolute URL of a news link"""
+        return f"https://api-docs.deepseek.com{link.get('href', '')}"
 
     def _parse_date_from_code(self, date_code: str) -> str:
         """
@@ -0,0 +1,267 @@
+"""
+Streaming RSS 2.0 / Atom 1.0 parser
+Reads well-formed feeds entry by entry with lxml and fills the same fields
+RSScraper._parse_entry takes from feedparser (title, link, date, summary,
+author, categories). Anything it does not model exactly - malformed XML,
+DTDs, xml:base, unknown extension elements, repeated fields - is reported
+as unsupported so the caller can fall back to feedparser.
+"""
+import codecs
+import re
+from datetime import datetime
+from io import BytesIO
+from typing import Dict, List, Optional
+
+from lxml import etree
+# Same date, URL and sanitizing rules feedparser applies
+from feedparser.datetimes import _parse_date
+from feedparser.sanitizer import _sanitize_html
+from feedparser.urls import _urljoin
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+DC = '{http://purl.org/dc/elements/1.1/}'
+CONTENT = '{http://purl.org/rss/1.0/modules/content/}'
+MEDIA = '{http://search.yahoo.com/mrss/}'
+WFW = '{http://wellformedweb.org/CommentAPI/}'
+SLASH = '{http://purl.org/rss/1.0/modules/slash/}'
+
+# RSS item children -> field (each may appear once)
+RSS_FIELDS = {
+    'title': 'title',
+    'link': 'link',
+    'guid': 'guid',
+    'description': 'summary',
+    CONTENT + 'encoded': 'content',
+    'pubDate': 'published',
+    DC + 'date': 'updated',
+    'author': 'author',
+    DC + 'creator': 'author',
+}
+RSS_CATEGORIES = {'category', DC + 'subject'}
+
+# Atom entry children -> field (each may appear once)
+ATOM_FIELDS = {
+    ATOM + 'title': 'title',
+    ATOM + 'id': 'id',
+    ATOM + 'summary': 'summary',
+    ATOM + 'content': 'content',
+    ATOM + 'published': 'published',
+    ATOM + 'updated': 'updated',
+}
+
+# Children that never feed one of the extracted fields
+IGNORED = {
+    'comments', 'enclosure', 'source',
+    MEDIA + 'content', MEDIA + 'thumbnail',
+    WFW + 'commentRss', SLASH + 'comments',
+    ATOM + 'rights',
+}
+
+# Elements feedparser's sanitizer drops together with their content
+UNSAFE_MARKUP = re.compile(r'<\s*(script|style|applet)\b', re.IGNORECASE)
+XML_ENCODING = re.compile(rb'^\s*<\?xml[^>]*encoding=["\']([A-Za-z0-9._-]+)')
+
+
+class UnsupportedFeed(Exception):
+    """The document needs feedparser's full parser"""
+
+
+def parse_feed_entries(content: bytes, base_url: str = '', content_type: str = '') -> Optional[List[Dict]]:
+    """
+    Extract raw article dicts from an RSS 2.0 or Atom 1.0 document
+
+    Args:
+        content: Feed body
+        base_url: URL the feed was downloaded from, for relative links
+        content_type: Content-Type response header
+
+    Returns:
+        One dict per entry (title, url, date, summary, author, categories),
+        or None if the document must go through feedparser
+    """
+    try:
+        _check_document(content, content_type)
+        return list(_iter_entries(content, base_url))
+    except (UnsupportedFeed, etree.XMLSyntaxError):
+        return None
+
+
+def _check_document(content: bytes, content_type: str):
+    """Reject documents whose decoding or base URI lxml would see differently"""
+    head = content[:4096]
+    if b'<!DOCTYPE' in head or b'xml:base' in content:
+        raise UnsupportedFeed('DTD or xml:base')
+
+    charset = re.search(r'charset=["\']?([\w.-]+)', content_type or '', re.IGNORECASE)
+    if charset:
+        declared = XML_ENCODING.match(head.lstrip(b'\xef\xbb\xbf'))
+        declared = declared.group(1).decode('ascii') if declared else 'utf-8'
+        if _codec(charset.group(1)) != _codec(declared):
+            raise UnsupportedFeed('charset mismatch')
+
+
+def _codec(name: str) -> str:
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        raise UnsupportedFeed(f'unknown charset {name}')
+
+
+def _iter_entries(content: bytes, base_url: str):
+    events = etree.iterparse(
+        BytesIO(content),
+        events=('start', 'end'),
+        tag=('rss', ATOM + 'feed', 'item', ATOM + 'entry'),
+        resolve_entities=False,
+        no_network=True,
+        remove_comments=True,
+        remove_pis=True,
+    )
+
+    parse_entry = None
+    for event, elem in events:
+        if parse_entry is None:
+            # The first event must open a supported root element
+            if event != 'start':
+                raise UnsupportedFeed('unknown root')
+            if elem.tag == 'rss' and elem.get('version', '').startswith('2'):
+                parse_entry = _rss_item
+            elif elem.tag == ATOM + 'feed':
+                parse_entry = _atom_entry
+            else:
+                raise UnsupportedFeed(f'unknown root {elem.tag}')
+            continue
+
+        if event == 'end' and elem.tag in ('item', ATOM + 'entry'):
+            yield parse_entry(elem, base_url)
+            # Entries are independent: drop the finished ones
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    if parse_entry is None:
+        raise UnsupportedFeed('not RSS 2.0 or Atom 1.0')
+
+
+def _text(elem) -> str:
+    if len(elem):
+        raise UnsupportedFeed(f'markup inside {elem.tag}')
+    return (elem.text or '').strip()
+
+
+def _html(value: str) -> str:
+    """Apply feedparser's sanitizer only where it would change the text"""
+    if UNSAFE_MARKUP.search(value):
+        return _sanitize_html(value, 'utf-8', 'text/html')
+    return value
+
+
+def _date(fields: Dict) -> str:
+    parsed = _parse_date(fields['published']) if 'published' in fields else None
+    if not parsed and 'updated' in fields:
+        parsed = _parse_date(fields['updated'])
+    return datetime(*parsed[:6]).strftime('%Y-%m-%d') if parsed else ''
+
+
+def _rss_item(item, base_url: str) -> Dict:
+    fields = {}
+    categories = []
+    guid_is_link = False
+
+    for child in item:
+        tag = child.tag
+        if tag in RSS_FIELDS:
+            field = RSS_FIELDS[tag]
+            if field in fields:
+                raise UnsupportedFeed(f'repeated {field}')
+            fields[field] = _text(child)
+            if tag == 'guid':
+                guid_is_link = child.get('isPermaLink', 'true') != 'false'
+        elif tag in RSS_CATEGORIES:
+            term = _text(child)
+            if term:
+                categories.append(term)
+        elif tag not in IGNORED or len(child):
+            raise UnsupportedFeed(f'unsupported element {tag}')
+
+    if 'link' in fields:
+        link = fields['link']
+    elif guid_is_link:
+        link = fields.get('guid', '')
+    else:
+        link = ''
+
+    return {
+        'title': fields.get('title', ''),
+        'url': _urljoin(base_url, link) if link else '',
+        'date': _date(fields),
+        'summary': _html(fields.get('summary', fields.get('content', ''))),
+        'author': fields.get('author', ''),
+        'categories': categories
+    }
+
+
+def _atom_text(elem) -> str:
+    """Value of an Atom text construct (text or html)"""
+    content_type = elem.get('type', 'text')
+    if content_type == 'html':
+        return _html(_text(elem))
+    if content_type == 'text':
+        return _text(elem)
+    raise UnsupportedFeed(f'{content_type} content')
+
+
+def _atom_author(elem) -> str:
+    parts = {}
+    for child in elem:
+        if child.tag not in (ATOM + 'name', ATOM + 'email', ATOM + 'uri') or child.tag in parts:
+            raise UnsupportedFeed('unsupported author')
+        parts[child.tag] = _text(child)
+
+    name, email = parts.get(ATOM + 'name', ''), parts.get(ATOM + 'email', '')
+    if name and email:
+        return f"{name} ({email})"
+    return name or email
+
+
+def _atom_entry(entry, base_url: str) -> Dict:
+    fields = {}
+    categories = []
+    links = []
+    authors = []
+
+    for child in entry:
+        tag = child.tag
+        if tag in ATOM_FIELDS:
+            field = ATOM_FIELDS[tag]
+            if field in fields:
+                raise UnsupportedFeed(f'repeated {field}')
+            if field in ('title', 'summary', 'content'):
+                fields[field] = _atom_text(child)
+            else:
+                fields[field] = _text(child)
+        elif tag == ATOM + 'link':
+            if child.get('rel', 'alternate') == 'alternate':
+                links.append(child.get('href', ''))
+        elif tag == ATOM + 'author':
+            authors.append(_atom_author(child))
+        elif tag == ATOM + 'category':
+            if child.get('term') is None:
+                raise UnsupportedFeed('category without term')
+            categories.append(child.get('term'))
+        elif tag not in IGNORED or len(child):
+            raise UnsupportedFeed(f'unsupported element {tag}')
+
+    if len(links) > 1 or len(authors) > 1:
+        raise UnsupportedFeed('several alternate links or authors')
+
+    link = links[0] if links else fields.get('id', '')
+
+    return {
+        'title': fields.get('title', ''),
+        'url': _urljoin(base_url, link) if link else '',
+        'date': _date(fields),
+        'summary': fields.get('summary', fields.get('content', '')),
+        'author': authors[0] if authors else '',
+        'categories': categories
+    }
@@ -0,0 +1,105 @@
+"""
+Source health tracking
+Per-request outcomes for the source being collected, and a circuit
+breaker persisted between runs so known-dead sources are skipped
+instantly and only probed again after a cooldown
+"""
+import contextvars
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from .cache import open_store
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class RequestOutcomes:
+    """Outcome of every HTTP request made while collecting one source"""
+
+    def __init__(self):
+        self.successes = 0
+        self.failures = 0
+        self.last_error: Optional[Exception] = None
+        # Hosts that stayed unreachable after retries - later requests fail fast
+        self.dead_hosts: Set[str] = set()
+
+    @property
+    def failed(self) -> bool:
+        """True when requests were made and none of them succeeded"""
+        return self.failures > 0 and self.successes == 0
+
+
+_outcomes: contextvars.ContextVar = contextvars.ContextVar('request_outcomes', default=None)
+
+
+@contextmanager
+def track_requests():
+    """Collect request outcomes for the code run inside the block"""
+    outcomes = RequestOutcomes()
+    token = _outcomes.set(outcomes)
+    try:
+        yield outcomes
+    finally:
+        _outcomes.reset(token)
+
+
+def current_outcomes() -> Optional[RequestOutcomes]:
+    """Outcomes of the enclosing `track_requests` block, if any"""
+    return _outcomes.get()
+
+
+class CircuitBreaker:
+    """
+    Per-source circuit breaker
+
+    After `failure_threshold` consecutive failed runs a source is opened
+    for `cooldown` seconds, doubling with every further failure up to
+    `max_cooldown`. Once the cooldown expires the source is half-open: the
+    caller should probe it cheaply before running the full scraper.
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 6 * 3600,
+                 max_cooldown: float = 7 * 24 * 3600):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.store = open_store('health.json')
+
+    def health(self, source_name: str) -> Dict:
+        return self.store.get(source_name) or {
+            'consecutive_failures': 0,
+            'last_success': None,
+            'last_failure': None,
+            'open_until': None,
+        }
+
+    def state(self, source_name: str) -> str:
+        open_until = self.health(source_name).get('open_until')
+        if not open_until:
+            return CLOSED
+        return OPEN if time.time() < open_until else HALF_OPEN
+
+    def record_success(self, source_name: str):
+        health = self.health(source_name)
+        health.update({
+            'consecutive_failures': 0,
+            'last_success': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'open_until': None,
+        })
+        self.store.set(source_name, health)
+
+    def record_failure(self, source_name: str):
+        health = self.health(source_name)
+        failures = health['consecutive_failures'] + 1
+        health['consecutive_failures'] = failures
+        health['last_failure'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        if failures >= self.failure_threshold:
+            cooldown = min(self.max_cooldown, self.cooldown * 2 ** (failures - self.failure_threshold))
+            health['open_until'] = time.time() + cooldown
+
+        self.store.set(source_name, health)
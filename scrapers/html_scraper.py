@@ -1,26 +1,196 @@
 """
 HTML Scraper base class
 """
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from typing import List, Dict, Optional, Pattern
 from .base import BaseScraper, logger
+from .transport import get_transport, Response
+from .http_cache import conditional_get, aconditional_get
+from .parse_memo import memoized_parse, amemoized_parse
+from .parse_pool import run_parse, arun_parse
+from .structured import extract_structured
+
+# Tree builder used for HTML listings (see configure_html_parser)
+_parser = 'lxml' if builder_registry.lookup('lxml') else 'html.parser'
+
+
+def configure_html_parser(settings: Dict):
+    """Select the BeautifulSoup backend from config.yaml (lxml, html5lib, html.parser)"""
+    global _parser
+    name = settings.get('html_parser', 'lxml')
+    if builder_registry.lookup(name) is None:
+        logger.warning(f"HTML parser '{name}' is not installed, falling back to html.parser")
+        name = 'html.parser'
+    _parser = name
+
+
+def get_html_parser() -> str:
+    """Return the configured BeautifulSoup backend"""
+    return _parser
+
+
+def build_soup(content, parser: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse tree of `content`, built only from the `parse_only` elements if given"""
+    # html5lib always builds the full tree and warns about parse_only
+    if parser == 'html5lib':
+        parse_only = None
+    return BeautifulSoup(content, parser, parse_only=parse_only)
 
 
 class HTMLScraper(BaseScraper):
-    """Base HTML scraper with common functionality"""
+    """
+    Base HTML scraper with common functionality
+
+    Subclasses implement `parse(soup)` and get both the blocking `fetch()`
+    and the async `afetch()` for free. Scrapers whose listing is not HTML
+    override `parse_content(content)` instead.
+
+    Scrapers that only read a few elements set PARSE_ONLY to a SoupStrainer
+    matching them, so the rest of the page is never built into the tree.
+    Only use it when `parse()` stays inside the matched elements (no
+    parent or sibling lookups).
+
+    Scrapers that set STRUCTURED first check pages for embedded structured
+    data (JSON-LD, Next.js or Nuxt state, OpenGraph); `parse()` only runs
+    when that yields fewer than MIN_STRUCTURED articles whose URL matches
+    STRUCTURED_URL. Structured articles go through the same title length
+    check and cap as `parse()` (MIN_TITLE_LENGTH, MAX_ARTICLES).
+    """
+
+    # URL of the listing to download (defaults to the configured source URL)
+    LISTING_URL: Optional[str] = None
+
+    # Elements `parse()` needs; None builds the whole document
+    PARSE_ONLY: Optional[SoupStrainer] = None
+
+    # Structured data fast path, opt-in per scraper
+    STRUCTURED = False
+    # Structured entries must have an article URL matching this (None: any URL)
+    STRUCTURED_URL: Optional[Pattern] = None
+    # URL template for app-state entries with only a slug, e.g. 'https://x.com/blog/{slug}'
+    STRUCTURED_SLUG_URL: Optional[str] = None
+    # Fewer articles than this means the data is not the listing (e.g. a featured post)
+    MIN_STRUCTURED = 3
+    # Shorter titles are not articles (e.g. "Read more" links)
+    MIN_TITLE_LENGTH = 0
+    # Most articles taken from a listing (None: all)
+    MAX_ARTICLES: Optional[int] = None
+
+    @property
+    def listing_url(self) -> str:
+        return self.LISTING_URL or self.url
+
+    @property
+    def parser(self) -> str:
+        return get_html_parser()
+
+    def fetch_content(self, url: Optional[str] = None) -> bytes:
+        """Download a page and return the raw response body"""
+        return get_transport().get(url or self.listing_url, headers=self.headers).content
+
+    async def afetch_content(self, url: Optional[str] = None) -> bytes:
+        """Async counterpart of `fetch_content`"""
+        response = await get_transport().aget(url or self.listing_url, headers=self.headers)
+        return response.content
 
     def fetch_page(self, url: Optional[str] = None) -> Optional[BeautifulSoup]:
         """Fetch and parse HTML page"""
         target_url = url or self.url
         try:
-            response = requests.get(target_url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return self.make_soup(self.fetch_content(target_url))
+        except Exception as e:
+            logger.error(f"Error fetching {target_url}: {e}")
+            return None
+
+    async def afetch_page(self, url: Optional[str] = None) -> Optional[BeautifulSoup]:
+        """Async counterpart of `fetch_page`"""
+        target_url = url or self.url
+        try:
+            return self.make_soup(await self.afetch_content(target_url))
         except Exception as e:
             logger.error(f"Error fetching {target_url}: {e}")
             return None
 
+    def make_soup(self, content: bytes) -> BeautifulSoup:
+        """Build the parse tree for a downloaded page"""
+        return build_soup(content, self.parser, self.PARSE_ONLY)
+
     def fetch(self) -> List[Dict]:
+        """Fetch the listing and extract articles"""
+        try:
+            logger.info(f"Fetching articles from {self.source_name}...")
+
+            articles = conditional_get(
+                self.listing_url,
+                self.headers,
+                self.parse_response,
+                scope=self.cache_scope
+            )
+
+            logger.info(f"Found {len(articles)} articles from {self.source_name}")
+
+            return articles
+
+        except Exception as e:
+            logger.error(f"Error fetching from {self.source_name}: {e}")
+            return []
+
+    async def afetch(self) -> List[Dict]:
+        """Fetch the listing over async HTTP and extract articles"""
+        try:
+            logger.info(f"Fetching articles from {self.source_name}...")
+
+            articles = await aconditional_get(
+                self.listing_url,
+                self.headers,
+                self.aparse_response,
+                scope=self.cache_scope
+            )
+
+            logger.info(f"Found {len(articles)} articles from {self.source_name}")
+
+            return articles
+
+        except Exception as e:
+            logger.error(f"Error fetching from {self.source_name}: {e}")
+            return []
+
+    def parse_response(self, response: Response) -> List[Dict]:
+        """Extract articles from a response, reusing results for identical bodies"""
+        return memoized_parse(
+            self, response.content, lambda: run_parse(self, 'parse_content', response.content)
+        )
+
+    async def aparse_response(self, response: Response) -> List[Dict]:
+        """Async counterpart of `parse_response`"""
+        return await amemoized_parse(
+            self, response.content, lambda: arun_parse(self, 'parse_content', response.content)
+        )
+
+    def parse_content(self, content: bytes) -> List[Dict]:
+        """Extract normalized articles from a downloaded listing"""
+        articles = self.parse_structured(content) if self.STRUCTURED else []
+        if articles:
+            return articles
+        return self.parse(self.make_soup(content))
+
+    def parse_structured(self, content: bytes) -> List[Dict]:
+        """Normalized articles from embedded structured data, or [] to parse the DOM"""
+        articles = [
+            article for article in extract_structured(content, self.listing_url, self.STRUCTURED_SLUG_URL)
+            if self.STRUCTURED_URL is None or self.STRUCTURED_URL.search(article['url'])
+        ]
+        if len(articles) < self.MIN_STRUCTURED:
+            return []
+        logger.info(f"Using structured data for {self.source_name}")
+        articles = [
+            self.normalize_article(article)
+            for article in self.new_items(articles, lambda article: article['url'])
+            if len(article['title']) >= self.MIN_TITLE_LENGTH
+        ]
+        return articles[:self.MAX_ARTICLES]
+
+    def parse(self, soup: BeautifulSoup) -> List[Dict]:
         """Override this method in subclasses"""
-        raise NotImplementedError("Subclasses must implement fetch()")
+        raise NotImplementedError("Subclasses must implement parse()")
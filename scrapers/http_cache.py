@@ -0,0 +1,193 @@
+"""
+Conditional GET cache
+ETag / Last-Modified validators stored with the parsed result of each
+URL, so unchanged feeds and pages are neither downloaded nor parsed
+"""
+import inspect
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+from urllib.parse import urlencode
+
+from .base import logger
+from .cache import JsonStore, open_store
+from .transport import get_transport, Response
+
+
+class ConditionalCache:
+    """
+    HTTP validators and parsed results per request
+
+    Validators are only sent when a parsed result is stored alongside them,
+    so a 304 answer can always be served from the cache.
+    """
+
+    def __init__(self, store: JsonStore):
+        self.store = store
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict] = None, scope: str = '',
+            volatile_params: Iterable[str] = ()) -> str:
+        # Params that change from run to run (e.g. today's date) would give
+        # every run a fresh key that never revalidates
+        if params:
+            params = {k: v for k, v in params.items() if k not in volatile_params}
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        return f"{scope}:{key}" if scope else key
+
+    def request_headers(self, key: str) -> Dict[str, str]:
+        entry = self.store.get(key)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def cached_result(self, key: str):
+        entry = self.store.get(key)
+        if not entry:
+            return None
+        self.store.set(key, {**entry, 'used': _today()})
+        return entry['result']
+
+    def update(self, key: str, response: Response, result):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            # Nothing to revalidate with next time
+            if self.store.get(key) is not None:
+                self.store.pop(key)
+            return
+        self.store.set(key, {
+            'etag': etag,
+            'last_modified': last_modified,
+            'result': result,
+            'used': _today(),
+        })
+
+    def prune(self, max_age_days: int) -> int:
+        """Drop entries not requested for `max_age_days`; returns how many"""
+        today = _today()
+        stale = []
+        with self.store.lock:
+            for key, entry in list(self.store.data.items()):
+                if 'used' not in entry:
+                    # Written before use was tracked: start its clock now
+                    self.store.set(key, {**entry, 'used': today})
+                elif entry['used'] < today - max_age_days:
+                    stale.append(key)
+            for key in stale:
+                self.store.pop(key)
+        return len(stale)
+
+
+def _today() -> int:
+    """Days since the epoch, the resolution of an entry's last use"""
+    return int(time.time() // 86400)
+
+
+_http_cache_enabled = True
+_http_cache_days = 30
+
+
+def configure_http_cache(settings: Dict):
+    """Apply conditional GET settings from config.yaml"""
+    global _http_cache_enabled, _http_cache_days
+    _http_cache_enabled = settings.get('http_cache', True)
+    _http_cache_days = settings.get('http_cache_days', 30)
+
+
+def prune_http_cache():
+    """Forget validators of requests no scraper has made for `http_cache_days`"""
+    cache = get_conditional_cache()
+    if cache is None or not _http_cache_days:
+        return
+    pruned = cache.prune(_http_cache_days)
+    if pruned:
+        logger.info(f"Pruned {pruned} unused HTTP cache entries")
+
+
+def get_conditional_cache() -> Optional[ConditionalCache]:
+    """Return the shared conditional GET cache, or None when disabled"""
+    if not _http_cache_enabled:
+        return None
+    return ConditionalCache(open_store('http_validators.json'))
+
+
+def conditional_get(
+    url: str,
+    headers: Dict[str, str],
+    parse: Callable[[Response], Any],
+    params: Optional[Dict] = None,
+    scope: str = '',
+    volatile_params: Iterable[str] = ()
+):
+    """
+    GET a URL with stored validators and return `parse(response)`
+
+    When the server answers 304 Not Modified the previous parsed result is
+    returned without calling `parse`. Callers whose `parse` returns a
+    different kind of result for a URL than the scrapers do pass a `scope`
+    to keep their cache entries apart. `volatile_params` are sent but left
+    out of the cache key.
+    """
+    cache = get_conditional_cache()
+    if cache is None:
+        return parse(get_transport().get(url, headers=headers, params=params))
+
+    key = cache.key(url, params, scope, volatile_params)
+    response = get_transport().get(
+        url,
+        headers={**headers, **cache.request_headers(key)},
+        params=params
+    )
+    return _resolve(cache, key, response, parse)
+
+
+async def aconditional_get(
+    url: str,
+    headers: Dict[str, str],
+    parse: Callable[[Response], Any],
+    params: Optional[Dict] = None,
+    scope: str = '',
+    volatile_params: Iterable[str] = ()
+):
+    """Async counterpart of `conditional_get`; `parse` may also be a coroutine function"""
+    cache = get_conditional_cache()
+    if cache is None:
+        return await _aparse(parse, await get_transport().aget(url, headers=headers, params=params))
+
+    key = cache.key(url, params, scope, volatile_params)
+    response = await get_transport().aget(
+        url,
+        headers={**headers, **cache.request_headers(key)},
+        params=params
+    )
+    if response.status == 304:
+        return _resolve(cache, key, response, parse)
+
+    result = await _aparse(parse, response)
+    cache.update(key, response, result)
+    return result
+
+
+async def _aparse(parse: Callable[[Response], Any], response: Response):
+    result = parse(response)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def _resolve(cache: ConditionalCache, key: str, response: Response, parse):
+    if response.status == 304:
+        result = cache.cached_result(key)
+        if result is not None:
+            logger.info(f"Not modified since last run: {key}")
+            return result
+        raise ValueError(f"304 Not Modified without a cached result for {key}")
+
+    result = parse(response)
+    cache.update(key, response, result)
+    return result
@@ -3,16 +3,19 @@ LG AI Research Blog Scraper
 Uses the internal API for reliable data extraction
 """
 from typing import List, Dict
-import re
-import requests
+import asyncio
 from datetime import datetime
 from .base import BaseScraper, logger
+from .dates import to_iso
+from .http_cache import conditional_get, aconditional_get
 
 
 class LGResearchScraper(BaseScraper):
     """Scraper for LG AI Research blog using internal API"""
 
     API_URL = "https://www.lgresearch.ai/api/board/blog/list"
+    # Today's date is sent to the API but must not be part of the cache key
+    VOLATILE_PARAMS = ('schExpsYmd',)
 
     def __init__(self, source_name: str, url: str, user_agent: str, delay: float = 1.5):
         super().__init__(source_name, url, user_agent, delay)
@@ -27,80 +30,123 @@ class LGResearchScraper(BaseScraper):
         try:
             logger.info(f"Fetching blog posts from {self.source_name} (API)...")
 
-            articles = []
-            seen_seqs = set()
+            # Fetch English articles, then Korean ones (some may be different)
+            articles = self._merge_languages([
+                self._fetch_language('EN'),
+                self._fetch_language('KR'),
+            ])
 
-            # Fetch English articles
-            en_articles = self._fetch_language('EN')
-            for seq, article in en_articles:
-                if seq not in seen_seqs:
-                    seen_seqs.add(seq)
-                    articles.append(article)
+            logger.info(f"Found {len(articles)} articles from {self.source_name}")
 
-            # Fetch Korean articles (some may be different)
-            kr_articles = self._fetch_language('KR')
-            for seq, article in kr_articles:
-                if seq not in seen_seqs:
-                    seen_seqs.add(seq)
-                    articles.append(article)
+            return articles
 
-            # Sort by date descending
-            articles.sort(key=lambda x: x.get('date', '1900-01-01'), reverse=True)
+        except Exception as e:
+            logger.error(f"Error fetching from {self.source_name}: {e}")
+            return []
+
+    async def afetch(self) -> List[Dict]:
+        """Fetch both languages from the blog API concurrently"""
+        try:
+            logger.info(f"Fetching blog posts from {self.source_name} (API)...")
+
+            articles = self._merge_languages(await asyncio.gather(
+                self._afetch_language('EN'),
+                self._afetch_language('KR'),
+            ))
 
             logger.info(f"Found {len(articles)} articles from {self.source_name}")
-            self.wait()
 
-            return articles[:30]
+            return articles
 
         except Exception as e:
             logger.error(f"Error fetching from {self.source_name}: {e}")
             return []
 
-    def _fetch_language(self, lang: str) -> List[Dict]:
-        """Fetch articles for a specific language"""
+    def _merge_languages(self, results: List[List]) -> List[Dict]:
+        """Merge (seq, article) lists, keeping the first article per seq"""
         articles = []
+        seen_seqs = set()
+
+        for language_articles in results:
+            for seq, article in language_articles:
+                if seq not in seen_seqs:
+                    seen_seqs.add(seq)
+                    articles.append(article)
+
+        # Sort by date descending
+        articles.sort(key=lambda x: x.get('date', '1900-01-01'), reverse=True)
+
+        return articles[:30]
 
+    def _list_params(self, lang: str) -> Dict:
+        """Query parameters for the blog list API"""
+        today = datetime.now().strftime('%Y%m%d')
+        return {
+            'pg': 1,
+            'pgSz': 30,
+            'schExpsYn': 'Y',
+            'schLangTp': lang,
+            'schExpsYmd': today
+        }
+
+    def _fetch_language(self, lang: str) -> List:
+        """Fetch articles for a specific language"""
         try:
-            today = datetime.now().strftime('%Y%m%d')
-            params = {
-                'pg': 1,
-                'pgSz': 30,
-                'schExpsYn': 'Y',
-                'schLangTp': lang,
-                'schExpsYmd': today
-            }
-
-            response = requests.get(
+            return conditional_get(
                 self.API_URL,
-                params=params,
-                headers=self.headers,
-                timeout=30
+                self.headers,
+                lambda response: self._parse_response(response.json(), lang),
+                params=self._list_params(lang),
+                scope=self.cache_scope,
+                volatile_params=self.VOLATILE_PARAMS
             )
-            response.raise_for_status()
-
-            data = response.json()
-
-            if data.get('status') != 200:
-                logger.warning(f"API returned status {data.get('status')} for {lang}")
-                return []
 
-            items = data.get('data', {}).get('list', [])
-            logger.info(f"Found {len(items)} {lang} articles from API")
+        except Exception as e:
+            logger.warning(f"Error fetching {lang} articles: {e}")
+            return []
 
-            for item in items:
-                try:
-                    result = self._parse_item(item, lang)
-                    if result:
-                        articles.append(result)  # (seq, article) tuple
-                except Exception as e:
-                    logger.debug(f"Error parsing item: {e}")
-                    continue
+    async def _afetch_language(self, lang: str) -> List:
+        """Async counterpart of `_fetch_language`"""
+        try:
+            return await aconditional_get(
+                self.API_URL,
+                self.headers,
+                lambda response: self._parse_response(response.json(), lang),
+                params=self._list_params(lang),
+                scope=self.cache_scope,
+                volatile_params=self.VOLATILE_PARAMS
+            )
 
         except Exception as e:
             logger.warning(f"Error fetching {lang} articles: {e}")
+            return []
+
+    def _parse_response(self, data: Dict, lang: str) -> List:
+        """Parse a blog list API response into (seq, article) tuples"""
+        if data.get('status') != 200:
+            logger.warning(f"API returned status {data.get('status')} for {lang}")
+            return []
+
+        items = data.get('data', {}).get('list', [])
+        logger.info(f"Found {len(items)} {lang} articles from API")
+
+        articles = []
+        for item in self.new_items(items, lambda item: self._item_url(item.get('seq'))):
+            try:
+                result = self._parse_item(item, lang)
+                if result:
+                    articles.append(result)  # (seq, article) tuple
+            except Exception as e:
+                logger.debug(f"Error parsing item: {e}")
+                continue
 
         return articles
 
+    @staticmethod
+    def _item_url(seq) -> str:
+        """Blog detail page of an API item"""
+        return f"https://www.lgresearch.ai/blog/view?seq={seq}" if seq else ''
+
     def _parse_item(self, item: Dict, lang: str):
         """Parse a single API item into article format
 
@@ -113,26 +159,11 @@ class LGResearchScraper(BaseScraper):
         if not title or not seq:
             return None
 
-        # Parse date from expsYmd (YYYYMMDD format)
-        date_str = ''
-        exps_ymd = item.get('expsYmd', '')
-        if exps_ymd and len(exps_ymd) == 8:
-            try:
-                date_str = f"{exps_ymd[:4]}-{exps_ymd[4:6]}-{exps_ymd[6:8]}"
-            except Exception:
-                pass
-
-        # Fallback to rgstYmd
-        if not date_str:
-            rgst_ymd = item.get('rgstYmd', '')
-            if rgst_ymd and len(rgst_ymd) == 8:
-                try:
-                    date_str = f"{rgst_ymd[:4]}-{rgst_ymd[4:6]}-{rgst_ymd[6:8]}"
-                except Exception:
-                    pass
+        # Parse date from expsYmd (YYYYMMDD format), falling back to rgstYmd
+        date_str = to_iso(item.get('expsYmd') or '') or to_iso(item.get('rgstYmd') or '')
 
         # Build URL - blog detail page with query parameter
-        url = f"https://www.lgresearch.ai/blog/view?seq={seq}"
+        url = self._item_url(seq)
 
         # Extract tags/categories
         categories = []
@@ -152,16 +183,9 @@ class LGResearchScraper(BaseScraper):
         if catg_cd in catg_mapping and catg_mapping[catg_cd] not in categories:
             categories.insert(0, catg_mapping[catg_cd])
 
-        # Extract summary from content (first paragraph, strip HTML)
-        summary = ''
-        cont = item.get('cont', '')
-        if cont:
-            # Remove HTML tags
-            text = re.sub(r'<[^>]+>', ' ', cont)
-            # Remove extra whitespace
-            text = re.sub(r'\s+', ' ', text).strip()
-            if text:
-                summary = text[:300]
+        # Summary from content: normalize_article strips the HTML and cuts
+        # it at the cleaner's length limit
+        summary = item.get('cont', '')
 
         # Add language indicator if Korean
         if lang == 'KR':
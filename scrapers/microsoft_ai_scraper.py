@@ -5,6 +5,7 @@ Scrapes AI-related articles from Microsoft's news portal
 
 from typing import List, Dict
 from .html_scraper import HTMLScraper
+from .dates import to_iso
 from bs4 import BeautifulSoup
 import re
 
@@ -15,12 +16,8 @@ class MicrosoftAIScraper(HTMLScraper):
     def __init__(self, source_name: str, url: str, user_agent: str, delay: float = 1.5):
         super().__init__(source_name, url, user_agent, delay)
 
-    def fetch(self) -> List[Dict]:
-        """Fetch articles from Microsoft AI News"""
-        soup = self.fetch_page()
-        if not soup:
-            return []
-
+    def parse(self, soup: BeautifulSoup) -> List[Dict]:
+        """Extract articles from Microsoft AI News"""
         articles = []
 
         # Find all article links
@@ -78,7 +75,7 @@ class MicrosoftAIScraper(HTMLScraper):
 
                 # Normalize date format
                 if date:
-                    date = self._normalize_date(date)
+                    date = to_iso(date)
 
                 article = {
                     'title': title,
@@ -96,14 +93,3 @@ class MicrosoftAIScraper(HTMLScraper):
                 continue
 
         return [self.normalize_article(article) for article in articles]
-
-    def _normalize_date(self, date_str: str) -> str:
-        """Normalize various date formats to YYYY-MM-DD"""
-        try:
-            from dateutil import parser
-            # Parse date string
-            dt = parser.parse(date_str)
-            return dt.strftime('%Y-%m-%d')
-        except Exception:
-            # If parsing fails, return original or empty
-            return date_str if re.match(r'\d{4}-\d{2}-\d{2}', date_str) else ''
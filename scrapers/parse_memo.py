@@ -0,0 +1,165 @@
+"""
+Content-hash parse memo
+Stores the articles extracted from a response body on disk, keyed by
+scraper class, parser version and a hash of the body. Servers that ignore
+conditional requests still skip BeautifulSoup/feedparser when the bytes
+did not change. Entries are evicted least-recently-used past a size cap.
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .base import logger
+from .cache import cache_path
+
+
+class ParseMemo:
+    """Size-bounded on-disk LRU of parse results"""
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self._sizes: Optional[Dict[str, int]] = None
+
+    def _index(self) -> Dict[str, int]:
+        """Sizes of stored entries by key, scanned once per process"""
+        if self._sizes is None:
+            self._sizes = {}
+            if self.directory.exists():
+                for entry in os.scandir(self.directory):
+                    if entry.name.endswith('.json'):
+                        self._sizes[entry.name[:-5]] = entry.stat().st_size
+        return self._sizes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Dropping unreadable parse memo {path}: {e}")
+            return None
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value):
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        if len(data) > self.max_bytes:
+            return
+
+        with self.lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            sizes = self._index()
+            sizes[key] = len(data)
+            self._evict(sizes)
+
+    def _evict(self, sizes: Dict[str, int]):
+        """Remove least recently used entries until under the size cap"""
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        by_age = []
+        for key in sizes:
+            try:
+                by_age.append((self._path(key).stat().st_mtime, key))
+            except OSError:
+                by_age.append((0, key))
+        by_age.sort()
+
+        for _, key in by_age:
+            if total <= self.max_bytes:
+                break
+            total -= sizes.pop(key)
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+
+_memo: Optional[ParseMemo] = None
+_memo_enabled = True
+_memo_max_bytes = 20 * 1024 * 1024
+
+
+def configure_parse_memo(settings: Dict):
+    """Apply parse memo settings from config.yaml"""
+    global _memo, _memo_enabled, _memo_max_bytes
+    _memo_enabled = settings.get('parse_memo', True)
+    _memo_max_bytes = int(settings.get('parse_memo_mb', 20) * 1024 * 1024)
+    _memo = None
+
+
+def get_parse_memo() -> Optional[ParseMemo]:
+    """Return the shared parse memo, or None when disabled"""
+    global _memo
+    if not _memo_enabled:
+        return None
+    if _memo is None:
+        _memo = ParseMemo(cache_path('parse'), _memo_max_bytes)
+    return _memo
+
+
+def memo_key(scraper, content: bytes) -> str:
+    """Key for the result of parsing `content` with `scraper`"""
+    scraper_class = type(scraper)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{scraper_class.__module__}.{scraper_class.__qualname__}".encode())
+    # cache_scope covers PARSER_VERSION and config-driven rules
+    digest.update(f"|{scraper.cache_scope}|{getattr(scraper, 'parser', '')}|".encode())
+    digest.update(f"{scraper.source_name}|{scraper.url}|".encode())
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def memoized_parse(scraper, content: bytes, parse: Callable[[], Any]):
+    """Return the memoized result for `content`, calling `parse` on a miss"""
+    memo = get_parse_memo()
+    if memo is None:
+        return parse()
+
+    key = memo_key(scraper, content)
+    result = memo.get(key)
+    if result is not None:
+        logger.info(f"Unchanged content for {scraper.source_name}, reusing parsed articles")
+        return result
+
+    result = parse()
+    memo.put(key, result)
+    return result
+
+
+async def amemoized_parse(scraper, content: bytes, parse: Callable[[], Awaitable]):
+    """Async counterpart of `memoized_parse` for an awaitable `parse`"""
+    memo = get_parse_memo()
+    if memo is None:
+        return await parse()
+
+    key = memo_key(scraper, content)
+    result = memo.get(key)
+    if result is not None:
+        logger.info(f"Unchanged content for {scraper.source_name}, reusing parsed articles")
+        return result
+
+    result = await parse()
+    memo.put(key, result)
+    return result
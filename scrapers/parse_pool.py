@@ -0,0 +1,124 @@
+"""
+Parse stage
+Scrapers fetch on threads (or the event loop) and hand the downloaded body
+to this stage. With `parse_workers` set, extraction runs in a pool of
+worker processes that stay up for the whole run and import the parsers
+once, so BeautifulSoup and lxml work is spread over every core instead of
+contending for the GIL. Without it, parsing runs inline as before.
+"""
+import asyncio
+import atexit
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+from typing import Dict, Optional
+
+from .base import logger
+from .deadline import DeadlineExceeded, remaining
+
+_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_workers = 0
+_settings: Dict = {}
+
+
+def configure_parse_pool(settings: Dict):
+    """Apply parse stage settings from config.yaml"""
+    global _workers, _settings
+    shutdown_parse_pool()
+    workers = settings.get('parse_workers', 0)
+    if workers == 'auto':
+        workers = os.cpu_count() or 1
+    _workers = int(workers or 0)
+    _settings = dict(settings)
+
+
+def _warm_up(settings: Dict):
+    """Worker initializer: configure parsing and import the scrapers once"""
+    global _workers
+    # Workers parse inline; forked workers would otherwise inherit the pool setting
+    _workers = 0
+    from .html_scraper import configure_html_parser
+    from . import plan_scraper, rss_scraper  # noqa: F401
+    configure_html_parser(settings)
+
+
+def get_parse_pool() -> Optional[concurrent.futures.ProcessPoolExecutor]:
+    """Return the shared worker pool, or None when parsing runs inline"""
+    global _pool
+    if _workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a process that runs fetch threads can deadlock
+            _pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_warm_up,
+                initargs=(_settings,)
+            )
+            logger.info(f"Parsing on {_workers} worker processes")
+        return _pool
+
+
+def shutdown_parse_pool():
+    """
+    Stop the worker processes (a later parse starts a new pool)
+
+    Queued parses are cancelled and workers still busy with a parse that
+    outlived its deadline are terminated, so no worker survives the run.
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is None:
+        return
+    processes = list((getattr(pool, '_processes', None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    for process in processes:
+        process.join()
+
+
+atexit.register(shutdown_parse_pool)
+
+
+def _run(scraper, method: str, argument):
+    return getattr(scraper, method)(argument)
+
+
+def run_parse(scraper, method: str, argument):
+    """
+    Call `scraper.<method>(argument)` in the parse stage
+
+    The scraper is pickled to the worker, so its parse methods must only
+    depend on the scraper's attributes and the argument. Waiting is capped
+    by the current source's deadline.
+    """
+    pool = get_parse_pool()
+    if pool is None:
+        return _run(scraper, method, argument)
+
+    future = pool.submit(_run, scraper, method, argument)
+    try:
+        return future.result(timeout=remaining())
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise DeadlineExceeded(f"Parsing {scraper.source_name} ran out of time")
+
+
+async def arun_parse(scraper, method: str, argument):
+    """Async counterpart of `run_parse`"""
+    pool = get_parse_pool()
+    if pool is None:
+        return _run(scraper, method, argument)
+
+    future = pool.submit(_run, scraper, method, argument)
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), remaining())
+    except asyncio.TimeoutError:
+        future.cancel()
+        raise DeadlineExceeded(f"Parsing {scraper.source_name} ran out of time")
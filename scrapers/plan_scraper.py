@@ -0,0 +1,257 @@
+r"""
+Extraction plan scraper
+HTML sources described in config.yaml instead of code: an item selector,
+field selectors, date formats and URL joining are compiled once into lxml
+XPath (or CSS) expressions and run directly on the lxml document, without
+building a BeautifulSoup tree.
+
+Example:
+    - name: "Baidu Research"
+      type: "html"
+      url: "http://research.baidu.com/Blog"
+      extract:
+        items: "//a[re:test(@href, '/Blog/index-view\\?id=\\d+')]"
+        fields:
+          title: ".//div[contains(@class, 'blog-title')]"
+          summary: ".//div[contains(@class, 'blog-introduce')]"
+          date: ".//div[contains(@class, 'blog-date')]"
+"""
+import hashlib
+import json
+import re
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+
+from .dates import to_iso
+from .html_scraper import HTMLScraper, logger
+
+# Namespaces available in XPath selectors (re:test, re:match, re:replace)
+NAMESPACES = {'re': 'http://exslt.org/regular-expressions'}
+
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([A-Za-z0-9._-]+)', re.IGNORECASE)
+
+# Article fields a plan may select; other keys in `fields` are rejected
+FIELDS = ('title', 'url', 'date', 'summary', 'author', 'categories')
+
+
+def compile_selector(selector: str) -> Callable:
+    """XPath selector, or CSS when prefixed with 'css:'"""
+    if selector.startswith('css:'):
+        try:
+            from lxml.cssselect import CSSSelector
+        except ImportError:
+            raise ValueError(f"CSS selector '{selector}' needs the cssselect package")
+        return CSSSelector(selector[4:].strip(), namespaces=NAMESPACES)
+    return etree.XPath(selector, namespaces=NAMESPACES)
+
+
+def _text(value) -> str:
+    """Whitespace-collapsed text of an XPath result (element or string)"""
+    if isinstance(value, str):
+        text = value
+    elif isinstance(value, etree._Element):
+        text = value.text_content()
+    else:
+        text = str(value)
+    return ' '.join(text.split())
+
+
+class FieldPlan:
+    """
+    Compiled selector for one article field
+
+    A field spec is a selector string or a mapping with:
+        select:  XPath relative to the item (or 'css:' selector)
+        attr:    read this attribute of the selected elements instead of their text
+        pattern: regex applied to the text; group 1 (or the whole match) is kept
+        all:     keep every match as a list (default for categories)
+    """
+
+    def __init__(self, spec, many: bool = False):
+        if isinstance(spec, str):
+            spec = {'select': spec}
+        self.select = compile_selector(spec['select'])
+        self.attr = spec.get('attr')
+        self.pattern = re.compile(spec['pattern']) if spec.get('pattern') else None
+        self.many = spec.get('all', many)
+
+    def _values(self, item) -> List[str]:
+        results = self.select(item)
+        if not isinstance(results, list):
+            results = [results]
+        values = []
+        for result in results:
+            if self.attr is not None and isinstance(result, etree._Element):
+                text = ' '.join(result.get(self.attr, '').split())
+            else:
+                text = _text(result)
+            if self.pattern:
+                match = self.pattern.search(text)
+                if not match:
+                    continue
+                text = match.group(1) if match.groups() else match.group(0)
+            if text:
+                values.append(text)
+                if not self.many:
+                    break
+        return values
+
+    def extract(self, item):
+        values = self._values(item)
+        if self.many:
+            return values
+        return values[0] if values else ''
+
+
+class ExtractionPlan:
+    """
+    Compiled `extract` settings of a source
+
+        items:        selector for one element per article
+        fields:       field name -> selector (see FieldPlan); url defaults to '@href'
+        date_formats: strptime formats tried before the shared date recognizers
+        base_url:     base for relative URLs (default: the listing URL)
+        categories:   categories added to every article
+        required:     fields an article must have (default: title and url)
+        min_title_length: shorter titles are skipped
+        limit:        maximum number of articles
+    """
+
+    def __init__(self, spec: Dict):
+        self.spec = spec
+        unknown = set(spec.get('fields', {})) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown extract fields: {', '.join(sorted(unknown))}")
+
+        self.items = compile_selector(spec['items'])
+        fields = {'url': '@href', **spec.get('fields', {})}
+        self.fields = {
+            name: FieldPlan(field, many=(name == 'categories'))
+            for name, field in fields.items()
+        }
+        self.date_formats = list(spec.get('date_formats', []))
+        self.base_url = spec.get('base_url')
+        self.categories = list(spec.get('categories', []))
+        self.required = list(spec.get('required', ['title', 'url']))
+        self.min_title_length = spec.get('min_title_length', 0)
+        self.limit = spec.get('limit')
+        self.fingerprint = hashlib.blake2b(
+            json.dumps(spec, sort_keys=True).encode(), digest_size=4
+        ).hexdigest()
+
+    def parse_date(self, text: str) -> str:
+        for fmt in self.date_formats:
+            try:
+                return datetime.strptime(text, fmt).strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+        return to_iso(text)
+
+    def item_url(self, item, base_url: str) -> str:
+        """Absolute URL of an item, read without extracting the other fields"""
+        try:
+            href = self.fields['url'].extract(item)
+        except Exception:
+            return ''
+        return urljoin(base_url, href) if href else ''
+
+    def run(self, document, base_url: str, new_items: Optional[Callable] = None) -> List[Dict]:
+        """
+        Raw article dicts for the items in `document`
+
+        `new_items` (BaseScraper.new_items) filters the items by URL before
+        their fields are extracted.
+        """
+        base_url = self.base_url or base_url
+        articles = []
+        seen_urls = set()
+
+        items = self.items(document)
+        if new_items is not None:
+            items = new_items(items, lambda item: self.item_url(item, base_url))
+
+        for item in items:
+            try:
+                article = {name: field.extract(item) for name, field in self.fields.items()}
+            except Exception as e:
+                logger.debug(f"Error extracting item: {e}")
+                continue
+
+            if any(not article.get(name) for name in self.required):
+                continue
+            if len(article.get('title', '')) < self.min_title_length:
+                continue
+
+            url = urljoin(base_url, article['url']) if article.get('url') else ''
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+
+            article['url'] = url
+            article['date'] = self.parse_date(article['date']) if article.get('date') else ''
+            article['categories'] = self.categories + [
+                c for c in article.get('categories', []) if c not in self.categories
+            ]
+            articles.append(article)
+
+            if self.limit and len(articles) >= self.limit:
+                break
+
+        return articles
+
+
+class PlanScraper(HTMLScraper):
+    """
+    HTML scraper driven by an extraction plan
+
+    The plan comes from the source's `extract` setting in config.yaml, or
+    from the PLAN attribute of a subclass.
+    """
+
+    PLAN: Dict = {}
+
+    def __init__(self, source_name: str, url: str, user_agent: str, delay: float = 1.5,
+                 extract: Optional[Dict] = None):
+        super().__init__(source_name, url, user_agent, delay)
+        self.plan = ExtractionPlan(extract if extract is not None else self.PLAN)
+
+    def __getstate__(self):
+        # Compiled XPath cannot be pickled (parse stage workers); keep the spec
+        state = self.__dict__.copy()
+        state['plan'] = self.plan.spec
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.plan = ExtractionPlan(self.plan)
+
+    @property
+    def parser(self) -> str:
+        return 'lxml'
+
+    @property
+    def cache_scope(self) -> str:
+        # Cached results also depend on the plan
+        return f"{super().cache_scope}/{self.plan.fingerprint}"
+
+    def make_document(self, content: bytes):
+        """lxml document for a downloaded page"""
+        match = META_CHARSET.search(content[:4096])
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+        try:
+            parser = lxml.html.HTMLParser(encoding=encoding)
+        except LookupError:
+            parser = lxml.html.HTMLParser(encoding='utf-8')
+        return lxml.html.document_fromstring(content, parser=parser)
+
+    def parse_content(self, content: bytes) -> List[Dict]:
+        """Run the plan on the page and normalize the articles"""
+        document = self.make_document(content)
+        return [
+            self.normalize_article(article)
+            for article in self.plan.run(document, self.listing_url, self.new_items)
+        ]
@@ -2,26 +2,37 @@
 Playwright-based Dynamic Scraper base class
 JavaScript rendering support for dynamic websites
 """
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from typing import Any, List, Dict, Optional
+import asyncio
+import re
+from bs4 import BeautifulSoup, SoupStrainer
 from .base import BaseScraper, logger
-
-# Playwright is optional - only import when needed
-try:
-    from playwright.sync_api import sync_playwright, Browser, Page
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
-    logger.warning("Playwright not installed. Dynamic scraping will be disabled.")
+from .html_scraper import build_soup, get_html_parser
+from .rate_limit import get_rate_limiter
+from .browser_pool import get_browser_pool, PLAYWRIGHT_AVAILABLE
 
 
 class PlaywrightScraper(BaseScraper):
-    """Base class for scrapers that need JavaScript rendering"""
+    """
+    Base class for scrapers that need JavaScript rendering
+
+    Pages are rendered on the process-wide browser pool, so a dynamic
+    source costs a page load rather than a browser launch.
+
+    Sites that load their data as JSON (XHR/fetch) can skip the DOM
+    entirely: set CAPTURE_PATTERNS to regexes matching those request URLs
+    and call `fetch_captured()`, which returns the parsed response bodies
+    and stops navigating as soon as they have all arrived.
+    """
+
+    # Regexes (searched in the request URL) of JSON responses to intercept
+    CAPTURE_PATTERNS: List[str] = []
+
+    # Elements the scraper reads from rendered pages; None builds the whole document
+    PARSE_ONLY: Optional[SoupStrainer] = None
 
     def __init__(self, source_name: str, url: str, user_agent: str, delay: float = 1.5):
         super().__init__(source_name, url, user_agent, delay)
-        self.browser: Optional[Browser] = None
-        self.playwright = None
         self._wait_for_selector: Optional[str] = None  # CSS selector to wait for
         self._wait_timeout: int = 30000  # milliseconds
 
@@ -35,6 +46,30 @@ class PlaywrightScraper(BaseScraper):
             return False
         return True
 
+    def make_soup(self, html_content: str) -> BeautifulSoup:
+        """Build the parse tree for a rendered page with the configured backend (see HTMLScraper)"""
+        return build_soup(html_content, get_html_parser(), self.PARSE_ONLY)
+
+    def _render_job(self, target_url: str, selector: Optional[str], timeout: int):
+        """Page job: navigate, wait for the selector and return the HTML"""
+        async def render(page):
+            logger.info(f"Fetching {target_url} with Playwright...")
+
+            # Navigate to page
+            await page.goto(target_url, wait_until='networkidle', timeout=timeout)
+
+            # Wait for specific selector if provided
+            if selector:
+                try:
+                    await page.wait_for_selector(selector, timeout=timeout)
+                except Exception as e:
+                    logger.warning(f"Selector '{selector}' not found: {e}")
+
+            # Get rendered HTML
+            return await page.content()
+
+        return render
+
     def fetch_page_dynamic(
         self,
         url: Optional[str] = None,
@@ -52,46 +87,183 @@ class PlaywrightScraper(BaseScraper):
         Returns:
             BeautifulSoup object or None on error
         """
+        return self.fetch_pages_dynamic([url or self.url], wait_for, wait_timeout)[0]
+
+    def fetch_pages_dynamic(
+        self,
+        urls: List[str],
+        wait_for: Optional[str] = None,
+        wait_timeout: Optional[int] = None
+    ) -> List[Optional[BeautifulSoup]]:
+        """
+        Render several pages concurrently on the shared browser
+
+        Returns:
+            One BeautifulSoup object (or None on error) per URL, in order
+        """
         if not self._ensure_playwright():
-            return None
+            return [None] * len(urls)
 
-        target_url = url or self.url
         selector = wait_for or self._wait_for_selector
         timeout = wait_timeout or self._wait_timeout
+        pool = get_browser_pool()
+
+        futures = []
+        for target_url in urls:
+            get_rate_limiter().acquire(target_url)
+            try:
+                futures.append(pool.submit(self.user_agent, self._render_job(target_url, selector, timeout)))
+            except Exception as e:
+                logger.error(f"Error fetching {target_url} with Playwright: {e}")
+                futures.append(None)
+
+        results = []
+        for target_url, future in zip(urls, futures):
+            try:
+                html_content = pool.result(future) if future else None
+                results.append(self.make_soup(html_content) if html_content else None)
+            except Exception as e:
+                logger.error(f"Error fetching {target_url} with Playwright: {e}")
+                results.append(None)
+
+        return results
+
+    async def afetch_page_dynamic(
+        self,
+        url: Optional[str] = None,
+        wait_for: Optional[str] = None,
+        wait_timeout: Optional[int] = None
+    ) -> Optional[BeautifulSoup]:
+        """Async counterpart of `fetch_page_dynamic`"""
+        if not self._ensure_playwright():
+            return None
+
+        target_url = url or self.url
+        job = self._render_job(
+            target_url,
+            wait_for or self._wait_for_selector,
+            wait_timeout or self._wait_timeout
+        )
 
         try:
-            with sync_playwright() as p:
-                # Launch headless browser
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent=self.user_agent,
-                    viewport={'width': 1920, 'height': 1080}
-                )
-                page = context.new_page()
+            await get_rate_limiter().aacquire(target_url)
+            html_content = await get_browser_pool().arun(self.user_agent, job)
+            return self.make_soup(html_content)
+        except Exception as e:
+            logger.error(f"Error fetching {target_url} with Playwright: {e}")
+            return None
+
+    def _capture_job(self, target_url: str, patterns: List[str], timeout: int):
+        """Page job: navigate until every pattern has a JSON response"""
+        compiled = [(pattern, re.compile(pattern)) for pattern in patterns]
+
+        async def capture(page):
+            captured: Dict[str, Any] = {}
+            reads = []
+            done = asyncio.Event()
+            if not compiled:
+                done.set()
+
+            async def read(pattern, response):
+                try:
+                    captured[pattern] = await response.json()
+                except Exception as e:
+                    logger.warning(f"Captured response {response.url} is not JSON: {e}")
+                    captured[pattern] = None
+                if len(captured) == len(compiled):
+                    done.set()
+
+            def on_response(response):
+                for pattern, regex in compiled:
+                    if pattern not in captured and regex.search(response.url):
+                        # Claim the pattern now so later matches are ignored
+                        captured.setdefault(pattern, None)
+                        reads.append(asyncio.ensure_future(read(pattern, response)))
+                        break
 
-                logger.info(f"Fetching {target_url} with Playwright...")
+            # Stylesheets only matter for rendering, which we skip
+            async def skip_styles(route):
+                if route.request.resource_type == 'stylesheet':
+                    await route.abort()
+                else:
+                    await route.fallback()
 
-                # Navigate to page
-                page.goto(target_url, wait_until='networkidle', timeout=timeout)
+            await page.route('**/*', skip_styles)
+            page.on('response', on_response)
 
-                # Wait for specific selector if provided
-                if selector:
-                    try:
-                        page.wait_for_selector(selector, timeout=timeout)
-                    except Exception as e:
-                        logger.warning(f"Selector '{selector}' not found: {e}")
+            logger.info(f"Capturing {len(compiled)} JSON responses from {target_url}...")
+            await page.goto(target_url, wait_until='commit', timeout=timeout)
 
-                # Get rendered HTML
-                html_content = page.content()
+            try:
+                await asyncio.wait_for(done.wait(), timeout / 1000)
+            except asyncio.TimeoutError:
+                missing = [p for p, _ in compiled if captured.get(p) is None]
+                logger.warning(f"Timed out waiting for responses matching {missing}")
+            if reads:
+                await asyncio.gather(*reads, return_exceptions=True)
+
+            return {pattern: captured.get(pattern) for pattern, _ in compiled}
+
+        return capture
+
+    def fetch_captured(
+        self,
+        url: Optional[str] = None,
+        patterns: Optional[List[str]] = None,
+        wait_timeout: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Load a page and return the JSON bodies of matching network responses
 
-                # Clean up
-                browser.close()
+        Args:
+            url: URL to load (defaults to self.url)
+            patterns: URL regexes to intercept (defaults to CAPTURE_PATTERNS)
+            wait_timeout: Timeout in milliseconds
 
-                return BeautifulSoup(html_content, 'html.parser')
+        Returns:
+            Parsed JSON per pattern (None when nothing matched in time);
+            empty dict on error
+        """
+        if not self._ensure_playwright():
+            return {}
 
+        target_url = url or self.url
+        job = self._capture_job(
+            target_url,
+            patterns or self.CAPTURE_PATTERNS,
+            wait_timeout or self._wait_timeout
+        )
+
+        try:
+            get_rate_limiter().acquire(target_url)
+            return get_browser_pool().run(self.user_agent, job)
         except Exception as e:
-            logger.error(f"Error fetching {target_url} with Playwright: {e}")
-            return None
+            logger.error(f"Error capturing responses from {target_url}: {e}")
+            return {}
+
+    async def afetch_captured(
+        self,
+        url: Optional[str] = None,
+        patterns: Optional[List[str]] = None,
+        wait_timeout: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of `fetch_captured`"""
+        if not self._ensure_playwright():
+            return {}
+
+        target_url = url or self.url
+        job = self._capture_job(
+            target_url,
+            patterns or self.CAPTURE_PATTERNS,
+            wait_timeout or self._wait_timeout
+        )
+
+        try:
+            await get_rate_limiter().aacquire(target_url)
+            return await get_browser_pool().arun(self.user_agent, job)
+        except Exception as e:
+            logger.error(f"Error capturing responses from {target_url}: {e}")
+            return {}
 
     def fetch_with_scroll(
         self,
@@ -115,32 +287,26 @@ class PlaywrightScraper(BaseScraper):
 
         target_url = url or self.url
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent=self.user_agent,
-                    viewport={'width': 1920, 'height': 1080}
-                )
-                page = context.new_page()
-
-                logger.info(f"Fetching {target_url} with scroll support...")
+        async def scroll(page):
+            logger.info(f"Fetching {target_url} with scroll support...")
 
-                page.goto(target_url, wait_until='networkidle', timeout=self._wait_timeout)
+            await page.goto(target_url, wait_until='networkidle', timeout=self._wait_timeout)
 
-                # Scroll down multiple times
-                for i in range(scroll_count):
-                    page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                    page.wait_for_timeout(scroll_delay)
-                    logger.debug(f"Scroll {i + 1}/{scroll_count}")
+            # Scroll down multiple times
+            for i in range(scroll_count):
+                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+                await page.wait_for_timeout(scroll_delay)
+                logger.debug(f"Scroll {i + 1}/{scroll_count}")
 
-                # Wait for any lazy-loaded content
-                page.wait_for_timeout(1000)
+            # Wait for any lazy-loaded content
+            await page.wait_for_timeout(1000)
 
-                html_content = page.content()
-                browser.close()
+            return await page.content()
 
-                return BeautifulSoup(html_content, 'html.parser')
+        try:
+            get_rate_limiter().acquire(target_url)
+            html_content = get_browser_pool().run(self.user_agent, scroll)
+            return self.make_soup(html_content)
 
         except Exception as e:
             logger.error(f"Error fetching {target_url} with scroll: {e}")
@@ -0,0 +1,202 @@
+"""
+Per-host rate limiting
+A token bucket per host, refilled at one request per `request_delay`
+seconds (or the host's robots.txt Crawl-delay, whichever is longer).
+Requests wait before they are sent, so nothing sleeps after a host's
+last request and different hosts never wait on each other.
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from .base import logger
+from .cache import open_store
+from .deadline import DeadlineExceeded, bounded, remaining
+
+# Re-read robots.txt once a day
+ROBOTS_TTL = 24 * 60 * 60
+
+
+class TokenBucket:
+    """Thread-safe token bucket handing out reservations"""
+
+    def __init__(self, interval: float, burst: int):
+        self.interval = interval
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait to use it"""
+        with self.lock:
+            now = time.monotonic()
+            if self.interval > 0:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+            else:
+                self.tokens = float(self.capacity)
+            self.updated = now
+
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens * self.interval
+
+
+class HostRateLimiter:
+    """
+    Schedules requests per host
+
+    Host policy comes from, in order: per-source overrides in config.yaml
+    (`crawl_delay`, `burst`), the host's robots.txt `Crawl-delay`, and the
+    global `request_delay` / `burst` settings.
+    """
+
+    def __init__(self, user_agent: str = '*', default_interval: float = 1.5,
+                 default_burst: int = 1, respect_robots: bool = True):
+        self.user_agent = user_agent
+        self.default_interval = default_interval
+        self.default_burst = default_burst
+        self.respect_robots = respect_robots
+
+        self.overrides: Dict[str, Dict] = {}
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+        self.host_locks: Dict[str, threading.Lock] = {}
+
+    def set_host_policy(self, host: str, interval: Optional[float] = None,
+                        burst: Optional[int] = None):
+        """Override the schedule for one host"""
+        policy = self.overrides.setdefault(host.lower(), {})
+        if interval is not None:
+            policy['interval'] = float(interval)
+        if burst is not None:
+            policy['burst'] = int(burst)
+        self.buckets.pop(host.lower(), None)
+
+    def _bucket(self, url: str) -> TokenBucket:
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+
+        bucket = self.buckets.get(host)
+        if bucket is not None:
+            return bucket
+
+        with self.lock:
+            host_lock = self.host_locks.setdefault(host, threading.Lock())
+
+        # Only one thread reads robots.txt for a host
+        with host_lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self._create_bucket(parsed.scheme or 'https', host)
+                self.buckets[host] = bucket
+            return bucket
+
+    def _create_bucket(self, scheme: str, host: str) -> TokenBucket:
+        override = self.overrides.get(host, {})
+        interval = self.default_interval
+        burst = self.default_burst
+
+        crawl_delay = self._crawl_delay(scheme, host) if self.respect_robots else None
+        if crawl_delay is not None:
+            interval = max(interval, crawl_delay)
+            burst = 1
+
+        interval = override.get('interval', interval)
+        burst = override.get('burst', burst)
+
+        logger.debug(f"Rate limit for {host}: 1 request / {interval}s, burst {burst}")
+        return TokenBucket(interval, burst)
+
+    def _crawl_delay(self, scheme: str, host: str) -> Optional[float]:
+        """Crawl-delay from the host's robots.txt, cached between runs"""
+        store = open_store('robots.json')
+        entry = store.get(host)
+        if entry and time.time() - entry.get('fetched_at', 0) < ROBOTS_TTL:
+            return entry.get('crawl_delay')
+
+        crawl_delay = None
+        robots_url = f"{scheme}://{host}/robots.txt"
+        try:
+            # Straight through the pooled session: robots.txt lookups are not
+            # rate limited, retried or counted against the source's health
+            from .transport import get_transport
+            response = get_transport().session.get(
+                robots_url,
+                headers={'User-Agent': self.user_agent},
+                timeout=bounded(10)
+            )
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+            parser = RobotFileParser(robots_url)
+            parser.parse(response.text.splitlines())
+            delay = parser.crawl_delay(self.user_agent)
+            if delay is not None:
+                crawl_delay = float(delay)
+                logger.info(f"robots.txt for {host} sets Crawl-delay: {crawl_delay}s")
+        except Exception as e:
+            logger.debug(f"No usable robots.txt at {robots_url}: {e}")
+
+        store.set(host, {'crawl_delay': crawl_delay, 'fetched_at': time.time()})
+        return crawl_delay
+
+    def acquire(self, url: str):
+        """Block until a request to `url` may be sent"""
+        delay = self._bucket(url).reserve()
+        if delay > 0:
+            self._check_budget(url, delay)
+            time.sleep(delay)
+
+    async def aacquire(self, url: str):
+        """Async counterpart of `acquire`"""
+        host = urlparse(url).netloc.lower()
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            # robots.txt lookup is blocking, keep it off the event loop
+            bucket = await asyncio.to_thread(self._bucket, url)
+        delay = bucket.reserve()
+        if delay > 0:
+            self._check_budget(url, delay)
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _check_budget(url: str, delay: float):
+        """Refuse to wait longer than the current deadline allows"""
+        left = remaining()
+        if left is not None and delay > left:
+            raise DeadlineExceeded(f"Rate limit wait for {url} exceeds the deadline")
+
+
+_limiter: Optional[HostRateLimiter] = None
+
+
+def configure_rate_limiter(settings: Dict, sources: Optional[list] = None) -> HostRateLimiter:
+    """Create the shared limiter from config.yaml settings and source overrides"""
+    global _limiter
+    limiter = HostRateLimiter(
+        user_agent=settings.get('user_agent', '*'),
+        default_interval=settings.get('request_delay', 1.5),
+        default_burst=settings.get('burst', 1),
+        respect_robots=settings.get('respect_robots', True),
+    )
+    for source in sources or []:
+        if 'crawl_delay' in source or 'burst' in source:
+            limiter.set_host_policy(
+                urlparse(source['url']).netloc,
+                interval=source.get('crawl_delay'),
+                burst=source.get('burst'),
+            )
+    _limiter = limiter
+    return limiter
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Return the shared limiter, creating it with defaults if needed"""
+    global _limiter
+    if _limiter is None:
+        _limiter = HostRateLimiter()
+    return _limiter
@@ -0,0 +1,134 @@
+"""
+Relevance filtering
+Scores articles against weighted keywords so broad feeds (corporate news,
+company blogs) can be narrowed to the topics we aggregate. All keywords
+are compiled into one word-boundary regex shaped like a trie, so a scan
+costs about the same with twenty keywords or thousands.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+Keywords = Union[Dict[str, float], Iterable[str]]
+
+
+def _weights(keywords: Keywords) -> Dict[str, float]:
+    """{keyword: weight} with lowercase keywords; a list weighs 1 each"""
+    if not isinstance(keywords, dict):
+        keywords = {keyword: 1.0 for keyword in keywords}
+    return {keyword.lower(): float(weight) for keyword, weight in keywords.items()}
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Alternation of `words` with shared prefixes factored out"""
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def render(node: Dict) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if '' in node:
+            # A keyword ends here; longer keywords are tried first
+            return f"(?:{body})?"
+        return body
+
+    return render(trie)
+
+
+class RelevanceClassifier:
+    """
+    Weighted keyword classifier for articles
+
+    keywords:   {keyword: weight}, or a list of keywords weighing 1 each.
+                Keywords match whole words in the title and summary, case
+                insensitively; negative weights count against an article.
+    threshold:  minimum score of a relevant article
+    categories: article categories that make an article relevant on their own
+    """
+
+    def __init__(self, keywords: Keywords, threshold: float = 1.0, categories: Iterable[str] = ()):
+        self.weights = _weights(keywords)
+        self.threshold = threshold
+        self.categories = frozenset(category.lower() for category in categories)
+
+        # With no negative weights the scan can stop as soon as the threshold is met
+        self.can_stop_early = all(weight >= 0 for weight in self.weights.values())
+        self.pattern = re.compile(
+            rf'(?<!\w){_trie_pattern(self.weights)}(?!\w)', re.IGNORECASE
+        ) if self.weights else None
+
+    @property
+    def rules(self) -> Dict:
+        return {
+            'keywords': self.weights,
+            'threshold': self.threshold,
+            'categories': sorted(self.categories),
+        }
+
+    def with_rules(self, rules: Optional[Dict]) -> 'RelevanceClassifier':
+        """
+        Classifier with a source's `relevance` setting applied on top of these rules
+
+        Keywords and categories are added to the existing ones (a keyword that
+        is already known takes the new weight); `threshold` replaces this one.
+        """
+        if not rules:
+            return self
+        return classifier_from_rules({
+            'keywords': {**self.weights, **_weights(rules.get('keywords', {}))},
+            'threshold': rules.get('threshold', self.threshold),
+            'categories': self.categories | {category.lower() for category in rules.get('categories', ())},
+        })
+
+    def score(self, article: Dict) -> float:
+        """Sum of the weights of the distinct keywords in the title and summary"""
+        if self.pattern is None:
+            return 0.0
+        text = f"{article.get('title', '')}\n{article.get('summary', '')}"
+        seen = set()
+        score = 0.0
+        for match in self.pattern.finditer(text):
+            keyword = match.group().lower()
+            if keyword in seen:
+                continue
+            seen.add(keyword)
+            score += self.weights[keyword]
+            if self.can_stop_early and score >= self.threshold:
+                break
+        return score
+
+    def is_relevant(self, article: Dict) -> bool:
+        # Categories first (most reliable)
+        if self.categories and any(
+            category.lower() in self.categories for category in article.get('categories', [])
+        ):
+            return True
+        return self.score(article) >= self.threshold
+
+    def filter(self, articles: List[Dict]) -> List[Dict]:
+        return [article for article in articles if self.is_relevant(article)]
+
+
+@lru_cache(maxsize=64)
+def get_classifier(
+    keywords: Tuple[Tuple[str, float], ...],
+    threshold: float = 1.0,
+    categories: Tuple[str, ...] = ()
+) -> RelevanceClassifier:
+    """Shared classifier for a set of rules"""
+    return RelevanceClassifier(dict(keywords), threshold, categories)
+
+
+def classifier_from_rules(rules: Dict) -> RelevanceClassifier:
+    """Classifier for a source's `relevance` setting in config.yaml"""
+    return get_classifier(
+        tuple(sorted(_weights(rules.get('keywords', {})).items())),
+        float(rules.get('threshold', 1.0)),
+        tuple(sorted(category.lower() for category in rules.get('categories', ())))
+    )
@@ -0,0 +1,75 @@
+"""
+Known-URL index
+Per-source record of the article URLs already published, kept as 64-bit
+hashes in the cache directory. Scrapers consult it while extracting so
+known items are skipped before they are built, and a run of known items
+ends the listing early; the aggregator merges the previously published
+articles back in.
+"""
+import base64
+import hashlib
+from typing import Dict, Iterable, List, Optional
+
+STORE = 'seen_urls.json'
+
+_enabled = True
+
+
+def configure_seen_index(settings: Dict):
+    """Apply known-URL index settings from config.yaml"""
+    global _enabled
+    _enabled = settings.get('seen_index', True)
+
+
+def url_hash(url: str) -> int:
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class SeenIndex:
+    """Set of URL hashes for one source"""
+
+    def __init__(self, hashes: Iterable[int] = ()):
+        self.hashes = set(hashes)
+
+    def __contains__(self, url: str) -> bool:
+        return url_hash(url) in self.hashes
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def add(self, urls: Iterable[str]):
+        self.hashes.update(url_hash(url) for url in urls if url)
+
+    def encode(self) -> str:
+        return base64.b64encode(b''.join(h.to_bytes(8, 'big') for h in sorted(self.hashes))).decode('ascii')
+
+    @classmethod
+    def decode(cls, text: str) -> 'SeenIndex':
+        raw = base64.b64decode(text) if text else b''
+        return cls(int.from_bytes(raw[i:i + 8], 'big') for i in range(0, len(raw) - 7, 8))
+
+
+def load_seen_index(source_name: str) -> Optional[SeenIndex]:
+    """Known URLs of a source, or None when the index is disabled"""
+    if not _enabled:
+        return None
+    from .cache import open_store  # scrapers.cache imports scrapers.base, which imports this module
+    return SeenIndex.decode(open_store(STORE).get(source_name, ''))
+
+
+def record_published(articles: List[Dict]):
+    """Add the URLs of published articles to their sources' indexes"""
+    if not _enabled:
+        return
+    by_source: Dict[str, List[str]] = {}
+    for article in articles:
+        by_source.setdefault(article.get('source', ''), []).append(article.get('url', ''))
+
+    from .cache import open_store
+    store = open_store(STORE)
+    for source_name, urls in by_source.items():
+        index = SeenIndex.decode(store.get(source_name, ''))
+        size = len(index)
+        index.add(urls)
+        if len(index) != size:
+            store.set(source_name, index.encode())
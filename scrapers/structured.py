@@ -0,0 +1,272 @@
+"""
+Structured data extraction
+Many listing pages embed their articles as JSON: JSON-LD (ItemList,
+BlogPosting, NewsArticle, ...), Next.js `__NEXT_DATA__` and Nuxt
+`__NUXT_DATA__` / `window.__NUXT__` state, and OpenGraph tags on article
+pages. The blobs are located with byte patterns and decoded with json, so
+no parse tree is built; HTMLScraper falls back to DOM parsing when a page
+has none.
+"""
+import json
+import re
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+
+from .base import logger
+
+JSON_LD = re.compile(
+    rb'<script[^>]*type=["\']?application/ld\+json["\']?[^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+NEXT_DATA = re.compile(
+    rb'<script[^>]*id=["\']?__NEXT_DATA__["\']?[^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+NUXT_DATA = re.compile(
+    rb'<script[^>]*id=["\']?__NUXT_DATA__["\']?[^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+# Only the plain-object form; Nuxt 2 also emits a function call, which is not JSON
+NUXT_STATE = re.compile(rb'window\.__NUXT__\s*=\s*(\{.*?\})\s*;?\s*</script>', re.DOTALL)
+META_TAG = re.compile(rb'<meta\s[^>]*>', re.IGNORECASE)
+META_ATTR = re.compile(rb'(property|name|content)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+
+# Cheap test before running any of the patterns above
+MARKERS = (b'ld+json', b'__NEXT_DATA__', b'__NUXT', b'og:type')
+
+ARTICLE_TYPES = {
+    'Article', 'BlogPosting', 'NewsArticle', 'TechArticle', 'ScholarlyArticle',
+    'Report', 'PressRelease', 'AnalysisNewsArticle', 'SocialMediaPosting',
+}
+
+TITLE_KEYS = ('headline', 'title', 'name')
+URL_KEYS = ('url', 'href', 'link', 'permalink', 'path', 'uri')
+DATE_KEYS = (
+    'datePublished', 'publishedAt', 'published_at', 'publishDate', 'publishedDate',
+    'publishedOn', 'date', 'dateCreated', 'createdAt', 'created_at',
+)
+SUMMARY_KEYS = ('description', 'summary', 'excerpt', 'abstract', 'subtitle', 'dek')
+CATEGORY_KEYS = ('articleSection', 'categories', 'category', 'tags', 'keywords')
+
+# Nuxt 3 payload wrappers around a single value
+NUXT_WRAPPERS = {'Reactive', 'ShallowReactive', 'Ref', 'ShallowRef', 'EmptyRef', 'EmptyShallowRef'}
+
+
+def extract_structured(content: bytes, base_url: str, slug_url: Optional[str] = None) -> List[Dict]:
+    """
+    Raw article dicts from the structured data embedded in a page
+
+    Args:
+        content: Page body
+        base_url: URL of the page, for relative links
+        slug_url: Template such as 'https://example.com/blog/{slug}' used
+            for app-state entries that carry a slug but no URL
+
+    Returns:
+        Articles (title, url, date, summary, author, categories) in page
+        order, without duplicates; empty when the page has no usable data
+    """
+    if not any(marker in content for marker in MARKERS):
+        return []
+
+    articles = []
+    for match in JSON_LD.finditer(content):
+        articles.extend(_json_ld_articles(_load(match.group(1))))
+
+    # App state only counts entries that look like articles (title, link and date)
+    for pattern in (NEXT_DATA, NUXT_STATE):
+        match = pattern.search(content)
+        if match:
+            articles.extend(_state_articles(_load(match.group(1)), slug_url))
+    match = NUXT_DATA.search(content)
+    if match:
+        articles.extend(_state_articles(_revive_nuxt(_load(match.group(1))), slug_url))
+
+    if not articles:
+        page = _opengraph_article(content)
+        if page:
+            articles.append(page)
+
+    unique = []
+    seen_urls = set()
+    for article in articles:
+        url = urljoin(base_url, article['url'])
+        if url in seen_urls:
+            continue
+        seen_urls.add(url)
+        unique.append({**article, 'url': url})
+    return unique
+
+
+def _load(blob: bytes):
+    try:
+        return json.loads(blob.decode('utf-8', errors='replace').strip(), strict=False)
+    except ValueError as e:
+        logger.debug(f"Skipping undecodable structured data: {e}")
+        return None
+
+
+def _walk(data) -> Iterator[Dict]:
+    """Every dict nested in `data`, parents before children"""
+    stack = [data]
+    seen = set()
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (dict, list)):
+            # Revived Nuxt state may share or cycle through objects
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+        if isinstance(value, dict):
+            yield value
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+
+
+def _json_ld_articles(data) -> Iterator[Dict]:
+    for node in _walk(data):
+        types = node.get('@type')
+        if isinstance(types, list):
+            types = {t for t in types if isinstance(t, str)}
+        else:
+            types = {types} if isinstance(types, str) else set()
+        if types & ARTICLE_TYPES or ('ListItem' in types and not isinstance(node.get('item'), dict)):
+            article = _article(node)
+            if article:
+                yield article
+
+
+def _state_articles(data, slug_url: Optional[str]) -> Iterator[Dict]:
+    for node in _walk(data):
+        if not any(isinstance(node.get(key), str) for key in DATE_KEYS):
+            continue
+        article = _article(node, slug_url)
+        if article:
+            yield article
+
+
+def _article(node: Dict, slug_url: Optional[str] = None) -> Optional[Dict]:
+    title = _first_text(node, TITLE_KEYS)
+    url = _url(node, slug_url)
+    if not title or not url:
+        return None
+    return {
+        'title': title,
+        'url': url,
+        'date': _first_text(node, DATE_KEYS),
+        'summary': _first_text(node, SUMMARY_KEYS),
+        'author': _names(node.get('author')),
+        'categories': _categories(node),
+    }
+
+
+def _first_text(node: Dict, keys) -> str:
+    for key in keys:
+        value = node.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return ''
+
+
+def _url(node: Dict, slug_url: Optional[str]) -> str:
+    url = _first_text(node, URL_KEYS)
+    if not url:
+        item = node.get('item') or node.get('mainEntityOfPage')
+        if isinstance(item, str):
+            url = item
+        elif isinstance(item, dict):
+            url = _first_text(item, ('@id', 'url'))
+    if not url and isinstance(node.get('@id'), str) and node['@id'].startswith('http'):
+        url = node['@id']
+    if not url and slug_url:
+        slug = node.get('slug')
+        if isinstance(slug, dict):
+            slug = slug.get('current')
+        if isinstance(slug, str) and slug:
+            url = slug_url.format(slug=slug)
+    return url
+
+
+def _names(value) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return value.get('name', '') if isinstance(value.get('name'), str) else ''
+    if isinstance(value, list):
+        return ', '.join(filter(None, (_names(v) for v in value)))
+    return ''
+
+
+def _categories(node: Dict) -> List[str]:
+    for key in CATEGORY_KEYS:
+        value = node.get(key)
+        if isinstance(value, str) and value:
+            return [part.strip() for part in value.split(',') if part.strip()]
+        if isinstance(value, list):
+            names = [v if isinstance(v, str) else _names(v) or _first_text(v, ('title',))
+                     for v in value if isinstance(v, (str, dict))]
+            return [name for name in names if name]
+    return []
+
+
+def _revive_nuxt(payload):
+    """Rebuild Nuxt 3 state from its flat payload (values refer to array indices)"""
+    if not isinstance(payload, list) or not payload:
+        return None
+    revived = {}
+
+    def revive(index, depth=0):
+        if not isinstance(index, int) or not 0 <= index < len(payload) or depth > 50:
+            return None
+        if index in revived:
+            return revived[index]
+        value = payload[index]
+        if isinstance(value, list):
+            if len(value) == 2 and value[0] in NUXT_WRAPPERS:
+                return revive(value[1], depth + 1)
+            if value and isinstance(value[0], str):
+                # Other special forms (Date, Set, Map, ...) carry no article data
+                revived[index] = value[1] if value[0] == 'Date' and len(value) > 1 else None
+                return revived[index]
+            result = revived[index] = []
+            result.extend(revive(i, depth + 1) for i in value)
+            return result
+        if isinstance(value, dict):
+            result = revived[index] = {}
+            for key, i in value.items():
+                result[key] = revive(i, depth + 1)
+            return result
+        return value
+
+    return revive(0)
+
+
+def _opengraph_article(content: bytes) -> Optional[Dict]:
+    """The page itself as an article when its OpenGraph type is article"""
+    properties = {}
+    for tag in META_TAG.finditer(content[:65536]):
+        key = value = None
+        for name, double, single in META_ATTR.findall(tag.group()):
+            text = (double or single).decode('utf-8', errors='replace')
+            if name.lower() == b'content':
+                value = text
+            else:
+                key = text
+        if key and value is not None:
+            properties.setdefault(key, value)
+
+    if properties.get('og:type') != 'article':
+        return None
+    title = properties.get('og:title', '').strip()
+    url = properties.get('og:url', '').strip()
+    if not title or not url:
+        return None
+    return {
+        'title': title,
+        'url': url,
+        'date': properties.get('article:published_time', ''),
+        'summary': properties.get('og:description', ''),
+        'author': properties.get('article:author', ''),
+        'categories': [properties['article:section']] if properties.get('article:section') else [],
+    }
@@ -0,0 +1,135 @@
+"""
+Text cleaning
+Turns the HTML fragments sources put in summaries into plain text: tags
+dropped, entities decoded, whitespace collapsed, feed boilerplate removed
+and the result cut to a length limit. Markup and entities are handled by
+one compiled pattern, so each summary is scanned once instead of once per
+rule; rules can be set per source in config.yaml.
+"""
+import hashlib
+import html
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+# A tag, or an entity exactly as html.unescape recognizes it
+MARKUP = re.compile(
+    r'<[^>]+>|&(?:#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)'
+)
+
+# Link text feeds append after the summary
+DEFAULT_SUFFIXES = ('Read Article', 'Read More', 'Continue Reading')
+
+# WordPress feeds end with "The post <title> appeared first on <site>."
+DEFAULT_FOOTERS = (('The post ', ' appeared first on '),)
+
+
+def _replace_markup(match) -> str:
+    token = match.group()
+    if token[0] == '<':
+        return ' '
+    return html.unescape(token)
+
+
+class TextCleaner:
+    """
+    Compiled cleaning rules for article text
+
+    suffixes:      phrases removed from the end of a summary (any case)
+    footers:       (opening, marker) pairs; the summary is cut from the first
+                   `opening` that is followed by `marker`
+    max_length:    summaries longer than this end in '...' at this length
+    decode_titles: decode HTML entities left in titles
+    """
+
+    def __init__(
+        self,
+        suffixes: Iterable[str] = DEFAULT_SUFFIXES,
+        footers: Iterable[Sequence[str]] = DEFAULT_FOOTERS,
+        max_length: Optional[int] = 500,
+        decode_titles: bool = False
+    ):
+        self.suffixes = tuple(suffix.lower() for suffix in suffixes)
+        self.footers = tuple((opening.lower(), marker.lower()) for opening, marker in footers)
+        self.max_length = max_length
+        self.decode_titles = decode_titles
+
+    @property
+    def rules(self) -> Dict:
+        return {
+            'suffixes': self.suffixes,
+            'footers': self.footers,
+            'max_length': self.max_length,
+            'decode_titles': self.decode_titles,
+        }
+
+    @property
+    def fingerprint(self) -> str:
+        """Short digest of the rules, for keys of cached cleaned results"""
+        return hashlib.blake2b(repr(sorted(self.rules.items())).encode(), digest_size=4).hexdigest()
+
+    def with_rules(self, rules: Optional[Dict]) -> 'TextCleaner':
+        """Cleaner with `rules` (from a source's `text` setting) replacing these"""
+        if not rules:
+            return self
+        merged = {**self.rules, **rules}
+        return get_cleaner(
+            tuple(merged['suffixes']),
+            tuple(tuple(footer) for footer in merged['footers']),
+            merged['max_length'],
+            bool(merged['decode_titles'])
+        )
+
+    def clean(self, text: str) -> str:
+        """Plain text from an HTML fragment, at most `max_length` characters"""
+        if not text:
+            return ''
+        if '<' in text or '&' in text:
+            text = MARKUP.sub(_replace_markup, text)
+        text = ' '.join(text.split())
+
+        if self.suffixes or self.footers:
+            text = self._strip_boilerplate(text)
+
+        if self.max_length is not None and len(text) > self.max_length:
+            text = text[:self.max_length - 3] + '...'
+        return text
+
+    def title(self, text: str) -> str:
+        """Title with entities decoded when the source needs it"""
+        if self.decode_titles and text and '&' in text:
+            return html.unescape(text)
+        return text
+
+    def _strip_boilerplate(self, text: str) -> str:
+        lowered = text.lower()
+        for opening, marker in self.footers:
+            start = lowered.find(opening)
+            if start != -1 and lowered.find(marker, start + len(opening)) != -1:
+                text = text[:start].rstrip()
+                lowered = text.lower()
+
+        # Suffixes may be stacked ("... Read More Continue Reading")
+        stripped = True
+        while stripped and text:
+            stripped = False
+            for suffix in self.suffixes:
+                if lowered.endswith(suffix):
+                    text = text[:len(text) - len(suffix)].rstrip()
+                    lowered = text.lower()
+                    stripped = True
+        return text
+
+
+@lru_cache(maxsize=None)
+def get_cleaner(
+    suffixes: Tuple[str, ...] = DEFAULT_SUFFIXES,
+    footers: Tuple[Tuple[str, str], ...] = DEFAULT_FOOTERS,
+    max_length: Optional[int] = 500,
+    decode_titles: bool = False
+) -> TextCleaner:
+    """Shared cleaner for a set of rules"""
+    return TextCleaner(suffixes, footers, max_length, decode_titles)
+
+
+DEFAULT_CLEANER = get_cleaner()
@@ -0,0 +1,355 @@
+"""
+Shared HTTP transport for all scrapers
+Keep-alive connection pools per host, compressed transfers, uniform
+timeouts and response size caps for both blocking and async requests
+"""
+import asyncio
+import json
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .base import logger
+from .rate_limit import get_rate_limiter
+from .health import current_outcomes
+from .deadline import DeadlineExceeded, bounded, check_deadline, expired, remaining
+
+# aiohttp is optional - fall back to threaded requests without it
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logger.warning("aiohttp not installed. Async scraping will run requests in threads.")
+
+# Brotli is optional - only advertise it when responses can be decoded
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+CHUNK_SIZE = 64 * 1024
+
+# Statuses worth retrying; everything else fails immediately
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_BACKOFF = 60
+
+
+class TransportError(Exception):
+    """Base class for errors raised by the transport"""
+
+
+class HTTPStatusError(TransportError):
+    """Server answered with a non-2xx status"""
+
+    def __init__(self, url: str, status: int, retry_after: Optional[str] = None):
+        super().__init__(f"HTTP {status} for {url}")
+        self.url = url
+        self.status = status
+        # Only the delta-seconds form of Retry-After is honored
+        self.retry_after = float(retry_after) if retry_after and retry_after.isdigit() else None
+
+
+class ResponseTooLarge(TransportError):
+    """Response body exceeded the configured size cap"""
+
+    def __init__(self, url: str, limit: int):
+        super().__init__(f"Response from {url} exceeds {limit} bytes")
+        self.url = url
+        self.limit = limit
+
+
+class Response:
+    """Fully downloaded HTTP response"""
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], content: bytes):
+        self.url = url
+        self.status = status
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class HTTPTransport:
+    """
+    Pooled HTTP client shared by every scraper
+
+    Blocking requests go through one `requests.Session` whose adapter keeps
+    a keep-alive pool per host. Async requests use one aiohttp session per
+    event loop with the same per-host limit.
+    """
+
+    def __init__(self, timeout: float = 30, max_response_bytes: int = 10 * 1024 * 1024,
+                 pool_size: int = 10, connect_timeout: float = 10,
+                 max_retries: int = 2, retry_backoff: float = 1.0):
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_response_bytes = max_response_bytes
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, 'aiohttp.ClientSession'] = {}
+
+    def _request_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        merged = {'Accept-Encoding': ACCEPT_ENCODING}
+        if headers:
+            merged.update(headers)
+        return merged
+
+    def _check_length(self, url: str, headers) -> None:
+        length = headers.get('Content-Length')
+        if length and length.isdigit() and int(length) > self.max_response_bytes:
+            raise ResponseTooLarge(url, self.max_response_bytes)
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        throttle: bool = True
+    ) -> Response:
+        """
+        Download a URL, raising TransportError/requests errors on failure
+
+        Waits for the host's rate limiter first unless `throttle` is False,
+        and retries transient failures with jittered exponential backoff.
+        Timeouts and waits are capped by the current source deadline.
+        A 304 Not Modified answer is returned as a Response with empty content.
+        """
+        host = urlparse(url).netloc.lower()
+        outcomes = current_outcomes()
+        self._fail_fast(host, outcomes)
+
+        attempt = 0
+        while True:
+            check_deadline()
+            if throttle:
+                get_rate_limiter().acquire(url)
+            try:
+                response = self._get_once(url, headers, params, timeout)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                if expired():
+                    raise DeadlineExceeded(f"Deadline exceeded fetching {url}") from e
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    self._record_failure(host, e, outcomes)
+                    raise
+                logger.info(f"Retrying {url} in {delay:.1f}s after: {e}")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if outcomes is not None:
+                outcomes.successes += 1
+            return response
+
+    def _get_once(self, url, headers, params, timeout) -> Response:
+        with self.session.get(
+            url,
+            params=params,
+            headers=self._request_headers(headers),
+            timeout=(bounded(self.connect_timeout), bounded(timeout or self.timeout)),
+            stream=True
+        ) as response:
+            if response.status_code == 304:
+                return Response(response.url, 304, dict(response.headers), b'')
+            if not 200 <= response.status_code < 300:
+                raise HTTPStatusError(response.url, response.status_code,
+                                      response.headers.get('Retry-After'))
+            self._check_length(response.url, response.headers)
+
+            body = bytearray()
+            for chunk in response.iter_content(CHUNK_SIZE):
+                body.extend(chunk)
+                if len(body) > self.max_response_bytes:
+                    raise ResponseTooLarge(response.url, self.max_response_bytes)
+
+            return Response(response.url, response.status_code, dict(response.headers), bytes(body))
+
+    async def aget(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        throttle: bool = True
+    ) -> Response:
+        """Async counterpart of `get`"""
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.to_thread(self.get, url, headers, params, timeout, throttle)
+
+        host = urlparse(url).netloc.lower()
+        outcomes = current_outcomes()
+        self._fail_fast(host, outcomes)
+
+        attempt = 0
+        while True:
+            check_deadline()
+            if throttle:
+                await get_rate_limiter().aacquire(url)
+            try:
+                response = await self._aget_once(url, headers, params, timeout)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                if expired():
+                    raise DeadlineExceeded(f"Deadline exceeded fetching {url}") from e
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    self._record_failure(host, e, outcomes)
+                    raise
+                logger.info(f"Retrying {url} in {delay:.1f}s after: {e}")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if outcomes is not None:
+                outcomes.successes += 1
+            return response
+
+    async def _aget_once(self, url, headers, params, timeout) -> Response:
+        session = self._async_session()
+        async with session.get(
+            url,
+            params=params,
+            headers=self._request_headers(headers),
+            timeout=aiohttp.ClientTimeout(
+                total=bounded(timeout or self.timeout),
+                connect=bounded(self.connect_timeout)
+            )
+        ) as response:
+            final_url = str(response.url)
+            if response.status == 304:
+                return Response(final_url, 304, dict(response.headers), b'')
+            if not 200 <= response.status < 300:
+                raise HTTPStatusError(final_url, response.status, response.headers.get('Retry-After'))
+            self._check_length(final_url, response.headers)
+
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                body.extend(chunk)
+                if len(body) > self.max_response_bytes:
+                    raise ResponseTooLarge(final_url, self.max_response_bytes)
+
+            return Response(final_url, response.status, dict(response.headers), bytes(body))
+
+    def _is_transient(self, error: Exception) -> bool:
+        if isinstance(error, HTTPStatusError):
+            return error.status in RETRY_STATUSES
+        if isinstance(error, (requests.ConnectionError, requests.Timeout, asyncio.TimeoutError)):
+            return True
+        return AIOHTTP_AVAILABLE and isinstance(error, aiohttp.ClientConnectionError)
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None if the error is final"""
+        if attempt >= self.max_retries or not self._is_transient(error):
+            return None
+        # Equal jitter: half of the exponential step is fixed, half random
+        step = self.retry_backoff * 2 ** attempt
+        delay = step / 2 + random.uniform(0, step / 2)
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after:
+            delay = max(delay, retry_after)
+        delay = min(delay, MAX_BACKOFF)
+        # No point sleeping past the source's deadline
+        left = remaining()
+        if left is not None and delay >= left:
+            return None
+        return delay
+
+    def _fail_fast(self, host: str, outcomes) -> None:
+        if outcomes is not None and host in outcomes.dead_hosts:
+            raise TransportError(f"{host} was unreachable earlier in this run")
+
+    def _record_failure(self, host: str, error: Exception, outcomes) -> None:
+        if outcomes is None:
+            return
+        outcomes.failures += 1
+        outcomes.last_error = error
+        if self._is_transient(error) and not isinstance(error, HTTPStatusError):
+            outcomes.dead_hosts.add(host)
+
+    def probe(self, url: str, headers: Optional[Dict[str, str]] = None) -> bool:
+        """Cheap liveness check (HEAD, no retries) used for half-open sources"""
+        get_rate_limiter().acquire(url)
+        try:
+            response = self.session.head(
+                url,
+                headers=self._request_headers(headers),
+                timeout=(self.connect_timeout, self.connect_timeout),
+                allow_redirects=True
+            )
+            # 405: the server is up but does not support HEAD
+            return response.status_code < 400 or response.status_code == 405
+        except Exception as e:
+            logger.debug(f"Probe of {url} failed: {e}")
+            return False
+
+    def _async_session(self) -> 'aiohttp.ClientSession':
+        """Return the aiohttp session bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=self.pool_size)
+            session = aiohttp.ClientSession(connector=connector)
+            self._async_sessions[loop] = session
+        return session
+
+    async def aclose(self):
+        """Close the async session owned by the running event loop"""
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def close(self):
+        """Close pooled blocking connections"""
+        self.session.close()
+
+
+_transport: Optional[HTTPTransport] = None
+_transport_lock = threading.Lock()
+
+
+def configure_transport(settings: Dict) -> HTTPTransport:
+    """Replace the shared transport using values from config.yaml settings"""
+    global _transport
+    with _transport_lock:
+        if _transport is not None:
+            _transport.close()
+        _transport = HTTPTransport(
+            timeout=settings.get('request_timeout', 30),
+            max_response_bytes=int(settings.get('max_response_mb', 10) * 1024 * 1024),
+            pool_size=settings.get('pool_size', 10),
+            connect_timeout=settings.get('connect_timeout', 10),
+            max_retries=settings.get('max_retries', 2),
+            retry_backoff=settings.get('retry_backoff', 1.0),
+        )
+        return _transport
+
+
+def get_transport() -> HTTPTransport:
+    """Return the process-wide transport, creating it with defaults if needed"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport()
+    return _transport
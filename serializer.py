@@ -0,0 +1,120 @@
+"""
+JSON 직렬화
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 처리한다
+"""
+
+import json
+import logging
+from typing import Dict, Iterator, Optional
+
+# orjson은 선택 사항 - 없으면 표준 json 사용
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('auto', 'orjson', 'json')
+
+_backend = 'orjson' if ORJSON_AVAILABLE else 'json'
+_pretty = False
+
+# 표준 json 인코더 (pretty, sort_keys) - 호출마다 새로 만들지 않도록 재사용
+_ENCODERS = {
+    (pretty, sort_keys): json.JSONEncoder(
+        ensure_ascii=False, sort_keys=sort_keys,
+        indent=2 if pretty else None, separators=None if pretty else (',', ':')
+    )
+    for pretty in (False, True) for sort_keys in (False, True)
+}
+
+# 스트리밍 쓰기 때 모아서 내보내는 조각 크기
+CHUNK_SIZE = 64 * 1024
+
+
+def configure_serializer(settings: Dict):
+    """config.yaml의 직렬화 설정 적용 (json_backend, pretty_json)"""
+    global _backend, _pretty
+    backend = settings.get('json_backend', 'auto')
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown json_backend {backend!r} (expected one of {', '.join(BACKENDS)})")
+    if backend == 'orjson' and not ORJSON_AVAILABLE:
+        logger.warning("orjson not installed. Writing JSON with the standard library.")
+    _backend = 'orjson' if backend != 'json' and ORJSON_AVAILABLE else 'json'
+    _pretty = bool(settings.get('pretty_json', False))
+
+
+def output_format() -> str:
+    """현재 출력 형식 (백엔드/들여쓰기), 내용 해시에 함께 넣어 형식이 바뀌면 다시 쓰게 함"""
+    return f"{_backend}/{'pretty' if _pretty else 'compact'}"
+
+
+def dumps(data, pretty: Optional[bool] = None, sort_keys: bool = False) -> bytes:
+    """UTF-8 JSON 바이트 (pretty가 None이면 설정값, True면 2칸 들여쓰기)"""
+    pretty = _pretty if pretty is None else pretty
+    if _backend == 'orjson':
+        option = (orjson.OPT_INDENT_2 if pretty else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(data, option=option)
+    return _ENCODERS[pretty, sort_keys].encode(data).encode('utf-8')
+
+
+def loads(data):
+    """JSON 문자열/바이트 파싱"""
+    if _backend == 'orjson':
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_document(data: Dict, stream_key: str = 'articles', pretty: Optional[bool] = None) -> Iterator[bytes]:
+    """
+    data를 JSON 조각으로 차례로 내보냄 (stream_key의 리스트는 항목 하나씩)
+
+    전체 문서를 한 번에 문자열로 만들지 않으며, 이어 붙인 결과는 dumps(data)와 같다.
+    """
+    pretty = _pretty if pretty is None else pretty
+    if _backend == 'json' and pretty:
+        # 표준 json은 들여쓰기 출력을 어차피 조각 단위로 만든다
+        yield from _buffered(_ENCODERS[True, False].iterencode(data))
+        return
+
+    # 중첩 단계만큼 들여쓰기 (dumps(indent=2)와 같은 모양)
+    inner = b'\n  ' if pretty else b''
+    item = b'\n    ' if pretty else b''
+
+    def nested(value, indent: bytes) -> bytes:
+        encoded = dumps(value, pretty)
+        return encoded.replace(b'\n', indent) if pretty else encoded
+
+    colon = b': ' if pretty else b':'
+    first = True
+    yield b'{'
+    for key, value in data.items():
+        yield (b'' if first else b',') + inner + dumps(key) + colon
+        first = False
+        if key != stream_key or not isinstance(value, list) or not value:
+            yield nested(value, inner)
+            continue
+
+        yield b'['
+        for i, element in enumerate(value):
+            yield (b',' if i else b'') + item + nested(element, item)
+        yield inner + b']'
+    yield (b'\n}' if pretty and not first else b'}')
+
+
+def _buffered(chunks: Iterator[str]) -> Iterator[bytes]:
+    """작은 문자열 조각을 CHUNK_SIZE 정도로 모아 UTF-8 바이트로"""
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= CHUNK_SIZE:
+            yield ''.join(buffer).encode('utf-8')
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
@@ -0,0 +1,133 @@
+import pytest
+
+import article_log
+from article_log import HEADER, MAGIC, NO_DAY, RECORD, ArticleLog
+
+
+def article(n, date, **extra):
+    return {
+        'title': f'Post {n}', 'url': f'https://example.com/{n}', 'date': date,
+        'collected_at': '2025-10-01T00:00:00', **extra
+    }
+
+
+ARTICLES = [
+    article(1, '2025-09-01'),
+    article(2, '2025-10-01'),
+    article(3, ''),
+    article(4, '2025-09-15'),
+]
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = ArticleLog(tmp_path, 'example')
+    assert log.append(ARTICLES)
+    return log
+
+
+def titles(articles):
+    return [a['title'] for a in articles]
+
+
+def test_struct_layout():
+    # On-disk format: changing it needs a new MAGIC
+    assert (HEADER.format, HEADER.size) == ('<4sQ', 12)
+    assert (RECORD.format, RECORD.size) == ('<qQQQI', 36)
+    assert MAGIC == b'NDX1'
+
+
+def test_index_file(log):
+    data = log.index_file.read_bytes()
+    magic, committed = HEADER.unpack_from(data)
+    assert magic == MAGIC
+    assert committed == log.log_file.stat().st_size
+    records = list(RECORD.iter_unpack(data[HEADER.size:]))
+    assert len(records) == len(ARTICLES)
+    # Newest first, undated last
+    assert [r[0] for r in records] == sorted(r[0] for r in records)
+    assert records[-1][0] == -NO_DAY
+    assert sum(r[4] for r in records) == committed
+
+
+def test_latest(log):
+    assert titles(log.latest()) == ['Post 2', 'Post 4', 'Post 1', 'Post 3']
+    assert titles(log.latest(2)) == ['Post 2', 'Post 4']
+    assert log.latest()[0] == ARTICLES[1]
+
+
+def test_between(log):
+    assert titles(log.between('2025-09-01', '2025-09-30')) == ['Post 4', 'Post 1']
+    assert titles(log.between('2025-09-02', '2025-10-01')) == ['Post 2', 'Post 4']
+    assert log.between('2025-11-01', '2025-12-31') == []
+    assert log.between('someday', '2025-12-31') == []
+
+
+def test_summary(log):
+    summary = log.summary(1)
+    assert summary['count'] == 4
+    assert summary['with_dates'] == 3
+    assert summary['latest_date'] == '2025-10-01'
+    assert titles(summary['preview']) == ['Post 2']
+
+
+def test_missing_log(tmp_path):
+    log = ArticleLog(tmp_path, 'missing')
+    assert not log.exists()
+    assert log.latest() == []
+    assert log.between('2025-01-01', '2025-12-31') == []
+    assert log.summary(3)['count'] == 0
+
+
+def test_unchanged_articles_are_not_appended(log):
+    size = log.log_file.stat().st_size
+    recollected = [{**a, 'collected_at': '2025-10-02T00:00:00'} for a in ARTICLES]
+    assert not log.append(recollected)
+    assert log.log_file.stat().st_size == size
+
+
+def test_changed_article_replaces_previous_version(log):
+    assert log.append([article(1, '2025-10-05', title='Post 1 (updated)', collected_at='2025-10-05T00:00:00')])
+    latest = log.latest()
+    assert titles(latest) == ['Post 1 (updated)', 'Post 2', 'Post 4', 'Post 3']
+    # First collection time is kept
+    assert latest[0]['collected_at'] == '2025-10-01T00:00:00'
+
+
+def test_torn_append_is_truncated(log):
+    committed = log.log_file.stat().st_size
+    # Crash after writing part of the log, before the index was committed
+    with open(log.log_file, 'ab') as f:
+        f.write(b'{"title": "Post 5", "url": "https://exa')
+
+    assert log.append([article(5, '2025-10-03')])
+    assert titles(log.latest(2)) == ['Post 5', 'Post 2']
+    data = log.log_file.read_bytes()
+    assert data.count(b'\n') == 5
+    assert HEADER.unpack_from(log.index_file.read_bytes())[1] == len(data) > committed
+
+
+def test_missing_index_is_rebuilt(log):
+    expected = log.latest()
+    with open(log.log_file, 'ab') as f:
+        f.write(b'{"title": "torn')
+    log.index_file.unlink()
+
+    assert not log.append(ARTICLES)
+    assert log.exists()
+    assert log.latest() == expected
+    assert log.log_file.read_bytes().endswith(b'\n')
+
+
+def test_bad_index_is_rejected(log):
+    log.index_file.write_bytes(b'XXXX' + bytes(8))
+    with pytest.raises(ValueError):
+        log.latest()
+
+
+def test_stored_epoch_day_orders_articles(tmp_path):
+    # epoch_day stored by the pipeline (20000 = 2024-10-04) takes precedence over the date text
+    log = ArticleLog(tmp_path, 'days')
+    log.append([article(1, 'N/A', epoch_day=20000), article(2, '2025-01-01')])
+    assert titles(log.latest()) == ['Post 2', 'Post 1']
+    assert article_log._article_day({'date': 'N/A'}) == NO_DAY
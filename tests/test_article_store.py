@@ -0,0 +1,47 @@
+from article_store import ArticleStore
+from data_manager import DataManager
+
+
+def article(n, date, source='Example', **extra):
+    return {
+        'title': f'Post {n}', 'url': f'https://example.com/{n}', 'source': source,
+        'date': date, 'collected_at': '2025-10-01T00:00:00', **extra
+    }
+
+
+def titles(articles):
+    return [a['title'] for a in articles]
+
+
+def test_undated_articles_sort_last(tmp_path):
+    with ArticleStore(tmp_path / 'articles.db') as store:
+        store.upsert([article(1, 'N/A'), article(2, '2025-09-01'), article(3, ''), article(4, '2025-10-01')])
+        assert titles(store.source_articles('Example')) == ['Post 4', 'Post 2', 'Post 1', 'Post 3']
+        summary = store.source_summaries(1)['Example']
+        assert summary['latest_date'] == '2025-10-01'
+        assert summary['with_dates'] == 2
+
+
+def test_upsert_reports_changed_sources(tmp_path):
+    with ArticleStore(tmp_path / 'articles.db') as store:
+        assert store.upsert([article(1, '2025-09-01'), article(2, '2025-09-02', source='Other')]) == {'Example', 'Other'}
+        # Only the collection time differs: nothing to write
+        assert store.upsert([article(1, '2025-09-01', collected_at='2025-10-02T00:00:00')]) == set()
+        # Moving an article marks both sources
+        assert store.upsert([article(1, '2025-09-01', source='Other')]) == {'Example', 'Other'}
+        assert not store.has_source('Example')
+
+
+def test_update_keeps_first_collection_time(tmp_path):
+    with ArticleStore(tmp_path / 'articles.db') as store:
+        store.upsert([article(1, '2025-09-01')])
+        store.upsert([article(1, '2025-09-01', title='Edited', collected_at='2025-10-05T00:00:00')])
+        (stored,) = store.source_articles('Example')
+        assert stored['title'] == 'Edited'
+        assert stored['collected_at'] == '2025-10-01T00:00:00'
+
+
+def test_json_storage_sorts_undated_last(tmp_path):
+    manager = DataManager(str(tmp_path), storage='json')
+    groups = manager._group_by_source([article(1, 'N/A'), article(2, '2025-09-01'), article(3, '2025-10-01')])
+    assert titles(groups['Example']) == ['Post 3', 'Post 2', 'Post 1']
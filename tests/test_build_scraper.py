@@ -0,0 +1,43 @@
+import logging
+
+import pytest
+import yaml
+
+from main import NewsAggregator
+from scrapers.plan_scraper import PlanScraper
+
+EXTRACT = {'items': '//article', 'fields': {'title': './/h2'}}
+
+
+@pytest.fixture
+def aggregator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = tmp_path / 'config.yaml'
+    config.write_text(yaml.safe_dump({
+        'settings': {'user_agent': 'test', 'request_delay': 0, 'seen_index': False, 'storage': 'json'},
+        'sources': [],
+    }))
+    return NewsAggregator(str(config))
+
+
+def source(**extra):
+    return {'name': 'Example', 'type': 'html', 'url': 'https://example.com/blog', 'extract': EXTRACT, **extra}
+
+
+def test_extract_builds_plan_scraper(aggregator):
+    scraper = aggregator._build_scraper(source())
+    assert type(scraper) is PlanScraper
+
+
+def test_extract_with_plan_scraper_subclass(aggregator):
+    class CustomPlanScraper(PlanScraper):
+        pass
+
+    aggregator.scraper_map['custom'] = CustomPlanScraper
+    assert type(aggregator._build_scraper(source(scraper='custom'))) is CustomPlanScraper
+
+
+def test_extract_with_non_plan_scraper_is_rejected(aggregator, caplog):
+    with caplog.at_level(logging.ERROR, logger='main'):
+        assert aggregator._build_scraper(source(scraper='anthropic')) is None
+    assert 'does not take an extraction plan' in caplog.text
@@ -0,0 +1,56 @@
+import pytest
+
+from scrapers.dates import DAY_MONTH_YEAR, MONTH_DAY_YEAR, epoch_day, normalize_date, timestamp_key, to_iso
+
+
+@pytest.mark.parametrize('text,expected', [
+    ('Nov 24, 2025', '2025-11-24'),
+    ('October 28th，2024', '2024-10-28'),
+    ('Oct 28th， 2024', '2024-10-28'),
+    ('Sept. 3 2025', '2025-09-03'),
+    ('30 October 2025', '2025-10-30'),
+    ('Tue, 10 Jun 2025 23:30:00 GMT', '2025-06-10'),
+    ('2025-06-10T23:30:00Z', '2025-06-10'),
+    ('2025/6/10', '2025-06-10'),
+    ('06/10/2025', '2025-06-10'),
+    ('20250610', '2025-06-10'),
+    ('published NOV 24, 2025', '2025-11-24'),
+])
+def test_to_iso(text, expected):
+    assert to_iso(text) == expected
+
+
+@pytest.mark.parametrize('text', [
+    'May 12024',
+    'Mar 1,20245',
+    '130 October 20255',
+    'Feb 30, 2025',
+    'N/A',
+    '',
+])
+def test_not_a_date(text):
+    assert to_iso(text) == ''
+
+
+@pytest.mark.parametrize('text', [
+    'May 12024 units shipped',
+    'you may 3, 2024 be surprised',
+    'Summary 12, 2024',
+    '130 October 2025',
+])
+def test_title_fragments_are_not_dates(text):
+    assert not MONTH_DAY_YEAR.search(text)
+    assert not DAY_MONTH_YEAR.search(text)
+
+
+def test_date_is_stripped_from_title():
+    assert DAY_MONTH_YEAR.sub('', '30 October 2025Gemini 3 technical report').strip() == 'Gemini 3 technical report'
+
+
+def test_epoch_day_and_timestamp_key():
+    assert epoch_day('1970-01-02') == 1
+    assert epoch_day('N/A') is None
+    assert normalize_date('Nov 24, 2025') == ('2025-11-24', epoch_day('2025-11-24'))
+    assert normalize_date('N/A') == ('N/A', None)
+    assert timestamp_key('1970-01-02 01:00:05') == (1, 3605)
+    assert timestamp_key('') == (0, 0)
@@ -0,0 +1,103 @@
+import pytest
+
+from scrapers.fast_feed import parse_feed_entries
+from scrapers.rss_scraper import RSScraper
+from scrapers.transport import Response
+
+FEED_URL = 'https://example.com/blog/feed.xml'
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+  <title>Example Blog</title>
+  <link>https://example.com/blog</link>
+  <item>
+    <title>Scaling  laws &amp; data</title>
+    <link>/blog/scaling-laws</link>
+    <pubDate>Tue, 14 Oct 2025 09:30:00 GMT</pubDate>
+    <dc:creator>Jane Doe</dc:creator>
+    <category>Research</category>
+    <category>LLM</category>
+    <description><![CDATA[<p>We study <b>scaling</b>.</p>]]></description>
+  </item>
+  <item>
+    <title>Permalink only</title>
+    <guid>https://example.com/blog/permalink</guid>
+    <dc:date>2025-09-30T12:00:00Z</dc:date>
+    <content:encoded><![CDATA[<p>Full text</p>]]></content:encoded>
+    <comments>https://example.com/blog/permalink#comments</comments>
+  </item>
+  <item>
+    <title>Unsafe summary</title>
+    <link>https://example.com/blog/unsafe</link>
+    <guid isPermaLink="false">post-3</guid>
+    <description><![CDATA[<p>Hello</p><script>alert(1)</script>]]></description>
+  </item>
+</channel>
+</rss>
+"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example Research</title>
+  <id>urn:example:feed</id>
+  <updated>2025-10-01T00:00:00Z</updated>
+  <entry>
+    <title type="html">Agents &amp;amp; tools</title>
+    <link rel="alternate" href="https://example.com/research/agents"/>
+    <link rel="enclosure" href="https://example.com/agents.pdf"/>
+    <id>urn:example:agents</id>
+    <published>2025-10-01T08:00:00+09:00</published>
+    <updated>2025-10-02T08:00:00Z</updated>
+    <author><name>Lee</name><email>lee@example.com</email></author>
+    <category term="Agents"/>
+    <summary type="html">&lt;p&gt;Tool use&lt;/p&gt;</summary>
+  </entry>
+  <entry>
+    <title>Updated only</title>
+    <id>https://example.com/research/updated</id>
+    <updated>2025-08-15T10:00:00Z</updated>
+    <content type="text">Plain content</content>
+  </entry>
+</feed>
+"""
+
+
+@pytest.fixture
+def scraper():
+    return RSScraper(source_name='Example', url=FEED_URL, user_agent='test', delay=0)
+
+
+def feedparser_entries(scraper, content, content_type='application/xml'):
+    response = Response(FEED_URL, 200, {'Content-Type': content_type}, content)
+    return scraper._parse_with_feedparser(response)
+
+
+@pytest.mark.parametrize('content', [RSS, ATOM], ids=['rss', 'atom'])
+def test_matches_feedparser(scraper, content):
+    entries = parse_feed_entries(content, base_url=FEED_URL, content_type='application/xml')
+    assert entries is not None
+    assert entries == feedparser_entries(scraper, content)
+
+
+def test_rss_fields():
+    first, second, third = parse_feed_entries(RSS, base_url=FEED_URL)
+    assert first['url'] == 'https://example.com/blog/scaling-laws'
+    assert first['date'] == '2025-10-14'
+    assert first['categories'] == ['Research', 'LLM']
+    assert second['url'] == 'https://example.com/blog/permalink'
+    assert second['date'] == '2025-09-30'
+    assert 'script' not in third['summary']
+
+
+@pytest.mark.parametrize('content,content_type', [
+    (RSS.replace(b'</channel>', b'<item><title>Broken</item></channel>'), ''),
+    (RSS.replace(b'<rss ', b'<!DOCTYPE rss>\n<rss '), ''),
+    (ATOM.replace(b'<feed ', b'<feed xml:base="https://example.com/" '), ''),
+    (RSS.replace(b'version="2.0"', b'version="0.91"'), ''),
+    (RSS, 'application/xml; charset=iso-8859-1'),
+    (ATOM.replace(b'<title>Updated only</title>', b'<title type="xhtml">Updated only</title>'), ''),
+], ids=['malformed', 'doctype', 'xml-base', 'rss-0.91', 'charset-mismatch', 'xhtml'])
+def test_falls_back_to_feedparser(content, content_type):
+    assert parse_feed_entries(content, base_url=FEED_URL, content_type=content_type) is None
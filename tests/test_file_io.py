@@ -0,0 +1,98 @@
+import ctypes
+import errno
+import os
+import stat
+
+import pytest
+
+import file_io
+from file_io import atomic_write, publish_tree
+
+
+@pytest.fixture
+def umask_022():
+    previous = os.umask(0o022)
+    yield
+    os.umask(previous)
+
+
+def mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_atomic_write_replaces_content(tmp_path):
+    path = tmp_path / 'data' / 'index.json'
+    assert atomic_write(path, b'{"a":1}') == 7
+    assert atomic_write(path, [b'{"a"', b':2}']) == 7
+    assert path.read_bytes() == b'{"a":2}'
+    assert [p.name for p in path.parent.iterdir()] == ['index.json']
+
+
+def test_atomic_write_new_file_follows_umask(tmp_path, umask_022):
+    path = tmp_path / 'index.json'
+    atomic_write(path, b'{}')
+    assert mode(path) == 0o644
+
+
+def test_atomic_write_keeps_existing_mode(tmp_path, umask_022):
+    path = tmp_path / 'index.json'
+    path.write_bytes(b'{}')
+    os.chmod(path, 0o640)
+    atomic_write(path, b'[]')
+    assert mode(path) == 0o640
+
+
+def test_published_files_stay_readable(tmp_path, umask_022):
+    src = tmp_path / 'data' / 'index.json'
+    atomic_write(src, b'{}')
+    publish_tree({'index.json': src}, tmp_path / 'docs' / 'data')
+    assert mode(tmp_path / 'docs' / 'data' / 'index.json') == 0o644
+
+
+def failing_renameat2(code):
+    def renameat2(*args):
+        ctypes.set_errno(code)
+        return -1
+    return renameat2
+
+
+def test_exchange_swaps_directories(tmp_path):
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'a' / 'from-a').write_bytes(b'')
+    (tmp_path / 'b').mkdir()
+    if not file_io._exchange(tmp_path / 'a', tmp_path / 'b'):
+        pytest.skip('renameat2 RENAME_EXCHANGE not supported here')
+    assert (tmp_path / 'b' / 'from-a').exists()
+    assert not (tmp_path / 'a' / 'from-a').exists()
+
+
+def test_exchange_errors_are_raised(tmp_path):
+    if file_io._renameat2() is None:
+        pytest.skip('no renameat2')
+    (tmp_path / 'a').mkdir()
+    with pytest.raises(FileNotFoundError):
+        file_io._exchange(tmp_path / 'a', tmp_path / 'missing')
+
+
+@pytest.mark.parametrize('code', [errno.ENOSYS, errno.EINVAL])
+def test_unsupported_exchange_falls_back(tmp_path, monkeypatch, code):
+    monkeypatch.setattr(file_io, '_renameat2', lambda: failing_renameat2(code))
+    src = tmp_path / 'index.json'
+    atomic_write(src, b'{}')
+    publish_tree({'index.json': src}, tmp_path / 'out')
+    # Published files are hardlinks: sources are replaced, never rewritten in place
+    atomic_write(src, b'[]')
+    assert publish_tree({'index.json': src}, tmp_path / 'out') == 1
+    assert (tmp_path / 'out' / 'index.json').read_bytes() == b'[]'
+
+
+def test_failed_exchange_is_not_a_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_io, '_renameat2', lambda: failing_renameat2(errno.EACCES))
+    src = tmp_path / 'index.json'
+    atomic_write(src, b'{}')
+    publish_tree({'index.json': src}, tmp_path / 'out')
+    # Published files are hardlinks: sources are replaced, never rewritten in place
+    atomic_write(src, b'[]')
+    with pytest.raises(PermissionError):
+        publish_tree({'index.json': src}, tmp_path / 'out')
+    assert (tmp_path / 'out' / 'index.json').read_bytes() == b'{}'
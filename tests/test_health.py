@@ -0,0 +1,203 @@
+import pytest
+import requests
+import yaml
+
+from main import NewsAggregator
+from scrapers import cache, health, rate_limit, transport
+from scrapers.health import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, current_outcomes, track_requests
+from scrapers.rate_limit import HostRateLimiter
+from scrapers.transport import HTTPStatusError, HTTPTransport, Response, TransportError
+
+HOUR = 3600
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, '_cache_dir', tmp_path / '.cache')
+    monkeypatch.setattr(cache, '_stores', {})
+    # No robots.txt lookups and no waits between stubbed requests
+    monkeypatch.setattr(rate_limit, '_limiter', HostRateLimiter(default_interval=0, respect_robots=False))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(health, 'time', fake)
+    return fake
+
+
+def fail(breaker, times, name='Example'):
+    for _ in range(times):
+        breaker.record_failure(name)
+
+
+def test_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=HOUR)
+    fail(breaker, 2)
+    assert breaker.state('Example') == CLOSED
+
+    fail(breaker, 1)
+    assert breaker.state('Example') == OPEN
+    assert breaker.health('Example')['open_until'] == clock.now + HOUR
+
+    clock.now += HOUR
+    assert breaker.state('Example') == HALF_OPEN
+
+
+def test_cooldown_doubles_up_to_max(clock):
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=HOUR, max_cooldown=5 * HOUR)
+    cooldowns = []
+    for _ in range(5):
+        fail(breaker, 1)
+        open_until = breaker.health('Example')['open_until']
+        cooldowns.append(open_until - clock.now if open_until else None)
+
+    assert cooldowns == [None, HOUR, 2 * HOUR, 4 * HOUR, 5 * HOUR]
+
+
+def test_success_closes_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=HOUR)
+    fail(breaker, 1)
+    assert breaker.state('Example') == OPEN
+
+    breaker.record_success('Example')
+    assert breaker.state('Example') == CLOSED
+    assert breaker.health('Example')['consecutive_failures'] == 0
+    assert breaker.health('Example')['last_success']
+
+
+def test_sources_are_independent(clock):
+    breaker = CircuitBreaker(failure_threshold=1)
+    fail(breaker, 1, 'Broken')
+    assert breaker.state('Broken') == OPEN
+    assert breaker.state('Healthy') == CLOSED
+
+
+def test_state_survives_between_runs(clock, monkeypatch):
+    fail(CircuitBreaker(failure_threshold=1, cooldown=HOUR), 1)
+    cache.save_caches()
+
+    monkeypatch.setattr(cache, '_stores', {})
+    assert CircuitBreaker(failure_threshold=1).state('Example') == OPEN
+
+
+def test_track_requests_scopes_outcomes():
+    assert current_outcomes() is None
+    with track_requests() as outer:
+        assert current_outcomes() is outer
+        with track_requests() as inner:
+            assert current_outcomes() is inner
+        assert current_outcomes() is outer
+    assert current_outcomes() is None
+
+
+def stub_transport(monkeypatch, *results, max_retries=0):
+    """HTTPTransport whose requests return or raise `results` in order"""
+    client = HTTPTransport(max_retries=max_retries, retry_backoff=0)
+    calls = []
+
+    def get_once(url, headers, params, timeout):
+        calls.append(url)
+        result = results[len(calls) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(client, '_get_once', get_once)
+    monkeypatch.setattr(transport.time, 'sleep', lambda seconds: None)
+    return client, calls
+
+
+def test_outcomes_count_requests(monkeypatch):
+    client, _ = stub_transport(
+        monkeypatch,
+        Response('https://a.example/', 200, {}, b'ok'),
+        HTTPStatusError('https://a.example/x', 404),
+    )
+    with track_requests() as outcomes:
+        client.get('https://a.example/')
+        with pytest.raises(HTTPStatusError):
+            client.get('https://a.example/x')
+
+    assert (outcomes.successes, outcomes.failures) == (1, 1)
+    assert not outcomes.failed
+    # An HTTP error means the host answered: keep talking to it
+    assert outcomes.dead_hosts == set()
+
+
+def test_unreachable_host_fails_fast(monkeypatch):
+    client, calls = stub_transport(
+        monkeypatch,
+        requests.ConnectionError('refused'),
+        requests.ConnectionError('refused'),
+        max_retries=1,
+    )
+    with track_requests() as outcomes:
+        with pytest.raises(requests.ConnectionError):
+            client.get('https://down.example/feed')
+        with pytest.raises(TransportError):
+            client.get('https://down.example/other')
+
+    # One retry for the first request, nothing for the second
+    assert len(calls) == 2
+    assert outcomes.failed
+    assert outcomes.dead_hosts == {'down.example'}
+
+
+@pytest.fixture
+def aggregator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'config.yaml').write_text(yaml.safe_dump({
+        'settings': {'user_agent': 'test', 'request_delay': 0, 'storage': 'json',
+                     'respect_robots': False, 'breaker_threshold': 1},
+        'sources': [{'name': 'Example', 'type': 'rss', 'url': 'https://example.com/feed.xml'}],
+    }))
+    instance = NewsAggregator('config.yaml')
+    monkeypatch.setattr(cache, '_stores', {})
+    instance.breaker = CircuitBreaker(failure_threshold=1, cooldown=HOUR)
+    return instance
+
+
+def test_open_source_is_skipped_without_requests(aggregator, clock, monkeypatch):
+    aggregator.breaker.record_failure('Example')
+    monkeypatch.setattr(aggregator, '_collect_from_source',
+                        lambda source: pytest.fail('open source was collected'))
+
+    assert aggregator._collect_safely(aggregator.sources[0]) == []
+
+
+def test_half_open_source_is_probed(aggregator, clock, monkeypatch):
+    source = aggregator.sources[0]
+    aggregator.breaker.record_failure('Example')
+    clock.now += HOUR
+
+    probes = []
+    monkeypatch.setattr(HTTPTransport, 'probe', lambda self, url, headers=None: probes.append(url) or False)
+    assert aggregator._source_available(source) is False
+    assert probes == [source['url']]
+    # A failed probe re-opens the circuit with a longer cooldown
+    assert aggregator.breaker.state('Example') == OPEN
+
+    clock.now += 2 * HOUR
+    monkeypatch.setattr(HTTPTransport, 'probe', lambda self, url, headers=None: True)
+    assert aggregator._source_available(source) is True
+
+
+def test_failed_requests_open_circuit(aggregator, clock, monkeypatch):
+    def collect(source):
+        outcomes = current_outcomes()
+        outcomes.failures += 1
+        outcomes.last_error = requests.ConnectionError('refused')
+        return []
+
+    monkeypatch.setattr(aggregator, '_collect_from_source', collect)
+    aggregator._collect_safely(aggregator.sources[0])
+    assert aggregator.breaker.state('Example') == OPEN
@@ -0,0 +1,45 @@
+import pytest
+from bs4 import SoupStrainer
+
+from scrapers import html_scraper
+from scrapers.html_scraper import build_soup, configure_html_parser, get_html_parser
+from scrapers.playwright_scraper import PlaywrightScraper
+
+PAGE = '<html><body><nav><a href="/">Home</a></nav><main><a href="/post">Post</a><p>Text</p></main></body></html>'
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    def select(name):
+        monkeypatch.setattr(html_scraper, '_parser', name)
+    return select
+
+
+def test_unknown_parser_falls_back(parser):
+    parser('lxml')
+    configure_html_parser({'html_parser': 'no-such-parser'})
+    assert get_html_parser() == 'html.parser'
+
+
+@pytest.mark.parametrize('name', ['html.parser', 'lxml'])
+def test_strainer_builds_only_matching_elements(name):
+    soup = build_soup(PAGE, name, SoupStrainer('a'))
+    assert soup.builder.NAME == name
+    assert [a['href'] for a in soup.find_all('a')] == ['/', '/post']
+    assert soup.find('p') is None
+
+
+def test_html5lib_ignores_strainer():
+    pytest.importorskip('html5lib')
+    soup = build_soup(PAGE, 'html5lib', SoupStrainer('a'))
+    assert soup.find('p') is not None
+
+
+def test_rendered_pages_use_configured_parser(parser):
+    class DynamicScraper(PlaywrightScraper):
+        PARSE_ONLY = SoupStrainer('main')
+
+    parser('html.parser')
+    soup = DynamicScraper(source_name='Example', url='https://example.com', user_agent='test').make_soup(PAGE)
+    assert soup.builder.NAME == 'html.parser'
+    assert [a['href'] for a in soup.find_all('a')] == ['/post']
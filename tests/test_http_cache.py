@@ -0,0 +1,173 @@
+import asyncio
+
+import pytest
+
+from scrapers import cache, http_cache
+from scrapers.http_cache import (
+    ConditionalCache, aconditional_get, conditional_get, get_conditional_cache, prune_http_cache
+)
+from scrapers.transport import Response
+
+URL = 'https://example.com/feed.xml'
+
+
+class StubTransport:
+    """Answers with queued responses and records the request headers"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, params=None):
+        self.requests.append({'url': url, 'headers': dict(headers or {}), 'params': params})
+        return self.responses.pop(0)
+
+    async def aget(self, url, headers=None, params=None):
+        return self.get(url, headers, params)
+
+
+def ok(body=b'<rss/>', etag='"v1"', last_modified=None):
+    headers = {}
+    if etag:
+        headers['ETag'] = etag
+    if last_modified:
+        headers['Last-Modified'] = last_modified
+    return Response(URL, 200, headers, body)
+
+
+def not_modified():
+    return Response(URL, 304, {}, b'')
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, '_cache_dir', tmp_path / '.cache')
+    monkeypatch.setattr(cache, '_stores', {})
+    monkeypatch.setattr(http_cache, '_http_cache_enabled', True)
+    monkeypatch.setattr(http_cache, '_http_cache_days', 30)
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    def install(*responses):
+        stub = StubTransport(*responses)
+        monkeypatch.setattr(http_cache, 'get_transport', lambda: stub)
+        return stub
+    return install
+
+
+def parse(response):
+    parse.calls += 1
+    return [{'body': response.content.decode()}]
+
+
+@pytest.fixture(autouse=True)
+def reset_parse():
+    parse.calls = 0
+
+
+def test_not_modified_reuses_parsed_result(transport):
+    stub = transport(ok(etag='"v1"', last_modified='Wed, 01 Oct 2025 00:00:00 GMT'), not_modified())
+    first = conditional_get(URL, {'User-Agent': 'test'}, parse)
+    second = conditional_get(URL, {'User-Agent': 'test'}, parse)
+
+    assert first == second == [{'body': '<rss/>'}]
+    assert parse.calls == 1
+    assert 'If-None-Match' not in stub.requests[0]['headers']
+    assert stub.requests[1]['headers'] == {
+        'User-Agent': 'test',
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Wed, 01 Oct 2025 00:00:00 GMT',
+    }
+
+
+def test_changed_response_is_parsed_again(transport):
+    transport(ok(b'<a/>', etag='"v1"'), ok(b'<b/>', etag='"v2"'))
+    conditional_get(URL, {}, parse)
+    assert conditional_get(URL, {}, parse) == [{'body': '<b/>'}]
+    assert parse.calls == 2
+
+
+def test_responses_without_validators_are_not_stored(transport):
+    stub = transport(ok(etag='"v1"'), ok(etag=None), ok(etag=None))
+    conditional_get(URL, {}, parse)
+    conditional_get(URL, {}, parse)
+    conditional_get(URL, {}, parse)
+    assert 'If-None-Match' not in stub.requests[2]['headers']
+
+
+def test_not_modified_without_stored_result_is_an_error(transport):
+    transport(not_modified())
+    with pytest.raises(ValueError):
+        conditional_get(URL, {}, parse)
+
+
+def test_scope_separates_entries(transport):
+    stub = transport(ok(), ok())
+    conditional_get(URL, {}, parse, scope='RSScraper@1')
+    conditional_get(URL, {}, parse, scope='RSScraper@2')
+    assert 'If-None-Match' not in stub.requests[1]['headers']
+
+
+def test_volatile_params_are_sent_but_not_keyed(transport):
+    stub = transport(ok(), not_modified())
+    conditional_get(URL, {}, parse, params={'lang': 'en', 'schExpsYmd': '2025-10-01'}, volatile_params=('schExpsYmd',))
+    result = conditional_get(URL, {}, parse, params={'lang': 'en', 'schExpsYmd': '2025-10-02'},
+                             volatile_params=('schExpsYmd',))
+    assert result == [{'body': '<rss/>'}]
+    assert stub.requests[1]['params']['schExpsYmd'] == '2025-10-02'
+    assert ConditionalCache.key(URL, {'lang': 'en', 'schExpsYmd': 'x'}, 'S', ('schExpsYmd',)) == f'S:{URL}?lang=en'
+
+
+def test_async_conditional_get(transport):
+    stub = transport(ok(), not_modified())
+
+    async def aparse(response):
+        return parse(response)
+
+    async def fetch_twice():
+        return [await aconditional_get(URL, {}, aparse) for _ in range(2)]
+
+    first, second = asyncio.run(fetch_twice())
+    assert first == second and parse.calls == 1
+    assert stub.requests[1]['headers']['If-None-Match'] == '"v1"'
+
+
+def test_disabled_cache_sends_no_validators(transport, monkeypatch):
+    monkeypatch.setattr(http_cache, '_http_cache_enabled', False)
+    stub = transport(ok(), ok())
+    conditional_get(URL, {}, parse)
+    conditional_get(URL, {}, parse)
+    assert parse.calls == 2 and stub.requests[1]['headers'] == {}
+
+
+def test_prune_drops_unused_entries(transport, monkeypatch):
+    transport(ok(), not_modified())
+    conditional_get(URL, {}, parse)
+    store = get_conditional_cache().store
+    store.set('legacy', {'etag': '"old"', 'result': []})
+
+    today = http_cache._today()
+    monkeypatch.setattr(http_cache, '_today', lambda: today + 31)
+    prune_http_cache()
+    # Used 31 days ago: dropped; never stamped: kept and stamped now
+    assert store.get(f'{URL}') is None
+    assert store.get('legacy')['used'] == today + 31
+
+    # A hit refreshes the entry's last use
+    transport(ok(), not_modified())
+    conditional_get(URL, {}, parse)
+    conditional_get(URL, {}, parse)
+    monkeypatch.setattr(http_cache, '_today', lambda: today + 61)
+    assert get_conditional_cache().prune(30) == 0
+    monkeypatch.setattr(http_cache, '_today', lambda: today + 62)
+    assert get_conditional_cache().prune(30) == 2
+
+
+def test_prune_disabled_with_zero_days(transport, monkeypatch):
+    transport(ok())
+    conditional_get(URL, {}, parse)
+    monkeypatch.setattr(http_cache, '_http_cache_days', 0)
+    monkeypatch.setattr(http_cache, '_today', lambda: 10 ** 6)
+    prune_http_cache()
+    assert get_conditional_cache().store.get(URL) is not None
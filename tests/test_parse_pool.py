@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+
+from scrapers import parse_pool
+from scrapers.deadline import DeadlineExceeded, deadline
+from scrapers.parse_pool import arun_parse, configure_parse_pool, get_parse_pool, run_parse, shutdown_parse_pool
+
+
+class SlowParser:
+    """Picklable stand-in for a scraper"""
+    source_name = 'Example'
+
+    def parse_content(self, seconds):
+        time.sleep(seconds)
+        return [{'slept': seconds}]
+
+
+@pytest.fixture
+def workers():
+    configure_parse_pool({'parse_workers': 1})
+    yield
+    configure_parse_pool({'parse_workers': 0})
+
+
+def test_inline_without_workers():
+    configure_parse_pool({'parse_workers': 0})
+    assert get_parse_pool() is None
+    assert run_parse(SlowParser(), 'parse_content', 0) == [{'slept': 0}]
+    assert asyncio.run(arun_parse(SlowParser(), 'parse_content', 0)) == [{'slept': 0}]
+
+
+def test_parse_in_worker(workers):
+    assert run_parse(SlowParser(), 'parse_content', 0) == [{'slept': 0}]
+
+
+def test_parse_deadline(workers):
+    run_parse(SlowParser(), 'parse_content', 0)  # start the worker outside the deadline
+    with deadline(0.2), pytest.raises(DeadlineExceeded):
+        run_parse(SlowParser(), 'parse_content', 30)
+
+
+def test_async_parse_deadline(workers):
+    run_parse(SlowParser(), 'parse_content', 0)
+
+    async def parse():
+        with deadline(0.2):
+            return await arun_parse(SlowParser(), 'parse_content', 30)
+
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(parse())
+
+
+def test_shutdown_stops_busy_workers(workers):
+    run_parse(SlowParser(), 'parse_content', 0)
+    processes = list(get_parse_pool()._processes.values())
+    with deadline(0.2), pytest.raises(DeadlineExceeded):
+        run_parse(SlowParser(), 'parse_content', 30)
+
+    started = time.monotonic()
+    shutdown_parse_pool()
+    assert time.monotonic() - started < 10
+    assert processes and not any(process.is_alive() for process in processes)
+    assert parse_pool._pool is None
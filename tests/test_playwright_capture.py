@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from scrapers import playwright_scraper
+from scrapers.playwright_scraper import PlaywrightScraper
+
+PAGE_URL = 'https://example.com/news'
+
+
+class Request:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class Route:
+    def __init__(self, request):
+        self.request = request
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = 'abort'
+
+    async def fallback(self):
+        self.outcome = 'fallback'
+
+
+class Response:
+    def __init__(self, url, body):
+        self.url = url
+        self.body = body
+
+    async def json(self):
+        if isinstance(self.body, Exception):
+            raise self.body
+        return self.body
+
+
+class StubPage:
+    """Page whose navigation replays a fixed list of (url, resource type, JSON body) responses"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.routes = []
+        self.listeners = []
+
+    async def route(self, pattern, handler):
+        self.routes.append(handler)
+
+    def on(self, event, callback):
+        assert event == 'response'
+        self.listeners.append(callback)
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        for response_url, resource_type, body in self.responses:
+            route = Route(Request(response_url, resource_type))
+            for handler in self.routes:
+                await handler(route)
+            if route.outcome == 'abort':
+                continue
+            for callback in self.listeners:
+                callback(Response(response_url, body))
+            await asyncio.sleep(0)
+
+
+class StubPool:
+    def __init__(self, page):
+        self.page = page
+
+    def run(self, user_agent, job):
+        return asyncio.run(job(self.page))
+
+    async def arun(self, user_agent, job):
+        return await job(self.page)
+
+
+class StubLimiter:
+    def acquire(self, url):
+        pass
+
+    async def aacquire(self, url):
+        pass
+
+
+class NewsScraper(PlaywrightScraper):
+    CAPTURE_PATTERNS = [r'/api/posts\?', r'/api/tags$']
+
+
+RESPONSES = [
+    ('https://example.com/static/site.css', 'stylesheet', None),
+    ('https://example.com/api/posts?page=1', 'fetch', {'posts': [{'title': 'First'}]}),
+    ('https://example.com/api/posts?page=2', 'fetch', {'posts': [{'title': 'Ignored'}]}),
+    ('https://example.com/api/tags', 'xhr', ['ai']),
+]
+
+
+@pytest.fixture
+def page(monkeypatch):
+    def install(responses):
+        page = StubPage(responses)
+        monkeypatch.setattr(playwright_scraper, 'PLAYWRIGHT_AVAILABLE', True)
+        monkeypatch.setattr(playwright_scraper, 'get_browser_pool', lambda: StubPool(page))
+        monkeypatch.setattr(playwright_scraper, 'get_rate_limiter', lambda: StubLimiter())
+        return page
+    return install
+
+
+@pytest.fixture
+def scraper():
+    return NewsScraper(source_name='Example', url=PAGE_URL, user_agent='test', delay=0)
+
+
+def test_fetch_captured_returns_first_matching_json(page, scraper):
+    page(RESPONSES)
+    assert scraper.fetch_captured() == {
+        r'/api/posts\?': {'posts': [{'title': 'First'}]},
+        r'/api/tags$': ['ai'],
+    }
+
+
+def test_afetch_captured_matches_fetch_captured(page, scraper):
+    page(RESPONSES)
+    assert asyncio.run(scraper.afetch_captured()) == scraper.fetch_captured()
+
+
+def test_stylesheets_are_aborted(page, scraper):
+    seen = []
+    stub = page(RESPONSES)
+    stub.on('response', lambda response: seen.append(response.url))
+    scraper.fetch_captured()
+    assert 'https://example.com/static/site.css' not in seen
+    assert len(seen) == 3
+
+
+def test_missing_and_invalid_responses_are_none(page, scraper):
+    page([('https://example.com/api/posts?page=1', 'fetch', ValueError('not JSON'))])
+    assert scraper.fetch_captured(wait_timeout=50) == {r'/api/posts\?': None, r'/api/tags$': None}
+
+
+def test_without_playwright(monkeypatch, scraper):
+    monkeypatch.setattr(playwright_scraper, 'PLAYWRIGHT_AVAILABLE', False)
+    assert scraper.fetch_captured() == {}
+
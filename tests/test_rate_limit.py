@@ -0,0 +1,185 @@
+import asyncio
+
+import pytest
+
+from scrapers import cache, rate_limit, transport
+from scrapers.deadline import DeadlineExceeded, deadline
+from scrapers.rate_limit import HostRateLimiter, TokenBucket, configure_rate_limiter
+
+ROBOTS = "User-agent: *\nCrawl-delay: 5\nDisallow: /private\n"
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping only advances the clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RobotsResponse:
+    def __init__(self, status_code, text=''):
+        self.status_code = status_code
+        self.text = text
+
+
+class RobotsSession:
+    """Serves robots.txt per host and counts the lookups"""
+
+    def __init__(self, robots):
+        self.robots = robots
+        self.fetched = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.fetched.append(url)
+        host = url.split('/')[2]
+        if host not in self.robots:
+            return RobotsResponse(404)
+        return RobotsResponse(200, self.robots[host])
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, '_cache_dir', tmp_path / '.cache')
+    monkeypatch.setattr(cache, '_stores', {})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def robots(monkeypatch):
+    def install(**by_host):
+        session = RobotsSession({host.replace('_', '.'): text for host, text in by_host.items()})
+        stub = type('StubTransport', (), {'session': session})()
+        monkeypatch.setattr(transport, 'get_transport', lambda: stub)
+        return session
+    return install
+
+
+def test_bucket_allows_burst_then_spaces_requests(clock):
+    bucket = TokenBucket(interval=2.0, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(2.0)
+    assert bucket.reserve() == pytest.approx(4.0)
+
+    clock.now += 10
+    assert bucket.reserve() == 0.0
+
+
+def test_hosts_do_not_wait_on_each_other(clock, robots):
+    robots()
+    limiter = HostRateLimiter(default_interval=3.0)
+
+    limiter.acquire('https://a.example/1')
+    limiter.acquire('https://b.example/1')
+    assert clock.sleeps == []
+
+    limiter.acquire('https://a.example/2')
+    assert clock.sleeps == [pytest.approx(3.0)]
+
+
+def test_crawl_delay_from_robots_is_honoured(clock, robots):
+    session = robots(slow_example=ROBOTS)
+    limiter = HostRateLimiter(default_interval=1.0, default_burst=4)
+
+    for _ in range(3):
+        limiter.acquire('https://slow.example/page')
+
+    # Crawl-delay raises the interval and drops the burst to one request
+    assert clock.sleeps == [pytest.approx(5.0), pytest.approx(5.0)]
+    assert session.fetched == ['https://slow.example/robots.txt']
+
+
+def test_crawl_delay_never_shortens_request_delay(clock, robots):
+    robots(slow_example="User-agent: *\nCrawl-delay: 1\n")
+    limiter = HostRateLimiter(default_interval=4.0)
+
+    limiter.acquire('https://slow.example/a')
+    limiter.acquire('https://slow.example/b')
+    assert clock.sleeps == [pytest.approx(4.0)]
+
+
+def test_missing_robots_falls_back_to_defaults(clock, robots):
+    robots()
+    limiter = HostRateLimiter(default_interval=2.0, default_burst=2)
+
+    for _ in range(3):
+        limiter.acquire('https://plain.example/')
+    assert clock.sleeps == [pytest.approx(2.0)]
+
+
+def test_respect_robots_off_skips_lookup(clock, robots):
+    session = robots(slow_example=ROBOTS)
+    limiter = HostRateLimiter(default_interval=1.0, respect_robots=False)
+
+    limiter.acquire('https://slow.example/a')
+    limiter.acquire('https://slow.example/b')
+    assert clock.sleeps == [pytest.approx(1.0)]
+    assert session.fetched == []
+
+
+def test_crawl_delay_is_cached_between_runs(clock, robots):
+    session = robots(slow_example=ROBOTS)
+    HostRateLimiter().acquire('https://slow.example/')
+    HostRateLimiter().acquire('https://slow.example/')
+    assert len(session.fetched) == 1
+
+    clock.now += rate_limit.ROBOTS_TTL + 1
+    HostRateLimiter().acquire('https://slow.example/')
+    assert len(session.fetched) == 2
+
+
+def test_source_overrides_win_over_robots(clock, robots):
+    robots(slow_example=ROBOTS)
+    limiter = configure_rate_limiter(
+        {'request_delay': 1.0},
+        [{'name': 'Slow', 'url': 'https://slow.example/news', 'crawl_delay': 0.5, 'burst': 2}],
+    )
+
+    for _ in range(3):
+        limiter.acquire('https://slow.example/news')
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_wait_beyond_deadline_raises(clock, robots):
+    robots()
+    limiter = HostRateLimiter(default_interval=60.0)
+    limiter.acquire('https://a.example/')
+
+    with deadline(10):
+        with pytest.raises(DeadlineExceeded):
+            limiter.acquire('https://a.example/')
+    assert clock.sleeps == []
+
+
+def test_async_acquire_uses_same_schedule(clock, robots, monkeypatch):
+    robots(slow_example=ROBOTS)
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(rate_limit.asyncio, 'sleep', fake_sleep)
+    limiter = HostRateLimiter(default_interval=1.0)
+
+    async def run():
+        await limiter.aacquire('https://slow.example/a')
+        await limiter.aacquire('https://slow.example/b')
+
+    asyncio.run(run())
+    assert waits == [pytest.approx(5.0)]
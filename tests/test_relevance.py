@@ -0,0 +1,38 @@
+from scrapers.microsoft_ai_news_scraper import MicrosoftAINewsScraper
+from scrapers.relevance import RelevanceClassifier, classifier_from_rules
+
+
+def article(title, categories=()):
+    return {'title': title, 'summary': '', 'categories': list(categories)}
+
+
+def test_list_keywords_weigh_one():
+    classifier = RelevanceClassifier(['AI', 'robotics'], threshold=2)
+    assert classifier.score(article('AI and robotics, more AI')) == 2.0
+    assert not classifier.is_relevant(article('Robotics week'))
+
+
+def test_whole_words_only():
+    classifier = classifier_from_rules({'keywords': ['ai']})
+    assert not classifier.is_relevant(article('Said the chair'))
+    assert classifier.is_relevant(article('The AI roadmap'))
+
+
+def test_config_keywords_add_to_builtin_keywords():
+    builtin = MicrosoftAINewsScraper.relevance
+    classifier = builtin.with_rules({'keywords': {'quantum': 1, 'gpt': 0.5}})
+
+    assert classifier.is_relevant(article('New quantum chip'))
+    # Built-in keywords and categories are kept
+    assert classifier.is_relevant(article('Copilot comes to Word'))
+    assert classifier.is_relevant(article('Quarterly update', ['AI']))
+    assert classifier.weights['gpt'] == 0.5
+    assert set(builtin.weights) < set(classifier.weights)
+
+
+def test_list_keywords_and_threshold_override():
+    classifier = MicrosoftAINewsScraper.relevance.with_rules({'keywords': ['quantum'], 'threshold': 2})
+    assert classifier.weights['quantum'] == 1.0
+    assert classifier.threshold == 2
+    assert not classifier.is_relevant(article('Copilot comes to Word'))
+    assert classifier.is_relevant(article('Copilot gets quantum'))
@@ -0,0 +1,122 @@
+import pytest
+import yaml
+
+from data_manager import DataManager
+from scrapers import cache, seen_index
+from main import NewsAggregator
+from scrapers.base import BaseScraper
+from scrapers.seen_index import SeenIndex, load_seen_index, record_published
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, '_cache_dir', tmp_path / '.cache')
+    monkeypatch.setattr(cache, '_stores', {})
+    monkeypatch.setattr(seen_index, '_enabled', True)
+    return tmp_path / '.cache'
+
+
+class ListScraper(BaseScraper):
+    def fetch(self):
+        return []
+
+
+def scraper(seen=None, streak=5):
+    instance = ListScraper('Example', 'https://example.com', 'test', 0)
+    instance.seen = seen
+    instance.KNOWN_STREAK = streak
+    return instance
+
+
+def urls(*numbers):
+    return [f'https://example.com/{n}' for n in numbers]
+
+
+def test_encode_round_trip():
+    index = SeenIndex()
+    index.add(urls(1, 2, 3) + [''])
+    decoded = SeenIndex.decode(index.encode())
+    assert len(decoded) == 3
+    assert urls(2)[0] in decoded
+    assert urls(4)[0] not in decoded
+    assert len(SeenIndex.decode('')) == 0
+
+
+def test_record_and_load(cache_dir):
+    record_published([
+        {'source': 'Example', 'url': urls(1)[0]},
+        {'source': 'Other', 'url': urls(2)[0]},
+    ])
+    assert urls(1)[0] in load_seen_index('Example')
+    assert urls(2)[0] not in load_seen_index('Example')
+    assert len(load_seen_index('Missing')) == 0
+
+
+def test_disabled_index(cache_dir, monkeypatch):
+    monkeypatch.setattr(seen_index, '_enabled', False)
+    record_published([{'source': 'Example', 'url': urls(1)[0]}])
+    assert load_seen_index('Example') is None
+
+
+def test_without_index_every_item_is_new():
+    assert list(scraper().new_items(urls(1, 2, 3), str)) == urls(1, 2, 3)
+
+
+def test_known_items_are_skipped():
+    index = SeenIndex()
+    index.add(urls(2, 4))
+    assert list(scraper(index).new_items(urls(1, 2, 3, 4, 5), str)) == urls(1, 3, 5)
+
+
+def test_known_streak_ends_the_listing():
+    index = SeenIndex()
+    index.add(urls(3, 4, 5, 7, 8))
+    # 3, 4 are a streak of two; 7, 8 after 6 reach the limit of two
+    assert list(scraper(index, streak=3).new_items(urls(1, 2, 3, 4, 6, 7, 8, 9), str)) == urls(1, 2, 6, 9)
+    assert list(scraper(index, streak=2).new_items(urls(1, 2, 3, 4, 6), str)) == urls(1, 2)
+
+
+def test_no_streak_limit_reads_everything():
+    index = SeenIndex()
+    index.add(urls(1, 2, 3))
+    assert list(scraper(index, streak=None).new_items(urls(1, 2, 3, 4), str)) == urls(4)
+
+
+def test_sources_with_articles(tmp_path):
+    manager = DataManager(str(tmp_path), storage='json')
+    (manager.sources_dir / 'example-blog.json').write_text('{"articles": []}')
+    assert manager.sources_with_articles(['Example Blog', 'Other']) == {'Example Blog'}
+    assert manager.has_source_articles('Example Blog')
+
+
+def test_aggregator_resolves_incremental_sources_once(tmp_path, monkeypatch, caplog):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'config.yaml').write_text(yaml.safe_dump({
+        'settings': {'user_agent': 'test', 'request_delay': 0, 'storage': 'json'},
+        'sources': [
+            {'name': 'Published', 'type': 'rss', 'url': 'https://example.com/a.xml'},
+            {'name': 'New', 'type': 'rss', 'url': 'https://example.com/b.xml'},
+            {'name': 'Off', 'type': 'rss', 'url': 'https://example.com/c.xml', 'enabled': False},
+        ],
+    }))
+    aggregator = NewsAggregator('config.yaml')
+    DataManager().write_json(DataManager().sources_dir / 'published.json', {'articles': []})
+
+    lookups = []
+    original = DataManager.sources_with_articles
+    monkeypatch.setattr(DataManager, 'sources_with_articles',
+                        lambda self, sources: lookups.append(1) or original(self, sources))
+    seen = {}
+
+    def collect(source, run_deadline=None):
+        seen[source['name']] = aggregator._build_scraper(source).seen
+        return []
+
+    monkeypatch.setattr(aggregator, '_collect_safely', collect)
+
+    with caplog.at_level('INFO', logger='main'):
+        aggregator.collect_all()
+    assert aggregator.incremental_sources == {'Published'}
+    assert seen['Published'] is not None and seen['New'] is None
+    assert len(lookups) == 1
+    assert caplog.text.count('Skipping disabled source: Off') == 1
@@ -0,0 +1,127 @@
+import json
+
+import pytest
+
+from scrapers.anthropic_scraper import AnthropicScraper
+from scrapers.html_scraper import HTMLScraper
+from scrapers.structured import extract_structured
+
+BASE_URL = 'https://example.com/blog/'
+
+
+def script(attrs, data):
+    return f'<script {attrs}>{json.dumps(data)}</script>'.encode()
+
+
+def page(*blobs):
+    return b'<html><head>' + b''.join(blobs) + b'</head><body><p>Listing</p></body></html>'
+
+
+def test_json_ld_item_list():
+    content = page(script('type="application/ld+json"', {
+        '@context': 'https://schema.org',
+        '@type': 'ItemList',
+        'itemListElement': [
+            {'@type': 'ListItem', 'position': 1, 'url': '/blog/one', 'name': 'First post'},
+            {'@type': 'ListItem', 'position': 2, 'item': {
+                '@type': 'BlogPosting', 'headline': 'Second post', 'url': 'https://example.com/blog/two',
+                'datePublished': '2025-10-01', 'author': [{'name': 'Kim'}, {'name': 'Lee'}],
+                'articleSection': 'Research, AI', 'description': 'About two',
+            }},
+        ],
+    }))
+    assert extract_structured(content, BASE_URL) == [
+        {'title': 'First post', 'url': 'https://example.com/blog/one', 'date': '',
+         'summary': '', 'author': '', 'categories': []},
+        {'title': 'Second post', 'url': 'https://example.com/blog/two', 'date': '2025-10-01',
+         'summary': 'About two', 'author': 'Kim, Lee', 'categories': ['Research', 'AI']},
+    ]
+
+
+def test_next_data_with_slugs():
+    content = page(script('id="__NEXT_DATA__" type="application/json"', {'props': {'pageProps': {
+        'posts': [
+            {'title': 'Post A', 'slug': {'current': 'post-a'}, 'publishedOn': '2025-09-01'},
+            {'title': 'Post B', 'slug': 'post-b', 'publishedOn': '2025-09-02', 'tags': [{'title': 'News'}]},
+            # Not an article: no date
+            {'title': 'Menu', 'slug': 'menu'},
+        ],
+    }}}))
+    articles = extract_structured(content, BASE_URL, 'https://example.com/blog/{slug}')
+    assert [(a['title'], a['url'], a['date']) for a in articles] == [
+        ('Post A', 'https://example.com/blog/post-a', '2025-09-01'),
+        ('Post B', 'https://example.com/blog/post-b', '2025-09-02'),
+    ]
+    assert articles[1]['categories'] == ['News']
+
+
+def test_nuxt_payload_is_revived():
+    payload = [
+        {'posts': 1}, ['Reactive', 2], [3, 4],
+        {'title': 5, 'path': 6, 'date': 7}, {'title': 8, 'path': 9, 'date': 10},
+        'A', '/blog/a', '2025-01-01', 'B', '/blog/b', '2025-01-02',
+    ]
+    content = page(script('id="__NUXT_DATA__" type="application/json"', payload))
+    assert [(a['title'], a['url']) for a in extract_structured(content, BASE_URL)] == [
+        ('A', 'https://example.com/blog/a'), ('B', 'https://example.com/blog/b'),
+    ]
+
+
+def test_opengraph_article_page():
+    content = (
+        b'<html><head><meta property="og:type" content="article">'
+        b'<meta property="og:title" content="Launch">'
+        b'<meta property="og:url" content="https://example.com/blog/launch">'
+        b'<meta property="article:published_time" content="2025-10-02T09:00:00Z"></head></html>'
+    )
+    (article,) = extract_structured(content, BASE_URL)
+    assert (article['title'], article['date']) == ('Launch', '2025-10-02T09:00:00Z')
+
+
+def test_duplicates_and_broken_blobs():
+    content = page(
+        b'<script type="application/ld+json">{not json</script>',
+        script('type="application/ld+json"', {'@type': 'BlogPosting', 'headline': 'One', 'url': '/blog/one'}),
+        script('type="application/ld+json"', {'@type': 'NewsArticle', 'headline': 'One', 'url': 'one'}),
+    )
+    assert [a['url'] for a in extract_structured(content, BASE_URL)] == ['https://example.com/blog/one']
+    assert extract_structured(b'<html><body>plain</body></html>', BASE_URL) == []
+
+
+def listing(count, title='Anthropic announcement {i}'):
+    return page(script('id="__NEXT_DATA__" type="application/json"', {'props': {'posts': [
+        {'title': title.format(i=i), 'slug': f'post-{i}', 'publishedOn': '2025-10-01'} for i in range(count)
+    ]}}))
+
+
+class ListingScraper(HTMLScraper):
+    def parse(self, soup):
+        return [self.normalize_article({'title': 'From the DOM', 'url': 'https://example.com/dom'})]
+
+
+def make(cls):
+    return cls(source_name='Example', url='https://www.anthropic.com/news', user_agent='test', delay=0)
+
+
+def test_structured_data_is_opt_in():
+    assert not HTMLScraper.STRUCTURED
+    assert [a['title'] for a in make(ListingScraper).parse_content(listing(5))] == ['From the DOM']
+
+
+def test_structured_articles_keep_scraper_caps():
+    scraper = make(AnthropicScraper)
+    articles = scraper.parse_content(listing(40))
+    assert len(articles) == AnthropicScraper.MAX_ARTICLES == 30
+    assert articles[0]['url'] == 'https://www.anthropic.com/news/post-0'
+    assert articles[0]['date'] == '2025-10-01'
+
+
+def test_structured_articles_keep_title_filter():
+    content = listing(5, title='Short {i}')
+    assert make(AnthropicScraper).parse_structured(content) == []
+
+
+@pytest.mark.parametrize('count', [0, 2])
+def test_too_few_structured_articles_parse_the_dom(count):
+    scraper = make(AnthropicScraper)
+    assert scraper.parse_structured(listing(count)) == []